@@ -0,0 +1,269 @@
+"""
+图算法基准测试
+
+比较 Graph（字典 + 元组邻接表）与 CSRGraph 在随机稀疏图上的内存占用与遍历 / 最短路径耗时，
+网格图（近似路网）上各点对点最短路径算法的耗时，以及加载、连通分量与最小生成树的耗时
+
+用法:
+    python benchmarks/graph_benchmark.py [--nodes N] [--edges M] [--grid SIDE]
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import argparse
+import time
+import tracemalloc
+import numpy as np
+import os
+import tempfile
+from src.algorithms.graph import (
+    Graph, CSRGraph, astar, bidirectional_dijkstra, multi_source_dijkstra, shortest_path,
+    save_binary_edges, load_binary_edges, load_csv_edges, save_graph, load_graph,
+    connected_components, strongly_connected_components, kruskal, prim,
+)
+
+
+def random_edges(nodes, edges, seed=42):
+    """生成随机边数组"""
+    rng = np.random.default_rng(seed)
+    src = rng.integers(0, nodes, size=edges)
+    dst = rng.integers(0, nodes, size=edges)
+    weights = rng.random(edges) + 0.1
+    return src, dst, weights
+
+
+def build_graph(src, dst, weights):
+    """逐条 add_edge 构建 Graph，返回图与占用内存（字节）"""
+    tracemalloc.start()
+    graph = Graph()
+    for u, v, w in zip(src.tolist(), dst.tolist(), weights.tolist()):
+        graph.add_edge(u, v, w)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return graph, memory
+
+
+def timed(func, *args):
+    """返回函数调用耗时（秒）"""
+    start_time = time.time()
+    func(*args)
+    return time.time() - start_time
+
+
+def run_benchmark(nodes, edges):
+    """运行图表示对比测试"""
+    print(f"\n{'='*60}")
+    print(f"图表示基准测试 (节点数: {nodes:,}, 边数: {edges:,})")
+    print(f"{'='*60}")
+
+    src, dst, weights = random_edges(nodes, edges)
+
+    start_time = time.time()
+    graph, graph_memory = build_graph(src, dst, weights)
+    graph_build = time.time() - start_time
+
+    start_time = time.time()
+    csr = CSRGraph.from_edges(src, dst, weights, num_nodes=nodes)
+    csr_build = time.time() - start_time
+
+    print(f"{'':12} {'Graph':>14} {'CSRGraph':>14} {'比值':>8}")
+    print(f"{'构建(秒)':12} {graph_build:14.3f} {csr_build:14.3f} {graph_build / csr_build:8.1f}x")
+    print(f"{'内存(MiB)':12} {graph_memory / 2**20:14.1f} {csr.nbytes / 2**20:14.1f} "
+          f"{graph_memory / csr.nbytes:8.1f}x")
+    print(f"{'字节/边':12} {graph_memory / edges:14.1f} {csr.nbytes / edges:14.1f}")
+
+    start = int(src[0])
+    for name in ("bfs", "dfs", "dijkstra"):
+        csr_time = timed(getattr(csr, name), start)
+        graph_time = timed(getattr(graph, name), start)
+        print(f"{name + '(秒)':12} {graph_time:14.3f} {csr_time:14.3f} "
+              f"{graph_time / csr_time:8.1f}x")
+
+
+def grid_edges(side, seed=42):
+    """side x side 网格图，边权在 [1, 2) 之间"""
+    rng = np.random.default_rng(seed)
+    ids = np.arange(side * side).reshape(side, side)
+    src = np.concatenate([ids[:, :-1].ravel(), ids[:-1, :].ravel()])
+    dst = np.concatenate([ids[:, 1:].ravel(), ids[1:, :].ravel()])
+    return src, dst, rng.random(len(src)) + 1.0
+
+
+def run_point_to_point_benchmark(side, queries=20):
+    """比较整图 Dijkstra 与各点对点算法在网格图上的平均单次查询耗时"""
+    print(f"\n{'='*60}")
+    print(f"点对点最短路径基准测试 (网格: {side}x{side}, 查询次数: {queries})")
+    print(f"{'='*60}")
+
+    csr = CSRGraph.from_edges(*grid_edges(side))
+    rng = np.random.default_rng(0)
+    pairs = rng.integers(0, side * side, size=(queries, 2)).tolist()
+
+    def manhattan(node, target):
+        # 边权不小于 1，曼哈顿距离是可采纳的下界
+        return abs(node // side - target // side) + abs(node % side - target % side)
+
+    algorithms = [
+        ("整图 dijkstra", lambda s, t: csr.dijkstra(s)[t]),
+        ("shortest_path", lambda s, t: shortest_path(csr, s, t)),
+        ("astar", lambda s, t: astar(csr, s, t, manhattan)),
+        ("bidirectional", lambda s, t: bidirectional_dijkstra(csr, s, t)),
+    ]
+    # 近距离查询：终点在起点附近，提前终止的收益最大
+    near = [(s, min(side * side - 1, s + 5 * side + 5)) for s, _ in pairs]
+    print(f"{'算法':16} {'随机点对(毫秒)':>16} {'近距离点对(毫秒)':>18}")
+    for name, func in algorithms:
+        times = []
+        for workload in (pairs, near):
+            start_time = time.time()
+            for s, t in workload:
+                func(s, t)
+            times.append((time.time() - start_time) / len(workload) * 1e3)
+        print(f"{name:16} {times[0]:16.2f} {times[1]:18.2f}")
+
+
+def run_multi_source_benchmark(side, sources=64):
+    """比较逐个调用 Graph.dijkstra 与 multi_source_dijkstra 计算距离矩阵的耗时"""
+    print(f"\n{'='*60}")
+    print(f"多源最短路径基准测试 (网格: {side}x{side}, 起点数: {sources}, CPU: {os.cpu_count()})")
+    print(f"{'='*60}")
+
+    src, dst, weights = grid_edges(side)
+    graph = Graph()
+    for u, v, w in zip(src.tolist(), dst.tolist(), weights.tolist()):
+        graph.add_edge(u, v, w)
+    csr = CSRGraph.from_edges(src, dst, weights)
+    starts = np.linspace(0, side * side - 1, sources).astype(np.int64).tolist()
+
+    loop_time = timed(lambda: [graph.dijkstra(s) for s in starts])
+    print(f"{'Graph.dijkstra 循环':28} {loop_time:10.3f} 秒")
+    for workers in sorted({1, os.cpu_count() or 1}):
+        elapsed = timed(multi_source_dijkstra, csr, starts, workers)
+        print(f"{f'multi_source (workers={workers})':28} {elapsed:10.3f} 秒")
+    cutoff = 10.0
+    elapsed = timed(lambda: multi_source_dijkstra(csr, starts, 1, max_distance=cutoff))
+    print(f"{f'multi_source (max_distance={cutoff:g})':28} {elapsed:10.3f} 秒")
+
+
+def run_loading_benchmark(nodes, edges):
+    """比较逐条 add_edge、Graph.from_edges 与从二进制 / CSV 边列表文件构建图的耗时"""
+    print(f"\n{'='*60}")
+    print(f"批量加载基准测试 (节点数: {nodes:,}, 边数: {edges:,})")
+    print(f"{'='*60}")
+
+    src, dst, weights = random_edges(nodes, edges)
+
+    def add_edges():
+        graph = Graph()
+        for u, v, w in zip(src.tolist(), dst.tolist(), weights.tolist()):
+            graph.add_edge(u, v, w)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        binary_path = os.path.join(tmp, "edges.bin")
+        csv_path = os.path.join(tmp, "edges.csv")
+        save_binary_edges(binary_path, src, dst, weights)
+        np.savetxt(csv_path, np.column_stack([src, dst, weights]), fmt=["%d", "%d", "%.6f"],
+                   delimiter=",")
+
+        results = [
+            ("逐条 add_edge", timed(add_edges)),
+            ("Graph.from_edges", timed(Graph.from_edges, src, dst, weights)),
+            ("CSRGraph.from_edges", timed(CSRGraph.from_edges, src, dst, weights)),
+            ("load_binary_edges", timed(load_binary_edges, binary_path)),
+            ("load_csv_edges", timed(load_csv_edges, csv_path)),
+        ]
+    for name, elapsed in results:
+        print(f"{name:24} {elapsed:10.3f} 秒")
+
+
+def run_graph_file_benchmark(nodes, edges):
+    """比较从边数组重建、读入图文件与内存映射图文件的耗时"""
+    print(f"\n{'='*60}")
+    print(f"图文件基准测试 (节点数: {nodes:,}, 边数: {edges:,})")
+    print(f"{'='*60}")
+
+    src, dst, weights = random_edges(nodes, edges)
+    csr = CSRGraph.from_edges(src, dst, weights, num_nodes=nodes)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "graph.csr")
+        save_time = timed(save_graph, csr, path)
+        size = os.path.getsize(path)
+        results = [
+            ("save_graph", save_time),
+            ("CSRGraph.from_edges 重建", timed(CSRGraph.from_edges, src, dst, weights)),
+            ("load_graph(mmap=False)", timed(load_graph, path, False)),
+            ("load_graph(mmap=True)", timed(load_graph, path, True)),
+        ]
+        # 映射后的首次遍历需要把数据页读入，之后与内存中的图相同
+        mapped = load_graph(path)
+        results.append(("映射后首次 bfs", timed(mapped.bfs, int(src[0]))))
+        results.append(("内存中 bfs", timed(csr.bfs, int(src[0]))))
+    print(f"文件大小: {size / 2**20:.1f} MiB")
+    for name, elapsed in results:
+        print(f"{name:26} {elapsed * 1e3:10.2f} 毫秒")
+
+
+def run_components_benchmark(nodes, edges):
+    """比较从每个未访问节点重复调用 Graph.bfs 与基于并查集 / Tarjan 的分量计算"""
+    print(f"\n{'='*60}")
+    print(f"连通分量基准测试 (节点数: {nodes:,}, 边数: {edges:,})")
+    print(f"{'='*60}")
+
+    # 边数少于节点数时图中有大量小分量，重复 bfs 的开销最明显
+    src, dst, weights = random_edges(nodes, edges)
+    graph = Graph.from_edges(src, dst, weights)
+    csr = CSRGraph.from_edges(src, dst, weights, num_nodes=nodes)
+    directed = CSRGraph.from_edges(src, dst, weights, directed=True, num_nodes=nodes)
+
+    def repeated_bfs():
+        seen = set()
+        components = []
+        for node in graph.graph:
+            if node not in seen:
+                component = graph.bfs(node)
+                seen.update(component)
+                components.append(component)
+        return components
+
+    results = [
+        ("重复 Graph.bfs", timed(repeated_bfs)),
+        ("connected_components", timed(connected_components, csr)),
+        ("strongly_connected (有向)", timed(strongly_connected_components, directed)),
+    ]
+    for name, elapsed in results:
+        print(f"{name:28} {elapsed:10.3f} 秒")
+
+
+def run_mst_benchmark(nodes, degrees=(2, 8, 32, 128, 512, 2048)):
+    """比较 Kruskal 与 Prim 在不同平均度数的随机图上的耗时"""
+    print(f"\n{'='*60}")
+    print(f"最小生成树基准测试 (节点数: {nodes:,})")
+    print(f"{'='*60}")
+    print(f"{'平均度数':>8} {'边数':>12} {'kruskal(秒)':>12} {'prim(秒)':>12} {'较快':>8}")
+    for degree in degrees:
+        edges = nodes * degree // 2
+        csr = CSRGraph.from_edges(*random_edges(nodes, edges), num_nodes=nodes)
+        kruskal_time = timed(kruskal, csr)
+        prim_time = timed(prim, csr)
+        winner = "kruskal" if kruskal_time < prim_time else "prim"
+        print(f"{degree:8} {edges:12,} {kruskal_time:12.3f} {prim_time:12.3f} {winner:>8}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="图表示基准测试")
+    parser.add_argument("--nodes", type=int, default=100_000)
+    parser.add_argument("--edges", type=int, default=1_000_000)
+    parser.add_argument("--grid", type=int, default=300)
+    args = parser.parse_args()
+
+    print("开始图算法基准测试...")
+    run_benchmark(args.nodes, args.edges)
+    run_loading_benchmark(args.nodes, args.edges)
+    run_graph_file_benchmark(args.nodes, args.edges)
+    run_components_benchmark(args.nodes, args.edges // 20)
+    run_mst_benchmark(args.nodes // 10)
+    run_point_to_point_benchmark(args.grid)
+    run_multi_source_benchmark(args.grid // 2)
@@ -0,0 +1,65 @@
+"""
+跳跃搜索基准测试
+
+比较原始跳跃搜索、分块向量化跳跃搜索与其他搜索算法在 1M~100M 元素有序数组上的单次查询耗时
+
+用法:
+    python benchmarks/jump_search_benchmark.py [数组大小 ...] [--queries N]
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import argparse
+import time
+import numpy as np
+from src.algorithms.searching import (
+    binary_search, blocked_jump_search, exponential_search, interpolation_search, jump_search,
+)
+
+# 超过该规模时不再测试基于 Python 列表的跳跃搜索（列表占用内存大且单次查询过慢）
+MAX_LIST_SIZE = 10_000_000
+
+
+def benchmark_search(search_func, arr, targets, name):
+    """基准测试单个搜索函数，返回平均每次查询耗时"""
+    start_time = time.time()
+    for target in targets:
+        search_func(arr, target)
+    elapsed_time = (time.time() - start_time) / len(targets)
+    print(f"{name:24} - 平均耗时: {elapsed_time * 1e6:12.2f} 微秒/次")
+    return elapsed_time
+
+
+def run_benchmark(size, queries):
+    """运行跳跃搜索基准测试"""
+    print(f"\n{'='*60}")
+    print(f"跳跃搜索基准测试 (数组大小: {size:,}, 查询次数: {queries})")
+    print(f"{'='*60}")
+
+    rng = np.random.default_rng(42)
+    arr = np.sort(rng.integers(0, size * 10, size=size))
+    targets = arr[rng.integers(0, size, size=queries)].tolist()
+
+    if size <= MAX_LIST_SIZE:
+        benchmark_search(jump_search, arr.tolist(), targets[:max(1, queries // 10)],
+                         "跳跃搜索 (列表)")
+    benchmark_search(blocked_jump_search, arr, targets, "分块向量化跳跃搜索")
+    benchmark_search(binary_search, arr, targets, "二分搜索")
+    benchmark_search(exponential_search, arr, targets, "指数搜索")
+    benchmark_search(interpolation_search, arr, targets, "插值搜索")
+    benchmark_search(np.searchsorted, arr, targets, "np.searchsorted")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="跳跃搜索基准测试")
+    parser.add_argument("sizes", nargs="*", type=int,
+                        default=[1_000_000, 10_000_000, 100_000_000])
+    parser.add_argument("--queries", type=int, default=1000)
+    args = parser.parse_args()
+
+    print("开始跳跃搜索基准测试...")
+    for size in args.sizes:
+        run_benchmark(size, args.queries)
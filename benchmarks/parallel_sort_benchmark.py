@@ -0,0 +1,57 @@
+"""
+并行排序扩展性基准测试
+
+比较 parallel_sort 在 1..N 个进程下对大数组排序的耗时与加速比
+
+用法:
+    python benchmarks/parallel_sort_benchmark.py [数组大小 ...] [--max-workers N]
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import argparse
+import os
+import time
+import numpy as np
+from src.algorithms.sorting import parallel_sort
+
+
+def benchmark_parallel_sort(arr, workers):
+    """基准测试单个进程数配置"""
+    start_time = time.time()
+    parallel_sort(arr, workers=workers)
+    return time.time() - start_time
+
+
+def run_benchmark(size, max_workers):
+    """运行并行排序扩展性测试"""
+    print(f"\n{'='*50}")
+    print(f"并行排序扩展性测试 (数组大小: {size:,}, CPU 核心: {os.cpu_count()})")
+    print(f"{'='*50}\n")
+
+    np.random.seed(42)
+    arr = np.random.rand(size)
+
+    worker_counts = sorted({1, 2, 4, 8, 16, max_workers} & set(range(1, max_workers + 1)))
+    baseline = None
+    print(f"{'进程数':>6} {'耗时(秒)':>12} {'加速比':>8}")
+    print("-" * 50)
+    for workers in worker_counts:
+        elapsed = benchmark_parallel_sort(arr, workers)
+        if baseline is None:
+            baseline = elapsed
+        print(f"{workers:>6} {elapsed:>12.4f} {baseline / elapsed:>8.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="并行排序扩展性基准测试")
+    parser.add_argument("sizes", nargs="*", type=int, default=[10_000_000, 100_000_000])
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    print("开始并行排序基准测试...")
+    for size in args.sizes:
+        run_benchmark(size, args.max_workers)
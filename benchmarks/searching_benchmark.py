@@ -0,0 +1,126 @@
+"""
+搜索算法性能基准测试
+
+比较二分、跳跃、插值、指数搜索在均匀、偏斜、聚集三种分布上的性能
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import time
+import numpy as np
+from src.algorithms.searching import (
+    binary_search, jump_search, interpolation_search, exponential_search, linear_search,
+    LookupIndex,
+)
+
+
+def make_distributions(size, rng):
+    """生成三种分布的有序数组"""
+    uniform = np.sort(rng.integers(0, size * 100, size=size))
+    skewed = np.sort((rng.random(size) ** 6 * size * 100).astype(np.int64))
+    centers = rng.integers(0, size * 100, size=10)
+    clustered = np.sort(
+        np.concatenate([c + rng.integers(0, 1000, size=size // 10) for c in centers])
+    )
+    return {"均匀分布": uniform, "偏斜分布": skewed, "聚集分布": clustered}
+
+
+class ProbeCountingList(list):
+    """统计元素访问次数的列表，用于比较各算法的探测次数"""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.probes = 0
+
+    def __getitem__(self, index):
+        self.probes += 1
+        return super().__getitem__(index)
+
+
+def benchmark_search_algorithm(search_func, arr, targets, name):
+    """基准测试单个搜索算法，返回平均每次查询耗时"""
+    start_time = time.time()
+    for target in targets:
+        search_func(arr, target)
+    elapsed_time = (time.time() - start_time) / len(targets)
+
+    # 探测次数决定了元素访问代价高（内存映射、远程存储）时的性能
+    counting = ProbeCountingList(arr)
+    for target in targets[:100]:
+        search_func(counting, target)
+    probes = counting.probes / min(len(targets), 100)
+
+    print(f"{name:15} - 平均耗时: {elapsed_time * 1e6:10.2f} 微秒/次, 平均探测: {probes:8.1f} 次")
+    return elapsed_time
+
+
+def run_benchmark(size=100000, queries=2000):
+    """运行搜索算法基准测试"""
+    print(f"\n{'='*50}")
+    print(f"搜索算法性能基准测试 (数组大小: {size}, 查询次数: {queries})")
+    print(f"{'='*50}")
+
+    rng = np.random.default_rng(42)
+    results = {}
+    for dist_name, data in make_distributions(size, rng).items():
+        arr = data.tolist()
+        targets = data[rng.integers(0, len(data), size=queries)].tolist()
+
+        print(f"\n{dist_name}:")
+        print("-" * 50)
+        results[dist_name] = {
+            "binary_search": benchmark_search_algorithm(binary_search, arr, targets, "二分搜索"),
+            "jump_search": benchmark_search_algorithm(jump_search, arr, targets, "跳跃搜索"),
+            "interpolation_search": benchmark_search_algorithm(
+                interpolation_search, arr, targets, "插值搜索"
+            ),
+            "exponential_search": benchmark_search_algorithm(
+                exponential_search, arr, targets, "指数搜索"
+            ),
+        }
+
+    print(f"\n{'='*50}")
+    print("基准测试完成")
+    print(f"{'='*50}\n")
+
+    return results
+
+
+def run_lookup_benchmark(size=100000, queries=200):
+    """比较重复线性搜索与哈希查找索引（含一次性建索引开销）"""
+    print(f"\n{'='*50}")
+    print(f"无序数组重复查询 (数组大小: {size}, 查询次数: {queries})")
+    print(f"{'='*50}")
+
+    rng = np.random.default_rng(42)
+    arr = rng.random(size).tolist()
+    targets = [arr[i] for i in rng.integers(0, size, size=queries // 2)] + \
+        rng.random(queries - queries // 2).tolist()
+
+    start_time = time.time()
+    for target in targets:
+        linear_search(arr, target)
+    linear_time = time.time() - start_time
+
+    start_time = time.time()
+    index = LookupIndex(arr)
+    build_time = time.time() - start_time
+    start_time = time.time()
+    for target in targets:
+        index.index_of(target)
+    lookup_time = time.time() - start_time
+
+    print(f"{'线性搜索':15} - 平均耗时: {linear_time / queries * 1e6:10.2f} 微秒/次")
+    print(f"{'哈希查找索引':15} - 平均耗时: {lookup_time / queries * 1e6:10.2f} 微秒/次"
+          f", 建索引 {build_time * 1e3:.1f} 毫秒")
+
+
+if __name__ == "__main__":
+    print("开始搜索性能基准测试...")
+
+    run_benchmark(size=10000)
+    run_benchmark(size=1000000, queries=500)
+    run_lookup_benchmark()
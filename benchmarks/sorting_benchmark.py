@@ -11,14 +11,17 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import time
 import numpy as np
-from src.algorithms.sorting import quick_sort, merge_sort, bubble_sort
+from src.algorithms.sorting import (
+    quick_sort, merge_sort, bubble_sort, vectorized_sort, counting_sort, radix_sort
+)
 
 
-def benchmark_sorting_algorithm(sort_func, arr, name):
+def benchmark_sorting_algorithm(sort_func, arr, name, as_list=True):
     """基准测试单个排序算法"""
     arr_copy = arr.copy()
+    data = arr_copy.tolist() if as_list else arr_copy
     start_time = time.time()
-    sorted_arr = sort_func(arr_copy.tolist())
+    sorted_arr = sort_func(data)
     end_time = time.time()
     elapsed_time = end_time - start_time
     print(f"{name:15} - 耗时: {elapsed_time:.6f} 秒")
@@ -40,6 +43,13 @@ def run_benchmark(size=1000):
     print("-" * 50)
     results['quick_sort'] = benchmark_sorting_algorithm(quick_sort, arr, "快速排序")
     results['merge_sort'] = benchmark_sorting_algorithm(merge_sort, arr, "归并排序")
+    results['vectorized_sort'] = benchmark_sorting_algorithm(
+        vectorized_sort, arr, "向量化排序", as_list=False
+    )
+    results['counting_sort'] = benchmark_sorting_algorithm(
+        counting_sort, arr, "计数排序", as_list=False
+    )
+    results['radix_sort'] = benchmark_sorting_algorithm(radix_sort, arr, "基数排序", as_list=False)
     
     if size <= 1000:
         results['bubble_sort'] = benchmark_sorting_algorithm(bubble_sort, arr, "冒泡排序")
@@ -51,12 +61,14 @@ def run_benchmark(size=1000):
     print("-" * 50)
     benchmark_sorting_algorithm(quick_sort, arr_sorted, "快速排序")
     benchmark_sorting_algorithm(merge_sort, arr_sorted, "归并排序")
+    benchmark_sorting_algorithm(vectorized_sort, arr_sorted, "向量化排序", as_list=False)
     
     arr_reversed = arr_sorted[::-1]
     print(f"\n逆序数组测试:")
     print("-" * 50)
     benchmark_sorting_algorithm(quick_sort, arr_reversed, "快速排序")
     benchmark_sorting_algorithm(merge_sort, arr_reversed, "归并排序")
+    benchmark_sorting_algorithm(vectorized_sort, arr_reversed, "向量化排序", as_list=False)
     
     print(f"\n{'='*50}")
     print("基准测试完成")
@@ -0,0 +1,63 @@
+"""
+静态搜索索引基准测试
+
+比较 StaticSearchIndex（Eytzinger 布局）与对有序数组二分在大数组上的查询耗时
+
+用法:
+    python benchmarks/static_index_benchmark.py [数组大小 ...] [--queries N]
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import argparse
+import time
+import numpy as np
+from src.algorithms.searching import StaticSearchIndex, lower_bound, lower_bound_many
+
+
+def timed(func, *args):
+    """返回函数调用的结果与耗时（秒）"""
+    start_time = time.time()
+    result = func(*args)
+    return result, time.time() - start_time
+
+
+def run_benchmark(size, queries):
+    """运行静态索引基准测试"""
+    print(f"\n{'='*50}")
+    print(f"静态搜索索引基准测试 (数组大小: {size:,}, 查询次数: {queries:,})")
+    print(f"{'='*50}")
+
+    rng = np.random.default_rng(42)
+    arr = np.sort(rng.integers(0, size * 10, size=size))
+    targets = rng.integers(0, size * 10, size=queries)
+
+    index, build_time = timed(StaticSearchIndex, arr)
+    print(f"构建索引: {build_time:.3f} 秒, 占用 {index.nbytes / 2**20:.1f} MiB")
+
+    expected, sorted_time = timed(lower_bound_many, arr, targets)
+    result, index_time = timed(index.lower_bound_many, targets)
+    assert np.array_equal(expected, result)
+    print(f"{'批量-有序数组二分':20} - {sorted_time / queries * 1e9:8.1f} 纳秒/次")
+    print(f"{'批量-静态索引':20} - {index_time / queries * 1e9:8.1f} 纳秒/次"
+          f"  (加速比 {sorted_time / index_time:.2f}x)")
+
+    singles = targets[:min(queries, 20000)].tolist()
+    _, sorted_time = timed(lambda: [lower_bound(arr, t) for t in singles])
+    _, index_time = timed(lambda: [index.lower_bound(t) for t in singles])
+    print(f"{'单次-有序数组二分':20} - {sorted_time / len(singles) * 1e6:8.2f} 微秒/次")
+    print(f"{'单次-静态索引':20} - {index_time / len(singles) * 1e6:8.2f} 微秒/次")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="静态搜索索引基准测试")
+    parser.add_argument("sizes", nargs="*", type=int, default=[1_000_000, 10_000_000])
+    parser.add_argument("--queries", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print("开始静态搜索索引基准测试...")
+    for size in args.sizes:
+        run_benchmark(size, args.queries)
@@ -10,9 +10,11 @@
 - 回溯算法
 """
 
-from . import sorting, searching, graph, dynamic_programming, greedy, backtracking
+from . import keys, dtypes, sorting, searching, graph, dynamic_programming, greedy, backtracking
 
 __all__ = [
+    "keys",
+    "dtypes",
     "sorting",
     "searching",
     "graph",
@@ -0,0 +1,119 @@
+"""
+数值数组的 dtype 检测与容器转换
+
+排序、搜索与图算法共用的辅助函数与类型别名。
+"""
+
+import array
+import os
+from typing import Any, Optional, Union
+
+import numpy as np
+
+# 可以直接交给 NumPy 排序的 dtype 种类：布尔、有符号/无符号整数、浮点
+NUMERIC_KINDS = "biuf"
+
+ArrayLike = Union[np.ndarray, array.array, list, tuple]
+
+PathLike = Union[str, os.PathLike]
+
+
+def as_numeric_array(data: Any) -> Optional[np.ndarray]:
+    """
+    检测输入是否为一维同构数值数据
+
+    ndarray 与 array.array 不会复制数据；元素类型一致（全为布尔、全为整数或全为浮点）的
+    列表 / 元组会被转换为 ndarray，混合类型的列表返回 None。
+
+    Args:
+        data: 输入数据
+
+    Returns:
+        对应的一维 ndarray；不是数值数据时返回 None
+    """
+    if isinstance(data, np.ndarray):
+        arr = data
+    elif isinstance(data, array.array):
+        if data.typecode == "u":
+            return None
+        arr = np.frombuffer(data, dtype=np.dtype(data.typecode))
+    elif isinstance(data, (list, tuple)):
+        dtype = _homogeneous_dtype(set(map(type, data))) if data else None
+        if dtype is None:
+            return None
+        try:
+            arr = np.asarray(data, dtype=dtype)
+        except OverflowError:
+            return None
+    else:
+        return None
+
+    if arr.ndim != 1 or arr.dtype.kind not in NUMERIC_KINDS:
+        return None
+    return arr
+
+
+def _homogeneous_dtype(types: set) -> Optional[type]:
+    """
+    列表元素类型全为布尔、全为整数或全为浮点时返回对应的 dtype
+
+    混合类型会被 NumPy 统一提升为 float64，大整数丢失精度、布尔值被替换为数字，
+    因此返回 None，由调用方走通用路径
+    """
+    if all(issubclass(t, (bool, np.bool_)) for t in types):
+        return np.bool_
+    if all(issubclass(t, (int, np.integer)) and not issubclass(t, bool) for t in types):
+        # 超出 int64 的整数在 asarray 时抛出 OverflowError
+        return np.int64
+    if all(issubclass(t, (float, np.floating)) for t in types):
+        return np.float64
+    return None
+
+
+def require_numeric(data: ArrayLike) -> np.ndarray:
+    """同 as_numeric_array，但非数值数据抛出 TypeError；空列表视为空浮点数组"""
+    if isinstance(data, (list, tuple)) and len(data) == 0:
+        return np.array([], dtype=np.float64)
+    arr = as_numeric_array(data)
+    if arr is None:
+        raise TypeError("vectorized sort requires a 1-D homogeneous numeric array")
+    return arr
+
+
+def wrap_like(data: ArrayLike, result: np.ndarray) -> Any:
+    """将结果转换回输入的容器类型"""
+    if isinstance(data, np.ndarray):
+        return np.ascontiguousarray(result)
+    if isinstance(data, array.array):
+        out = array.array(data.typecode)
+        out.frombytes(np.ascontiguousarray(result).tobytes())
+        return out
+    return result.tolist()
+
+
+def scalar_view(arr: np.ndarray) -> Any:
+    """
+    供 Python 循环逐元素读取的视图
+
+    memoryview 下标直接返回 Python 标量，比逐个读取 NumPy 标量快得多且不复制数据；
+    memoryview 不支持的格式（如非本机字节序）退回 tolist。
+    """
+    arr = np.ascontiguousarray(arr)
+    try:
+        view = memoryview(arr)
+        if len(view):
+            view[0]
+        return view
+    except (NotImplementedError, TypeError, ValueError):
+        return arr.tolist()
+
+
+__all__ = [
+    "NUMERIC_KINDS",
+    "ArrayLike",
+    "PathLike",
+    "as_numeric_array",
+    "require_numeric",
+    "wrap_like",
+    "scalar_view",
+]
@@ -4,9 +4,21 @@
 实现各种经典图算法
 """
 
-from typing import Dict, List, Set, Tuple, Optional
-from collections import deque, defaultdict
-import heapq
+from typing import Any, Callable, Dict, List, Set, Tuple, Optional
+from collections import defaultdict
+
+from .csr import CSRGraph
+from .traversal import iter_bfs, iter_dfs
+from .shortest_paths import shortest_path, astar, bidirectional_dijkstra, dijkstra_distances
+from .multi_source import multi_source_dijkstra
+from .io import (
+    edge_record_dtype, save_binary_edges, load_binary_edges, read_csv_edges, load_csv_edges,
+    save_graph, load_graph,
+)
+from .components import (
+    connected_components, strongly_connected_components, incremental_components,
+)
+from .mst import kruskal, prim
 
 
 class Graph:
@@ -22,6 +34,38 @@ class Graph:
         if not self.directed:
             self.graph[v].append((u, weight))
     
+    @classmethod
+    def from_edges(cls, src: Any, dst: Any, weight: Optional[Any] = None,
+                   directed: bool = False) -> "Graph":
+        """
+        由 NumPy 边数组批量构建图
+        
+        先向量化地按源节点分组，再为每个节点一次性生成邻接表，不逐条调用 add_edge；
+        结果（包括各节点邻居的顺序）与按输入顺序逐条 add_edge 相同。
+        
+        Args:
+            src: 边的源节点数组（整数）
+            dst: 边的目标节点数组（整数）
+            weight: 边权重数组，默认全为 1.0
+            directed: 是否为有向图
+            
+        Returns:
+            Graph 实例
+        """
+        csr = CSRGraph.from_edges(src, dst, weight, directed=directed, relabel=True)
+        graph = cls(directed)
+        # 一次生成全部 (邻居, 权重) 元组，再按 indptr 切片分给各节点
+        pairs = list(zip(csr.node_ids[csr.indices].tolist(), csr.weights.tolist()))
+        bounds = csr.indptr.tolist()
+        for node, start, end in zip(csr.node_ids.tolist(), bounds[:-1], bounds[1:]):
+            if end > start:
+                graph.graph[node] = pairs[start:end]
+        return graph
+    
+    def to_csr(self) -> CSRGraph:
+        """转换为冻结的 CSR 表示，节点编号保存在其 node_ids 中"""
+        return CSRGraph.from_graph(self)
+    
     def bfs(self, start: int) -> List[int]:
         """
         广度优先搜索
@@ -32,24 +76,11 @@ class Graph:
         Returns:
             遍历顺序
         """
-        visited = set()
-        queue = deque([start])
-        result = []
-        
-        while queue:
-            node = queue.popleft()
-            if node not in visited:
-                visited.add(node)
-                result.append(node)
-                for neighbor, _ in self.graph[node]:
-                    if neighbor not in visited:
-                        queue.append(neighbor)
-        
-        return result
+        return list(iter_bfs(self, start))
     
     def dfs(self, start: int) -> List[int]:
         """
-        深度优先搜索
+        深度优先搜索（显式栈实现，深度不受递归上限限制）
         
         Args:
             start: 起始节点
@@ -57,18 +88,7 @@ class Graph:
         Returns:
             遍历顺序
         """
-        visited = set()
-        result = []
-        
-        def _dfs(node: int):
-            visited.add(node)
-            result.append(node)
-            for neighbor, _ in self.graph[node]:
-                if neighbor not in visited:
-                    _dfs(neighbor)
-        
-        _dfs(start)
-        return result
+        return list(iter_dfs(self, start))
     
     def dijkstra(self, start: int) -> Dict[int, float]:
         """
@@ -78,31 +98,47 @@ class Graph:
             start: 起始节点
             
         Returns:
-            从起始节点到各节点的最短距离
+            从起始节点到各节点的最短距离，不可达节点为 inf
         """
-        distances = {node: float('inf') for node in self.graph}
-        distances[start] = 0
-        pq = [(0, start)]
-        visited = set()
+        return dijkstra_distances(self.graph, start)
+    
+    def shortest_path(self, src: int, dst: int,
+                      heuristic: Optional[Callable[[int, int], float]] = None
+                      ) -> Tuple[float, List[int]]:
+        """
+        点对点最短路径，到达终点即停止
         
-        while pq:
-            current_dist, current = heapq.heappop(pq)
-            
-            if current in visited:
-                continue
-            
-            visited.add(current)
+        Args:
+            src: 起点
+            dst: 终点
+            heuristic: A* 启发函数 heuristic(node, dst)，默认不使用
             
-            for neighbor, weight in self.graph[current]:
-                distance = current_dist + weight
-                
-                if distance < distances.get(neighbor, float('inf')):
-                    distances[neighbor] = distance
-                    heapq.heappush(pq, (distance, neighbor))
-        
-        return distances
+        Returns:
+            (最短距离, 路径节点列表)，不可达时为 (inf, [])
+        """
+        return astar(self, src, dst, heuristic)
 
 
 __all__ = [
     "Graph",
+    "CSRGraph",
+    "iter_bfs",
+    "iter_dfs",
+    "shortest_path",
+    "astar",
+    "bidirectional_dijkstra",
+    "dijkstra_distances",
+    "multi_source_dijkstra",
+    "edge_record_dtype",
+    "save_binary_edges",
+    "load_binary_edges",
+    "read_csv_edges",
+    "load_csv_edges",
+    "save_graph",
+    "load_graph",
+    "connected_components",
+    "strongly_connected_components",
+    "incremental_components",
+    "kruskal",
+    "prim",
 ]
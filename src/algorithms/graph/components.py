@@ -0,0 +1,136 @@
+"""
+连通分量
+
+- connected_components：并查集合并所有边，返回连通分量标签（有向图为弱连通分量）
+- strongly_connected_components：显式栈实现的 Tarjan 算法，深度不受递归上限限制
+- incremental_components：按顺序加入边时，每加入一条边后的连通分量个数
+
+结果都是长度为节点数的标签数组（按 CSR 内部下标排列），而不是嵌套列表；Graph 输入先转换为
+CSRGraph，标签与 to_csr() 的 node_ids（升序节点编号）一一对应。
+"""
+
+from typing import Any, Optional
+
+import numpy as np
+
+from ...data_structures import DisjointSet
+from ..dtypes import scalar_view
+from .csr import CSRGraph
+
+
+def connected_components(graph: Any) -> np.ndarray:
+    """
+    连通分量
+
+    Args:
+        graph: CSRGraph 或 Graph；有向图忽略边的方向（弱连通）
+
+    Returns:
+        标签数组，同一分量的节点标签相同，标签为 0..k-1
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = graph.to_csr()
+    n = graph.num_nodes
+    src = graph.edge_sources()
+    dst = np.asarray(graph.indices, dtype=np.int64)
+    # 无向图每条边存了两个方向，只合并一次；自环不影响连通性
+    keep = src < dst if not graph.directed else src != dst
+    sets = DisjointSet(n)
+    sets.union_many(src[keep], dst[keep])
+    return sets.labels()
+
+
+def strongly_connected_components(graph: Any) -> np.ndarray:
+    """
+    强连通分量（迭代 Tarjan 算法）
+
+    Args:
+        graph: CSRGraph 或 Graph；无向图的强连通分量即连通分量
+
+    Returns:
+        标签数组，标签为 0..k-1，按分量完成的顺序编号，即缩点图的逆拓扑序：
+        若存在从分量 a 到分量 b 的边，则 label(a) > label(b)
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = graph.to_csr()
+    n = graph.num_nodes
+    indptr = scalar_view(graph.indptr)
+    indices = scalar_view(graph.indices)
+    order = [-1] * n
+    low = [0] * n
+    on_stack = bytearray(n)
+    labels = [0] * n
+    stack = []
+    counter = 0
+    component = 0
+
+    for root in range(n):
+        if order[root] >= 0:
+            continue
+        order[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        # 调用栈每一项为 (节点, 下一条待检查出边的位置)
+        calls = [(root, indptr[root])]
+        while calls:
+            v, pos = calls[-1]
+            end = indptr[v + 1]
+            while pos < end:
+                w = indices[pos]
+                pos += 1
+                if order[w] < 0:
+                    calls[-1] = (v, pos)
+                    order[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = 1
+                    calls.append((w, indptr[w]))
+                    break
+                if on_stack[w] and order[w] < low[v]:
+                    low[v] = order[w]
+            else:
+                calls.pop()
+                if low[v] == order[v]:
+                    # v 是分量的根：弹出栈中 v 及其之上的所有节点
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = 0
+                        labels[w] = component
+                        if w == v:
+                            break
+                    component += 1
+                if calls:
+                    parent = calls[-1][0]
+                    if low[v] < low[parent]:
+                        low[parent] = low[v]
+    return np.array(labels, dtype=np.int64)
+
+
+def incremental_components(src: Any, dst: Any, num_nodes: Optional[int] = None) -> np.ndarray:
+    """
+    按顺序逐条加入边，返回每加入一条边后的连通分量个数
+
+    需要在线查询时可直接使用 DisjointSet：每次 union 即加入一条边。
+
+    Args:
+        src: 边的一端节点数组（0..num_nodes-1）
+        dst: 边的另一端节点数组
+        num_nodes: 节点数，默认为最大编号 + 1
+
+    Returns:
+        长度为边数的数组，第 i 项为加入前 i+1 条边后的连通分量个数
+    """
+    src = np.asarray(src)
+    dst = np.asarray(dst)
+    if num_nodes is None:
+        num_nodes = max(int(src.max()), int(dst.max())) + 1 if len(src) else 0
+    merged = DisjointSet(num_nodes).union_many(src, dst)
+    return num_nodes - np.cumsum(merged, dtype=np.int64)
+
+
+__all__ = [
+    "connected_components",
+    "strongly_connected_components",
+    "incremental_components",
+]
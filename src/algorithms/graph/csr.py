@@ -0,0 +1,397 @@
+"""
+压缩稀疏行（CSR）图表示
+
+把邻接表冻结为三个 NumPy 数组：
+- indptr：长度 n+1，节点 u 的出边位于 [indptr[u], indptr[u+1])
+- indices：长度 m，各出边的目标节点下标
+- weights：长度 m，各出边的权重
+
+节点在内部用 0..n-1 的连续下标表示；原始节点编号不连续时，node_ids 保存
+"下标 -> 编号"的有序映射。每条边只占 indices 与 weights 中的一个元素
+（默认 4 + 8 字节），而 Graph 的字典 + 元组表示每条边超过 100 字节。
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+import heapq
+import numpy as np
+
+from ..dtypes import scalar_view
+from ..sorting.radix import counting_argsort
+from ...data_structures import IndexedHeap
+
+# 平均出度达到该值时 Dijkstra 改用索引堆：惰性删除的过期堆项随边数增长，
+# 纯 Python 的索引堆在此密度以上与 heapq 持平或更快，且堆大小不超过节点数
+INDEXED_HEAP_MIN_DEGREE = 64
+
+
+class CSRGraph:
+    """冻结的 CSR 图"""
+
+    def __init__(self, indptr: Any, indices: Any, weights: Optional[Any] = None,
+                 directed: bool = True, node_ids: Optional[Any] = None):
+        """
+        Args:
+            indptr: 行指针数组，长度为节点数 + 1
+            indices: 边目标节点下标数组
+            weights: 边权重数组，默认全为 1
+            directed: 是否为有向图；无向图的每条边以两个方向分别存储
+            node_ids: 下标对应的原始节点编号（严格递增），默认编号即下标
+        """
+        indptr = np.asarray(indptr)
+        indices = np.asarray(indices)
+        if indptr.ndim != 1 or len(indptr) == 0 or indices.ndim != 1:
+            raise ValueError("indptr must be a non-empty 1-D array and indices a 1-D array")
+        if indptr[0] != 0 or indptr[-1] != len(indices):
+            raise ValueError("indptr must start at 0 and end at len(indices)")
+        if weights is None:
+            weights = np.ones(len(indices), dtype=np.float64)
+        weights = np.asarray(weights)
+        if weights.shape != indices.shape:
+            raise ValueError("weights must have the same length as indices")
+        if node_ids is not None:
+            node_ids = np.asarray(node_ids)
+            if node_ids.shape != (len(indptr) - 1,):
+                raise ValueError("node_ids must have one entry per node")
+
+        self.indptr = _frozen(indptr)
+        self.indices = _frozen(indices)
+        self.weights = _frozen(weights)
+        self.node_ids = None if node_ids is None else _frozen(node_ids)
+        self.directed = directed
+        # 由 load_graph 内存映射加载时为图文件路径，多进程计算时工作进程据此直接映射文件
+        self.path: Optional[str] = None
+        self._reverse: Optional["CSRGraph"] = None
+
+    @classmethod
+    def from_edges(cls, src: Any, dst: Any, weights: Optional[Any] = None,
+                   directed: bool = False, num_nodes: Optional[int] = None,
+                   relabel: bool = False, weight_dtype: Any = np.float64) -> "CSRGraph":
+        """
+        由边数组构建 CSR 图
+
+        全程向量化：按源节点做一次稳定的计数排序，边在各节点内保持输入顺序。
+
+        Args:
+            src: 边的源节点数组
+            dst: 边的目标节点数组
+            weights: 边权重数组，默认全为 1
+            directed: 是否为有向图；无向图会同时存储反向边
+            num_nodes: 节点数，默认为最大编号 + 1（relabel=True 时忽略）
+            relabel: 是否把任意整数编号压缩为连续下标，原编号保存在 node_ids
+            weight_dtype: 权重数组的 dtype
+
+        Returns:
+            CSRGraph 实例
+        """
+        src = np.asarray(src)
+        dst = np.asarray(dst)
+        if src.shape != dst.shape or src.ndim != 1:
+            raise ValueError("src and dst must be 1-D arrays of the same length")
+        if len(src) and (src.dtype.kind not in "iu" or dst.dtype.kind not in "iu"):
+            raise TypeError("node ids must be integers")
+        if weights is None:
+            weights = np.ones(len(src), dtype=weight_dtype)
+        else:
+            weights = np.asarray(weights, dtype=weight_dtype)
+            if weights.shape != src.shape:
+                raise ValueError("weights must have the same length as src")
+
+        node_ids = None
+        if relabel:
+            node_ids, inverse = np.unique(np.concatenate([src, dst]), return_inverse=True)
+            num_nodes = len(node_ids)
+            src, dst = inverse[:len(src)], inverse[len(src):]
+        else:
+            if len(src) and min(int(src.min()), int(dst.min())) < 0:
+                raise ValueError("node ids must be non-negative; use relabel=True")
+            max_id = max(int(src.max()), int(dst.max())) if len(src) else -1
+            if num_nodes is None:
+                num_nodes = max_id + 1
+            elif max_id >= num_nodes:
+                raise ValueError(f"node id {max_id} out of range for {num_nodes} nodes")
+
+        # 先转换为最终的下标类型：大图上 int32 让无向图加倍后的临时数组小一半，
+        # 对内存映射的字段视图也在这里一次性复制为连续数组
+        index_dtype = _index_dtype(num_nodes)
+        src = src.astype(index_dtype, copy=False)
+        dst = dst.astype(index_dtype, copy=False)
+        if not directed:
+            # 交错存放两个方向，各节点的邻居顺序与逐条 Graph.add_edge 相同
+            src, dst = np.column_stack([src, dst]).ravel(), np.column_stack([dst, src]).ravel()
+            weights = np.repeat(weights, 2)
+        return cls._build(src, dst, weights, num_nodes, directed, node_ids)
+
+    @classmethod
+    def from_graph(cls, graph: Any, weight_dtype: Any = np.float64) -> "CSRGraph":
+        """
+        由 Graph 构建 CSR 图
+
+        Graph 的无向边本身已按两个方向存储，这里原样复制，各节点的邻居保持插入顺序。
+
+        Args:
+            graph: Graph 实例
+            weight_dtype: 权重数组的 dtype
+
+        Returns:
+            CSRGraph 实例，node_ids 为图中出现过的全部节点编号（升序）
+        """
+        src, dst, weights = [], [], []
+        for u, adjacency in graph.graph.items():
+            for v, weight in adjacency:
+                src.append(u)
+                dst.append(v)
+                weights.append(weight)
+        nodes = set(graph.graph) | set(dst)
+        node_ids = np.array(sorted(nodes), dtype=np.int64)
+        src_idx = np.searchsorted(node_ids, np.array(src, dtype=np.int64))
+        dst_idx = np.searchsorted(node_ids, np.array(dst, dtype=np.int64))
+        return cls._build(src_idx, dst_idx, np.array(weights, dtype=weight_dtype),
+                          len(node_ids), graph.directed, node_ids)
+
+    @classmethod
+    def _build(cls, src: np.ndarray, dst: np.ndarray, weights: np.ndarray, num_nodes: int,
+               directed: bool, node_ids: Optional[np.ndarray]) -> "CSRGraph":
+        order = counting_argsort(src)
+        indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=num_nodes), out=indptr[1:])
+        indices = dst[order].astype(_index_dtype(num_nodes), copy=False)
+        return cls(indptr, indices, weights[order], directed, node_ids)
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.indptr) - 1
+
+    @property
+    def num_edges(self) -> int:
+        """边数；无向图的每条边只计一次"""
+        return len(self.indices) if self.directed else len(self.indices) // 2
+
+    @property
+    def nbytes(self) -> int:
+        """各数组占用的总字节数"""
+        total = self.indptr.nbytes + self.indices.nbytes + self.weights.nbytes
+        return total + (0 if self.node_ids is None else self.node_ids.nbytes)
+
+    def index_of(self, node: int) -> int:
+        """
+        节点编号转换为内部下标
+
+        Raises:
+            KeyError: 节点不在图中
+        """
+        if self.node_ids is None:
+            if 0 <= node < self.num_nodes:
+                return int(node)
+        else:
+            i = int(np.searchsorted(self.node_ids, node))
+            if i < len(self.node_ids) and self.node_ids[i] == node:
+                return i
+        raise KeyError(node)
+
+    def node_of(self, index: Any) -> Any:
+        """内部下标（或下标数组）转换为节点编号"""
+        if self.node_ids is None:
+            return index
+        return self.node_ids[index]
+
+    def neighbors(self, node: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        节点的出边
+
+        Returns:
+            (邻居编号数组, 权重数组)
+        """
+        u = self.index_of(node)
+        start, end = self.indptr[u], self.indptr[u + 1]
+        return self.node_of(self.indices[start:end]), self.weights[start:end]
+
+    def degree(self) -> np.ndarray:
+        """各节点的出度"""
+        return np.diff(self.indptr)
+
+    def edge_sources(self) -> np.ndarray:
+        """各条边（按 indices 中的位置）的源节点下标，与 indices 一起构成边列表"""
+        return np.repeat(np.arange(self.num_nodes, dtype=np.int64), self.degree())
+
+    def reverse(self) -> "CSRGraph":
+        """
+        反向图（所有边反向），首次调用时向量化构建并缓存；无向图返回自身
+
+        Returns:
+            CSRGraph 实例，节点下标与 node_ids 不变
+        """
+        if not self.directed:
+            return self
+        if self._reverse is None:
+            self._reverse = self._build(np.asarray(self.indices, dtype=np.int64),
+                                        self.edge_sources(),
+                                        np.asarray(self.weights), self.num_nodes, True,
+                                        self.node_ids)
+            self._reverse._reverse = self
+        return self._reverse
+
+    def bfs(self, start: int) -> np.ndarray:
+        """
+        广度优先搜索
+
+        按层同步扩展：每层用向量化操作收集整个前沿的邻居，过滤已访问节点并按首次出现
+        顺序去重，得到的顺序与逐个出队的 BFS 完全一致。
+
+        Args:
+            start: 起始节点
+
+        Returns:
+            遍历顺序（节点编号数组）
+        """
+        s = self.index_of(start)
+        visited = np.zeros(self.num_nodes, dtype=bool)
+        visited[s] = True
+        frontier = np.array([s], dtype=np.int64)
+        levels = [frontier]
+        while len(frontier):
+            neighbors = self.indices[_edge_positions(self.indptr, frontier)]
+            neighbors = neighbors[~visited[neighbors]]
+            _, first = np.unique(neighbors, return_index=True)
+            frontier = neighbors[np.sort(first)]
+            visited[frontier] = True
+            levels.append(frontier)
+        return self.node_of(np.concatenate(levels).astype(np.int64))
+
+    def dfs(self, start: int) -> np.ndarray:
+        """
+        深度优先搜索
+
+        使用显式栈（不递归），访问顺序与递归 DFS 相同。
+
+        Args:
+            start: 起始节点
+
+        Returns:
+            遍历顺序（节点编号数组）
+        """
+        s = self.index_of(start)
+        indptr = scalar_view(self.indptr)
+        indices = scalar_view(self.indices)
+        visited = bytearray(self.num_nodes)
+        visited[s] = 1
+        order = [s]
+        # 栈中保存 (节点, 下一条待检查的边位置)
+        stack = [(s, indptr[s])]
+        while stack:
+            u, pos = stack[-1]
+            end = indptr[u + 1]
+            while pos < end and visited[indices[pos]]:
+                pos += 1
+            if pos == end:
+                stack.pop()
+                continue
+            v = indices[pos]
+            stack[-1] = (u, pos + 1)
+            visited[v] = 1
+            order.append(v)
+            stack.append((v, indptr[v]))
+        return self.node_of(np.array(order, dtype=np.int64))
+
+    def dijkstra(self, start: int, max_distance: Optional[float] = None) -> np.ndarray:
+        """
+        Dijkstra 最短路径算法
+
+        Args:
+            start: 起始节点
+            max_distance: 距离上限，超过该距离的节点不再扩展，视为不可达
+
+        Returns:
+            按内部下标排列的最短距离数组，不可达节点为 inf
+        """
+        s = self.index_of(start)
+        distances = np.full(self.num_nodes, np.inf)
+        dijkstra_kernel(scalar_view(self.indptr), scalar_view(self.indices),
+                        scalar_view(self.weights), s, memoryview(distances),
+                        np.inf if max_distance is None else max_distance)
+        return distances
+
+    def distances_dict(self, distances: np.ndarray) -> Dict[int, float]:
+        """把按下标排列的距离数组转换为 {节点编号: 距离} 字典（只含可达节点）"""
+        reachable = np.flatnonzero(np.isfinite(distances))
+        return dict(zip(np.asarray(self.node_of(reachable)).tolist(),
+                        distances[reachable].tolist()))
+
+
+def dijkstra_kernel(indptr: Any, indices: Any, weights: Any, source: int, dist: Any,
+                    max_distance: float) -> None:
+    """
+    在 CSR 数组上运行单源 Dijkstra，结果写入 dist
+
+    平均出度不低于 INDEXED_HEAP_MIN_DEGREE 时使用索引堆（decrease_key，堆大小不超过节点数），
+    否则使用 heapq 惰性删除：稀疏图上过期堆项很少，C 实现的 heapq 更快。
+
+    Args:
+        indptr, indices, weights: 可逐元素读取的 CSR 数组视图
+        source: 起点下标
+        dist: 可写的 float64 距离视图，调用前全部置为 inf
+        max_distance: 距离上限，超过上限的节点不入堆
+    """
+    n = len(dist)
+    if indptr[n] >= INDEXED_HEAP_MIN_DEGREE * n:
+        _indexed_dijkstra(indptr, indices, weights, source, dist, max_distance)
+        return
+
+    dist[source] = 0.0
+    pq = [(0.0, source)]
+    while pq:
+        d, u = heapq.heappop(pq)
+        # 同一节点可能有多个过期的堆项，只处理与当前最短距离相等的那一项
+        if d > dist[u]:
+            continue
+        for pos in range(indptr[u], indptr[u + 1]):
+            v = indices[pos]
+            distance = d + weights[pos]
+            if distance < dist[v] and distance <= max_distance:
+                dist[v] = distance
+                heapq.heappush(pq, (distance, v))
+
+
+def _indexed_dijkstra(indptr: Any, indices: Any, weights: Any, source: int, dist: Any,
+                      max_distance: float) -> None:
+    """索引堆版本的 dijkstra_kernel，dist 直接作为堆的优先级数组"""
+    heap = IndexedHeap(len(dist), keys=dist)
+    heap.push(source, 0.0)
+    pop, push_or_decrease = heap.pop, heap.push_or_decrease
+    while heap:
+        u, d = pop()
+        # 已出堆节点的距离不会再变小（边权非负），因此无需 visited 标记
+        for pos in range(indptr[u], indptr[u + 1]):
+            v = indices[pos]
+            distance = d + weights[pos]
+            if distance < dist[v] and distance <= max_distance:
+                push_or_decrease(v, distance)
+
+
+def _index_dtype(num_nodes: int) -> Any:
+    """能容纳 num_nodes 个下标的最小整数类型"""
+    return np.int32 if num_nodes <= np.iinfo(np.int32).max else np.int64
+
+
+def _frozen(arr: np.ndarray) -> np.ndarray:
+    """返回只读视图，防止构建后被修改"""
+    view = arr.view()
+    view.flags.writeable = False
+    return view
+
+
+def _edge_positions(indptr: np.ndarray, nodes: np.ndarray) -> np.ndarray:
+    """一组节点全部出边在 indices 中的位置，按节点顺序拼接"""
+    starts = indptr[nodes]
+    counts = indptr[nodes + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    # 每段的起点减去该段在输出中的偏移，再加上全局递增序号
+    offsets = np.cumsum(counts) - counts
+    return np.repeat(starts - offsets, counts) + np.arange(total)
+
+
+__all__ = [
+    "CSRGraph",
+]
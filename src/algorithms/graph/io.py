@@ -0,0 +1,272 @@
+"""
+图文件读写
+
+- 二进制边列表：定长记录 (src, dst[, weight]) 依次存放、没有文件头，用 np.memmap 映射后
+  直接把字段视图交给 CSRGraph.from_edges，不经过 Python 对象
+- CSV 边列表：每行 "src,dst[,weight]"，按块用 np.loadtxt 解析，每块只产生 NumPy 数组
+- 图文件（save_graph / load_graph）：带版本号的文件头 + CSR 数组 + 可选的 node_ids。
+  加载时只映射文件、不读取也不复制数组，耗时与图的大小无关；多个进程加载同一文件时
+  共享操作系统页缓存中的同一份数据
+
+图文件布局（小端）：
+    [0, 128)       文件头：magic、版本、标志位、节点数、边数组长度、四个数组的 dtype
+    之后依次为     indptr、indices、weights、node_ids（可选），各自按 64 字节对齐
+"""
+
+import os
+import struct
+import warnings
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+
+from ..dtypes import PathLike
+from .csr import CSRGraph
+
+# CSV 每块读取的行数
+CSV_CHUNK_ROWS = 1_000_000
+
+GRAPH_MAGIC = b"CSRGRAPH"
+GRAPH_FORMAT_VERSION = 1
+GRAPH_HEADER_SIZE = 128
+# 各数组在文件中的起始位置按缓存行对齐
+GRAPH_ALIGNMENT = 64
+# magic、版本、标志位、节点数、indices 长度、indptr / indices / weights / node_ids 的 dtype
+_GRAPH_HEADER = struct.Struct("<8sIIQQ16s16s16s16s")
+_FLAG_DIRECTED = 1
+_FLAG_NODE_IDS = 2
+
+
+def edge_record_dtype(index_dtype: Any = np.int64,
+                      weight_dtype: Optional[Any] = np.float64) -> np.dtype:
+    """
+    二进制边列表的记录类型（小端、紧凑排列）
+
+    Args:
+        index_dtype: 节点编号类型
+        weight_dtype: 边权重类型，None 表示无权边列表
+
+    Returns:
+        字段为 src、dst（以及 weight）的结构化 dtype
+    """
+    index = np.dtype(index_dtype).newbyteorder("<")
+    fields = [("src", index), ("dst", index)]
+    if weight_dtype is not None:
+        fields.append(("weight", np.dtype(weight_dtype).newbyteorder("<")))
+    return np.dtype(fields)
+
+
+def save_binary_edges(path: PathLike, src: Any, dst: Any, weights: Optional[Any] = None,
+                      index_dtype: Any = np.int64, weight_dtype: Any = np.float64):
+    """
+    把边数组写为二进制边列表
+
+    Args:
+        path: 输出文件路径
+        src: 边的源节点数组
+        dst: 边的目标节点数组
+        weights: 边权重数组，None 时写出无权边列表
+        index_dtype: 节点编号类型
+        weight_dtype: 边权重类型
+    """
+    src = np.asarray(src)
+    dst = np.asarray(dst)
+    if src.shape != dst.shape or src.ndim != 1:
+        raise ValueError("src and dst must be 1-D arrays of the same length")
+    dtype = edge_record_dtype(index_dtype, None if weights is None else weight_dtype)
+    records = np.empty(len(src), dtype=dtype)
+    records["src"] = src
+    records["dst"] = dst
+    if weights is not None:
+        records["weight"] = weights
+    records.tofile(str(path))
+
+
+def load_binary_edges(path: PathLike, index_dtype: Any = np.int64,
+                      weight_dtype: Optional[Any] = np.float64, directed: bool = False,
+                      num_nodes: Optional[int] = None, relabel: bool = False) -> CSRGraph:
+    """
+    内存映射二进制边列表并构建 CSR 图
+
+    Args:
+        path: 由 save_binary_edges（或同样布局的外部程序）写出的文件
+        index_dtype: 节点编号类型
+        weight_dtype: 边权重类型，None 表示无权边列表（权重全为 1）
+        directed: 是否为有向图
+        num_nodes: 节点数，默认为最大编号 + 1
+        relabel: 是否把任意整数编号压缩为连续下标
+
+    Returns:
+        CSRGraph 实例
+    """
+    dtype = edge_record_dtype(index_dtype, weight_dtype)
+    size = Path(path).stat().st_size
+    if size % dtype.itemsize:
+        raise ValueError(f"file size {size} is not a multiple of the record size "
+                         f"{dtype.itemsize}")
+    if size == 0:
+        records = np.empty(0, dtype=dtype)
+    else:
+        records = np.memmap(path, dtype=dtype, mode="r")
+    weights = records["weight"] if weight_dtype is not None else None
+    return CSRGraph.from_edges(records["src"], records["dst"], weights, directed=directed,
+                               num_nodes=num_nodes, relabel=relabel,
+                               weight_dtype=np.float64 if weight_dtype is None else weight_dtype)
+
+
+def read_csv_edges(path: PathLike, delimiter: str = ",", weighted: bool = True,
+                   skip_header: bool = False,
+                   chunk_rows: int = CSV_CHUNK_ROWS) -> Tuple[np.ndarray, np.ndarray,
+                                                              Optional[np.ndarray]]:
+    """
+    分块读取 CSV 边列表
+
+    Args:
+        path: CSV 文件路径，每行 "src,dst[,weight]"，# 开头的行视为注释
+        delimiter: 分隔符
+        weighted: 是否读取第三列权重
+        skip_header: 是否跳过首行表头
+        chunk_rows: 每块解析的行数
+
+    Returns:
+        (src, dst, weights) 数组；weighted=False 时 weights 为 None
+    """
+    if chunk_rows <= 0:
+        raise ValueError("chunk_rows must be positive")
+    fields = [("src", np.int64), ("dst", np.int64)]
+    if weighted:
+        fields.append(("weight", np.float64))
+    dtype = np.dtype(fields)
+
+    chunks: List[np.ndarray] = []
+    with open(path, "r", encoding="utf-8") as f:
+        if skip_header:
+            f.readline()
+        with warnings.catch_warnings():
+            # 行数恰为 chunk_rows 的整数倍时最后一次读取为空，loadtxt 会发出警告
+            warnings.simplefilter("ignore", UserWarning)
+            while True:
+                chunk = np.loadtxt(f, dtype=dtype, delimiter=delimiter, comments="#",
+                                   usecols=range(len(fields)), max_rows=chunk_rows, ndmin=1)
+                if len(chunk):
+                    chunks.append(chunk)
+                if len(chunk) < chunk_rows:
+                    break
+
+    records = np.concatenate(chunks) if chunks else np.empty(0, dtype=dtype)
+    weights = records["weight"] if weighted else None
+    return records["src"], records["dst"], weights
+
+
+def load_csv_edges(path: PathLike, delimiter: str = ",", weighted: bool = True,
+                   skip_header: bool = False, directed: bool = False,
+                   num_nodes: Optional[int] = None, relabel: bool = False,
+                   chunk_rows: int = CSV_CHUNK_ROWS) -> CSRGraph:
+    """
+    分块读取 CSV 边列表并构建 CSR 图
+
+    Args:
+        path: CSV 文件路径，每行 "src,dst[,weight]"
+        delimiter: 分隔符
+        weighted: 是否读取第三列权重，否则权重全为 1
+        skip_header: 是否跳过首行表头
+        directed: 是否为有向图
+        num_nodes: 节点数，默认为最大编号 + 1
+        relabel: 是否把任意整数编号压缩为连续下标
+        chunk_rows: 每块解析的行数
+
+    Returns:
+        CSRGraph 实例
+    """
+    src, dst, weights = read_csv_edges(path, delimiter, weighted, skip_header, chunk_rows)
+    return CSRGraph.from_edges(src, dst, weights, directed=directed, num_nodes=num_nodes,
+                               relabel=relabel)
+
+
+def save_graph(graph: Any, path: PathLike):
+    """
+    把图保存为二进制图文件
+
+    Args:
+        graph: CSRGraph 或 Graph（Graph 会先转换为 CSRGraph）
+        path: 输出文件路径
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = graph.to_csr()
+    arrays = [graph.indptr, graph.indices, graph.weights]
+    if graph.node_ids is not None:
+        arrays.append(graph.node_ids)
+    arrays = [arr.astype(arr.dtype.newbyteorder("<"), copy=False) for arr in arrays]
+    dtypes = [arr.dtype.str.encode("ascii") for arr in arrays] + [b""] * (4 - len(arrays))
+    flags = (_FLAG_DIRECTED if graph.directed else 0) | (
+        _FLAG_NODE_IDS if graph.node_ids is not None else 0)
+    header = _GRAPH_HEADER.pack(GRAPH_MAGIC, GRAPH_FORMAT_VERSION, flags, graph.num_nodes,
+                                len(graph.indices), *dtypes)
+
+    with open(path, "wb") as f:
+        f.write(header.ljust(GRAPH_HEADER_SIZE, b"\0"))
+        for arr in arrays:
+            f.write(b"\0" * (-f.tell() % GRAPH_ALIGNMENT))
+            np.ascontiguousarray(arr).tofile(f)
+
+
+def load_graph(path: PathLike, mmap: bool = True) -> CSRGraph:
+    """
+    加载二进制图文件
+
+    Args:
+        path: save_graph 生成的文件路径
+        mmap: 是否以只读内存映射方式加载（零拷贝，数据按需读入，多个进程共享页缓存）；
+            为 False 时把数组读入内存
+
+    Returns:
+        CSRGraph 实例；内存映射加载时其 path 属性为文件路径
+    """
+    with open(path, "rb") as f:
+        header = f.read(GRAPH_HEADER_SIZE)
+    if len(header) < GRAPH_HEADER_SIZE:
+        raise ValueError("truncated graph file")
+    magic, version, flags, num_nodes, num_indices, *dtype_strs = _GRAPH_HEADER.unpack_from(header)
+    if magic != GRAPH_MAGIC:
+        raise ValueError("not a graph file")
+    if version != GRAPH_FORMAT_VERSION:
+        raise ValueError(f"unsupported graph file version: {version}")
+
+    lengths = [num_nodes + 1, num_indices, num_indices]
+    if flags & _FLAG_NODE_IDS:
+        lengths.append(num_nodes)
+    layout = []
+    offset = GRAPH_HEADER_SIZE
+    for length, dtype_str in zip(lengths, dtype_strs):
+        dtype = np.dtype(dtype_str.rstrip(b"\0").decode("ascii"))
+        offset += -offset % GRAPH_ALIGNMENT
+        layout.append((offset, dtype, length))
+        offset += length * dtype.itemsize
+    if os.path.getsize(path) < offset:
+        raise ValueError("truncated graph file")
+
+    if mmap:
+        # 整个文件只映射一次，各数组是其上的零拷贝视图
+        data = np.memmap(path, dtype=np.uint8, mode="r")
+        arrays = [data[start:start + length * dtype.itemsize].view(dtype)
+                  for start, dtype, length in layout]
+    else:
+        arrays = [np.fromfile(path, dtype=dtype, count=length, offset=start)
+                  for start, dtype, length in layout]
+    node_ids = arrays[3] if len(arrays) == 4 else None
+    graph = CSRGraph(arrays[0], arrays[1], arrays[2], bool(flags & _FLAG_DIRECTED), node_ids)
+    if mmap:
+        graph.path = os.fspath(path)
+    return graph
+
+
+__all__ = [
+    "edge_record_dtype",
+    "save_binary_edges",
+    "load_binary_edges",
+    "read_csv_edges",
+    "load_csv_edges",
+    "save_graph",
+    "load_graph",
+]
@@ -0,0 +1,123 @@
+"""
+最小生成树（森林）
+
+- kruskal：一次向量化排序全部边，再按权重从小到大用并查集合并，生成树完整后提前结束
+- prim：从每个未访问节点出发生长，候选节点保存在索引堆中（decrease_key），
+  堆大小不超过节点数；高度数节点的邻接行先向量化过滤
+
+两者都只接受无向图，Graph 输入先转换为 CSRGraph。图不连通时返回最小生成森林。
+结果为边位置数组：第 i 条树边是 csr.edge_sources()[pos[i]] -> csr.indices[pos[i]]，
+权重为 csr.weights[pos[i]]；Graph 输入的位置对应 graph.to_csr() 的数组。
+"""
+
+from typing import Any, Optional
+
+import numpy as np
+
+from ...data_structures import DisjointSet, IndexedHeap
+from ..dtypes import scalar_view
+from .csr import CSRGraph
+
+# Kruskal 每批合并的边数相对节点数的倍数；每批之后检查生成树是否已完整
+KRUSKAL_BATCH_FACTOR = 4
+# Prim 中度数不低于该值的节点用 NumPy 整行筛选候选邻居，低于该值时逐条检查更快
+PRIM_VECTOR_MIN_DEGREE = 128
+
+
+def kruskal(graph: Any) -> np.ndarray:
+    """
+    Kruskal 最小生成树
+
+    Args:
+        graph: 无向 CSRGraph 或 Graph
+
+    Returns:
+        树边在 CSR 数组中的位置，按权重升序排列
+    """
+    graph = _undirected_csr(graph)
+    n = graph.num_nodes
+    src = graph.edge_sources()
+    dst = np.asarray(graph.indices, dtype=np.int64)
+    # 每条无向边存了两个方向，只保留 src < dst 的一份；自环不可能是树边
+    candidates = np.flatnonzero(src < dst)
+    candidates = candidates[np.argsort(graph.weights[candidates], kind="stable")]
+
+    sets = DisjointSet(n)
+    batch = max(1024, KRUSKAL_BATCH_FACTOR * n)
+    chosen = []
+    for start in range(0, len(candidates), batch):
+        positions = candidates[start:start + batch]
+        merged = sets.union_many(src[positions], dst[positions])
+        chosen.append(positions[merged])
+        if sets.num_sets == 1:
+            break
+    return np.concatenate(chosen) if chosen else np.empty(0, dtype=np.int64)
+
+
+def prim(graph: Any, start: Optional[Any] = None) -> np.ndarray:
+    """
+    Prim 最小生成树
+
+    Args:
+        graph: 无向 CSRGraph 或 Graph
+        start: 起始节点，默认为下标 0 的节点；其余连通分量从各自编号最小的节点开始
+
+    Returns:
+        树边在 CSR 数组中的位置，按加入生成树的顺序排列
+    """
+    graph = _undirected_csr(graph)
+    n = graph.num_nodes
+    indptr = scalar_view(graph.indptr)
+    indices = scalar_view(graph.indices)
+    weights = scalar_view(graph.weights)
+    # 同一份数据的两种视图：逐个读写用 memoryview，整行过滤用 NumPy 数组
+    key_array = np.full(n, np.inf)
+    key = memoryview(key_array)
+    done = bytearray(n)
+    done_array = np.frombuffer(done, dtype=bool)
+    # via[v]：当前连接 v 的最轻边的位置
+    via = [-1] * n
+    heap = IndexedHeap(n, keys=key)
+    pop, push_or_decrease = heap.pop, heap.push_or_decrease
+    chosen = []
+
+    roots = range(n) if start is None else [graph.index_of(start), *range(n)]
+    for root in roots:
+        if done[root]:
+            continue
+        heap.push(root, 0.0)
+        while heap:
+            u, _ = pop()
+            done[u] = 1
+            if via[u] >= 0:
+                chosen.append(via[u])
+            begin, end = indptr[u], indptr[u + 1]
+            if end - begin >= PRIM_VECTOR_MIN_DEGREE:
+                # 度数大的节点先向量化筛出能改进的邻居，只对它们逐个更新堆
+                neighbors = graph.indices[begin:end]
+                row = graph.weights[begin:end]
+                better = np.flatnonzero((row < key_array[neighbors]) & ~done_array[neighbors])
+                candidates = zip((better + begin).tolist(), neighbors[better].tolist(),
+                                 row[better].tolist())
+            else:
+                candidates = ((pos, indices[pos], weights[pos]) for pos in range(begin, end))
+            for pos, v, weight in candidates:
+                # 行内可能有重边，逐个比较时 key 已随前面的更新变化
+                if not done[v] and weight < key[v]:
+                    push_or_decrease(v, weight)
+                    via[v] = pos
+    return np.array(chosen, dtype=np.int64)
+
+
+def _undirected_csr(graph: Any) -> CSRGraph:
+    if not isinstance(graph, CSRGraph):
+        graph = graph.to_csr()
+    if graph.directed:
+        raise ValueError("minimum spanning tree requires an undirected graph")
+    return graph
+
+
+__all__ = [
+    "kruskal",
+    "prim",
+]
@@ -0,0 +1,152 @@
+"""
+多源最短路径
+
+从一组起点分别运行 Dijkstra，结果写入 len(sources) x n 的 float32 距离矩阵。
+
+并行时 CSR 数组只复制一次到 ``multiprocessing.shared_memory``，各工作进程在启动时
+以只读方式映射，之后的任务只传递起点下标与输出缓冲区名，图数据本身不经过 pickle。
+由 load_graph 内存映射加载的图不再复制，工作进程直接映射同一个图文件，共享页缓存。
+输出按行分批写入共享缓冲区再拷入结果矩阵，额外内存不超过一批的大小。
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..dtypes import scalar_view
+from .csr import CSRGraph, dijkstra_kernel
+from .io import load_graph
+
+# 每批输出占用的共享内存上限（字节）
+OUTPUT_BATCH_BYTES = 64 * 1024 * 1024
+
+ArraySpec = Tuple[str, str, Tuple[int, ...]]
+
+# 工作进程中映射好的 CSR 数组（由 _attach_graph 初始化）
+_worker_graph: Dict[str, Any] = {}
+
+
+def multi_source_dijkstra(graph: Any, sources: Sequence[Any], workers: Optional[int] = None,
+                          max_distance: Optional[float] = None,
+                          out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    多源 Dijkstra
+
+    Args:
+        graph: CSRGraph（Graph 会先转换为 CSRGraph）
+        sources: 起点节点编号序列
+        workers: 进程数，默认使用全部 CPU 核心；为 1 时在当前进程中顺序计算
+        max_distance: 距离上限，超过该距离的节点不再扩展，记为 inf
+        out: 预先分配的 (len(sources), n) float32 结果矩阵（可为 np.memmap），默认新建
+
+    Returns:
+        距离矩阵，第 i 行为 sources[i] 到各节点（按内部下标排列）的最短距离，不可达为 inf
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = graph.to_csr()
+    n = graph.num_nodes
+    rows = [graph.index_of(source) for source in sources]
+    if out is None:
+        out = np.empty((len(rows), n), dtype=np.float32)
+    elif out.shape != (len(rows), n) or out.dtype != np.float32:
+        raise ValueError(f"out must be a float32 array of shape {(len(rows), n)}")
+
+    limit = np.inf if max_distance is None else float(max_distance)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(rows)))
+
+    if workers == 1:
+        views = _views(graph.indptr, graph.indices, graph.weights)
+        _solve_rows(views, rows, out, limit)
+        return out
+
+    if graph.path is not None:
+        shared = []
+        initializer, initargs = _map_graph_file, (graph.path,)
+    else:
+        shared = [_share(arr) for arr in (graph.indptr, graph.indices, graph.weights)]
+        initializer, initargs = _attach_graph, ([spec for _, spec in shared],)
+    batch_rows = max(workers, OUTPUT_BATCH_BYTES // max(1, n * 4))
+    batch = shared_memory.SharedMemory(create=True, size=max(1, min(batch_rows, len(rows)) * n * 4))
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=initializer,
+                                 initargs=initargs) as pool:
+            for lo in range(0, len(rows), batch_rows):
+                hi = min(lo + batch_rows, len(rows))
+                bounds = np.linspace(0, hi - lo, workers + 1).astype(np.int64)
+                tasks = [(rows[lo + a:lo + b], batch.name, int(a), hi - lo, n, limit)
+                         for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+                list(pool.map(_solve_task, tasks))
+                result = np.ndarray((hi - lo, n), dtype=np.float32, buffer=batch.buf)
+                out[lo:hi] = result
+                del result
+    finally:
+        for shm in [batch] + [shm for shm, _ in shared]:
+            shm.close()
+            shm.unlink()
+    return out
+
+
+def _solve_rows(views: Tuple[Any, Any, Any], rows: List[int], out: np.ndarray,
+                max_distance: float) -> None:
+    """依次计算各起点的最短距离，写入 out 的对应行"""
+    indptr, indices, weights = views
+    n = out.shape[1]
+    scratch = np.empty(n, dtype=np.float64)
+    dist = memoryview(scratch)
+    for i, source in enumerate(rows):
+        scratch.fill(np.inf)
+        dijkstra_kernel(indptr, indices, weights, source, dist, max_distance)
+        out[i] = scratch
+
+
+def _views(*arrays: np.ndarray) -> Tuple[Any, ...]:
+    return tuple(scalar_view(arr) for arr in arrays)
+
+
+def _share(arr: np.ndarray) -> Tuple[shared_memory.SharedMemory, ArraySpec]:
+    """把数组复制进新建的共享内存，返回共享内存对象与描述"""
+    shm = shared_memory.SharedMemory(create=True, size=max(1, arr.nbytes))
+    np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[...] = arr
+    return shm, (shm.name, arr.dtype.str, arr.shape)
+
+
+def _attach_graph(specs: List[ArraySpec]) -> None:
+    """工作进程初始化：只读映射共享的 CSR 数组"""
+    handles, arrays = [], []
+    for name, dtype, shape in specs:
+        shm = shared_memory.SharedMemory(name=name)
+        arr = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+        arr.flags.writeable = False
+        handles.append(shm)
+        arrays.append(arr)
+    _worker_graph["handles"] = handles
+    _worker_graph["views"] = _views(*arrays)
+
+
+def _map_graph_file(path: str) -> None:
+    """工作进程初始化：内存映射图文件"""
+    graph = load_graph(path)
+    _worker_graph["graph"] = graph
+    _worker_graph["views"] = _views(graph.indptr, graph.indices, graph.weights)
+
+
+def _solve_task(args: Tuple[List[int], str, int, int, int, float]) -> None:
+    """子进程：计算一组起点，写入共享输出缓冲区中从 offset 开始的行"""
+    rows, name, offset, total_rows, n, max_distance = args
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        batch = np.ndarray((total_rows, n), dtype=np.float32, buffer=shm.buf)
+        _solve_rows(_worker_graph["views"], rows, batch[offset:offset + len(rows)], max_distance)
+        del batch
+    finally:
+        shm.close()
+
+
+__all__ = [
+    "multi_source_dijkstra",
+]
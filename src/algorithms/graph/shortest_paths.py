@@ -0,0 +1,270 @@
+"""
+点对点最短路径
+
+- shortest_path：Dijkstra，目标节点出堆即停止，通过前驱表还原路径
+- astar：A* 搜索，启发函数可插拔；启发函数为目标距离的下界（可采纳）时结果最优
+- bidirectional_dijkstra：从起点与终点同时搜索，两侧堆顶之和不小于当前最优值时停止
+- dijkstra_distances：邻接表上的单源 Dijkstra，按平均出度选择 heapq 或索引堆
+
+三者都只为实际探索到的节点分配距离与前驱记录，搜索提前结束时开销与探索范围成正比，
+与图的规模无关。Graph 与 CSRGraph 均可作为输入。
+"""
+
+import heapq
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ...data_structures import IndexedHeap
+from ..dtypes import scalar_view
+from .csr import CSRGraph, INDEXED_HEAP_MIN_DEGREE
+from .traversal import _identity
+
+INF = float("inf")
+
+Heuristic = Callable[[Any, Any], float]
+
+
+def shortest_path(graph: Any, source: Any, target: Any) -> Tuple[float, List[Any]]:
+    """
+    点对点最短路径（Dijkstra，提前终止）
+
+    Args:
+        graph: Graph 或 CSRGraph（边权非负）
+        source: 起点
+        target: 终点
+
+    Returns:
+        (最短距离, 路径节点列表)；不可达时为 (inf, [])
+    """
+    return astar(graph, source, target, heuristic=None)
+
+
+def astar(graph: Any, source: Any, target: Any,
+          heuristic: Optional[Heuristic] = None) -> Tuple[float, List[Any]]:
+    """
+    A* 搜索
+
+    Args:
+        graph: Graph 或 CSRGraph（边权非负）
+        source: 起点
+        target: 终点
+        heuristic: 启发函数 heuristic(node, target)，返回 node 到 target 距离的估计；
+            不超过真实距离时结果最优。默认为 0，即 Dijkstra
+
+    Returns:
+        (最短距离, 路径节点列表)；不可达时为 (inf, [])
+    """
+    key_of, label_of, edges = _weighted_adjacency(graph)
+    s, t = key_of(source), key_of(target)
+    if heuristic is None:
+        estimate = None
+    else:
+        def estimate(key):
+            return heuristic(label_of(key), target)
+
+    dist = {s: 0.0}
+    pred = {s: None}
+    pq = [(estimate(s) if estimate else 0.0, 0.0, s)]
+    while pq:
+        _, d, u = heapq.heappop(pq)
+        if u == t:
+            return d, _path(pred, t, label_of)
+        if d > dist[u]:
+            continue
+        for v, weight in edges(u):
+            distance = d + weight
+            if distance < dist.get(v, INF):
+                dist[v] = distance
+                pred[v] = u
+                priority = distance + estimate(v) if estimate else distance
+                heapq.heappush(pq, (priority, distance, v))
+    return INF, []
+
+
+def bidirectional_dijkstra(graph: Any, source: Any, target: Any) -> Tuple[float, List[Any]]:
+    """
+    双向 Dijkstra
+
+    每一步扩展堆顶较小的一侧；每次松弛边时检查经过该边的完整路径并更新最优值，
+    两侧堆顶距离之和不小于最优值时即可停止。有向图需要反向邻接：CSRGraph 会缓存
+    其反向图，有向 Graph 每次调用都要 O(E) 构建，反复查询时应先转换为 CSRGraph。
+
+    Args:
+        graph: Graph 或 CSRGraph（边权非负）
+        source: 起点
+        target: 终点
+
+    Returns:
+        (最短距离, 路径节点列表)；不可达时为 (inf, [])
+    """
+    key_of, label_of, forward = _weighted_adjacency(graph)
+    backward = _reverse_edges(graph)
+    s, t = key_of(source), key_of(target)
+    if s == t:
+        return 0.0, [label_of(s)]
+
+    dists = ({s: 0.0}, {t: 0.0})
+    preds = ({s: None}, {t: None})
+    heaps = ([(0.0, s)], [(0.0, t)])
+    edges = (forward, backward)
+    best, meeting = INF, None
+
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        d, u = heapq.heappop(heaps[side])
+        dist, other, pred = dists[side], dists[1 - side], preds[side]
+        if d > dist[u]:
+            continue
+        for v, weight in edges[side](u):
+            distance = d + weight
+            if distance < dist.get(v, INF):
+                dist[v] = distance
+                pred[v] = u
+                heapq.heappush(heaps[side], (distance, v))
+            if v in other and distance + other[v] < best:
+                best = distance + other[v]
+                # 以原图方向记录相遇边 a -> b
+                meeting = (u, v) if side == 0 else (v, u)
+
+    if meeting is None:
+        return INF, []
+    a, b = meeting
+    path = _path(preds[0], a, label_of)
+    while b is not None:
+        path.append(label_of(b))
+        b = preds[1][b]
+    return best, path
+
+
+def dijkstra_distances(adjacency: Dict[Any, List[Tuple[Any, float]]],
+                       source: Any) -> Dict[Any, float]:
+    """
+    邻接表上的单源 Dijkstra
+
+    平均出度不低于 INDEXED_HEAP_MIN_DEGREE 时使用索引堆（decrease_key，堆大小不超过节点数），
+    否则使用 heapq 并跳过过期的堆项。
+
+    Args:
+        adjacency: {节点编号: [(邻居, 边权), ...]}，边权非负
+        source: 起始节点
+
+    Returns:
+        {节点编号: 最短距离}，adjacency 中不可达的节点为 inf
+    """
+    if sum(map(len, adjacency.values())) >= INDEXED_HEAP_MIN_DEGREE * len(adjacency):
+        return _dense_dijkstra(adjacency, source)
+
+    distances = {source: 0}
+    pq = [(0, source)]
+    while pq:
+        current_dist, current = heapq.heappop(pq)
+        # 跳过过期的堆项（该节点已以更短距离出堆）
+        if current_dist > distances[current]:
+            continue
+        for neighbor, weight in adjacency.get(current, ()):
+            distance = current_dist + weight
+            if distance < distances.get(neighbor, INF):
+                distances[neighbor] = distance
+                heapq.heappush(pq, (distance, neighbor))
+
+    result = dict.fromkeys(adjacency, INF)
+    result.update(distances)
+    return result
+
+
+def _dense_dijkstra(adjacency: Dict[Any, List[Tuple[Any, float]]],
+                    source: Any) -> Dict[Any, float]:
+    """
+    邻接表上的单源 Dijkstra（索引堆版本，供稠密图使用）
+
+    有出边的节点映射为连续下标，距离保存在列表中并直接作为索引堆的优先级，
+    堆大小不超过节点数；没有出边的节点（有向图的汇点）不会被扩展，单独记录最短距离。
+
+    Returns:
+        {节点编号: 最短距离}，不可达节点为 inf
+    """
+    nodes = list(adjacency)
+    if source not in adjacency:
+        nodes.append(source)
+    index = dict(zip(nodes, range(len(nodes))))
+    dist = [INF] * len(nodes)
+    sinks: Dict[Any, float] = {}
+    heap = IndexedHeap(len(nodes), keys=dist)
+    heap.push(index[source], 0)
+    pop, push_or_decrease = heap.pop, heap.push_or_decrease
+
+    while heap:
+        u, d = pop()
+        for node, weight in adjacency.get(nodes[u], ()):
+            distance = d + weight
+            v = index.get(node)
+            if v is None:
+                if distance < sinks.get(node, INF):
+                    sinks[node] = distance
+            elif distance < dist[v]:
+                push_or_decrease(v, distance)
+
+    result = dict(zip(nodes, dist))
+    result.update(sinks)
+    return result
+
+
+def _path(pred: Dict[Any, Any], node: Any, label_of: Callable[[Any], Any]) -> List[Any]:
+    """沿前驱表从 node 回溯到起点，返回起点到 node 的路径"""
+    path = []
+    while node is not None:
+        path.append(label_of(node))
+        node = pred[node]
+    path.reverse()
+    return path
+
+
+def _weighted_adjacency(graph: Any) -> Tuple[Callable[[Any], Any], Callable[[Any], Any],
+                                             Callable[[Any], Iterable[Tuple[Any, float]]]]:
+    """
+    统一 Graph 与 CSRGraph 的带权邻接接口
+
+    Returns:
+        (节点编号 -> 键, 键 -> 节点编号, 键 -> (邻居键, 权重) 可迭代对象)
+    """
+    if isinstance(graph, CSRGraph):
+        label = _identity if graph.node_ids is None else scalar_view(graph.node_ids).__getitem__
+        return graph.index_of, label, _csr_edges(graph)
+    adjacency = graph.graph
+    return _identity, _identity, lambda u: adjacency.get(u, ())
+
+
+def _reverse_edges(graph: Any) -> Callable[[Any], Iterable[Tuple[Any, float]]]:
+    """反向图的带权邻接函数"""
+    if isinstance(graph, CSRGraph):
+        return _csr_edges(graph.reverse())
+    if not graph.directed:
+        adjacency = graph.graph
+        return lambda u: adjacency.get(u, ())
+
+    reverse = defaultdict(list)
+    for u, neighbors in graph.graph.items():
+        for v, weight in neighbors:
+            reverse[v].append((u, weight))
+    return lambda u: reverse.get(u, ())
+
+
+def _csr_edges(graph: CSRGraph) -> Callable[[int], Iterable[Tuple[int, float]]]:
+    indptr = scalar_view(graph.indptr)
+    indices = scalar_view(graph.indices)
+    weights = scalar_view(graph.weights)
+
+    def edges(u: int) -> Iterable[Tuple[int, float]]:
+        start, end = indptr[u], indptr[u + 1]
+        return zip(indices[start:end], weights[start:end])
+    return edges
+
+
+__all__ = [
+    "shortest_path",
+    "astar",
+    "bidirectional_dijkstra",
+    "dijkstra_distances",
+]
@@ -0,0 +1,130 @@
+"""
+图遍历生成器
+
+非递归的广度 / 深度优先遍历，以惰性生成器的形式逐个产出节点：调用方可以随时停止，
+不必先得到完整的遍历序列。节点在入队 / 入栈时即被标记，每个节点最多入队一次；
+深度优先遍历使用显式栈，深度不受 Python 递归上限限制。
+
+Graph 与 CSRGraph 均可作为输入；CSRGraph 在内部下标空间上遍历，
+访问标记使用 bytearray，产出时再转换为节点编号。
+"""
+
+from collections import defaultdict, deque
+from operator import itemgetter
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
+
+from ..dtypes import scalar_view
+from .csr import CSRGraph
+
+ORDERS = ("pre", "post")
+
+
+def iter_bfs(graph: Any, start: int, with_depth: bool = False,
+             max_depth: Optional[int] = None) -> Iterator[Any]:
+    """
+    惰性广度优先遍历
+
+    Args:
+        graph: Graph 或 CSRGraph
+        start: 起始节点
+        with_depth: 是否同时产出节点深度（起始节点深度为 0）
+        max_depth: 最大遍历深度，默认不限
+
+    Yields:
+        节点编号；with_depth=True 时为 (节点编号, 深度)
+    """
+    s, neighbors, visited, label = _adjacency(graph, start)
+    visited[s] = True
+    queue = deque([(s, 0)])
+
+    while queue:
+        u, depth = queue.popleft()
+        yield (label(u), depth) if with_depth else label(u)
+        if max_depth is not None and depth >= max_depth:
+            continue
+        for v in neighbors(u):
+            if not visited[v]:
+                visited[v] = True
+                queue.append((v, depth + 1))
+
+
+def iter_dfs(graph: Any, start: int, order: str = "pre", with_depth: bool = False,
+             max_depth: Optional[int] = None) -> Iterator[Any]:
+    """
+    惰性深度优先遍历
+
+    访问顺序与递归 DFS 相同：按邻接顺序选择第一个未访问的邻居深入。
+
+    Args:
+        graph: Graph 或 CSRGraph
+        start: 起始节点
+        order: 'pre' 按先序（首次到达时）产出，'post' 按后序（全部后代访问完毕时）产出
+        with_depth: 是否同时产出节点深度（起始节点深度为 0）
+        max_depth: 最大遍历深度，默认不限
+
+    Yields:
+        节点编号；with_depth=True 时为 (节点编号, 深度)
+    """
+    if order not in ORDERS:
+        raise ValueError(f"order must be one of {ORDERS}")
+    pre = order == "pre"
+    s, neighbors, visited, label = _adjacency(graph, start)
+    visited[s] = True
+    if pre:
+        yield (label(s), 0) if with_depth else label(s)
+    if max_depth is not None and max_depth <= 0:
+        if not pre:
+            yield (label(s), 0) if with_depth else label(s)
+        return
+
+    # 栈中每一项为 (节点, 该节点尚未检查的邻居迭代器)，栈深即下一个节点的深度
+    stack = [(s, iter(neighbors(s)))]
+    while stack:
+        u, remaining = stack[-1]
+        for v in remaining:
+            if visited[v]:
+                continue
+            visited[v] = True
+            depth = len(stack)
+            if pre:
+                yield (label(v), depth) if with_depth else label(v)
+            if max_depth is None or depth < max_depth:
+                stack.append((v, iter(neighbors(v))))
+            elif not pre:
+                yield (label(v), depth) if with_depth else label(v)
+            break
+        else:
+            stack.pop()
+            if not pre:
+                yield (label(u), len(stack)) if with_depth else label(u)
+
+
+def _adjacency(graph: Any, start: int) -> Tuple[int, Callable[[int], Iterable[int]], Any,
+                                                  Callable[[int], Any]]:
+    """
+    统一 Graph 与 CSRGraph 的遍历接口
+
+    Returns:
+        (起始键, 邻居函数, 访问标记, 键 -> 节点编号函数)；
+        访问标记统一用 marks[key] 读取、marks[key] = True 设置
+    """
+    if isinstance(graph, CSRGraph):
+        indptr = scalar_view(graph.indptr)
+        indices = scalar_view(graph.indices)
+        label = _identity if graph.node_ids is None else scalar_view(graph.node_ids).__getitem__
+        return (graph.index_of(start), lambda u: indices[indptr[u]:indptr[u + 1]],
+                bytearray(graph.num_nodes), label)
+
+    adjacency = graph.graph
+    first = itemgetter(0)
+    return start, lambda u: map(first, adjacency.get(u, ())), defaultdict(bool), _identity
+
+
+def _identity(node: Any) -> Any:
+    return node
+
+
+__all__ = [
+    "iter_bfs",
+    "iter_dfs",
+]
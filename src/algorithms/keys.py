@@ -0,0 +1,99 @@
+"""
+关键字预计算模块
+
+排序与搜索共用的"装饰-排序-还原"层：每个元素的关键字只计算一次，
+算法在关键字数组上比较，元素随关键字同步移动，最后直接取回元素。
+同时提供 CountingKey 用于统计关键字函数的调用次数。
+"""
+
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+
+class CountingKey:
+    """
+    带调用计数的关键字函数包装器
+
+    用法::
+
+        counted = CountingKey(parse_timestamp)
+        quick_sort(records, key=counted)
+        assert counted.calls == len(records)
+    """
+
+    def __init__(self, func: Callable[[Any], Any]):
+        self.func = func
+        self.calls = 0
+
+    def __call__(self, x: Any) -> Any:
+        self.calls += 1
+        return self.func(x)
+
+    def reset(self):
+        """清零调用计数"""
+        self.calls = 0
+
+
+def precompute_keys(arr: Iterable[Any], key: Optional[Callable[[Any], Any]] = None) -> List[Any]:
+    """
+    为每个元素计算一次关键字
+
+    Args:
+        arr: 元素序列
+        key: 关键字函数，为 None 时关键字即元素本身
+
+    Returns:
+        与 arr 对齐的关键字列表
+    """
+    if key is None:
+        return list(arr)
+    return [key(x) for x in arr]
+
+
+def decorate(arr: Iterable[Any],
+             key: Optional[Callable[[Any], Any]] = None) -> Tuple[List[Any], Optional[List[Any]]]:
+    """
+    拆分为关键字数组与元素数组
+
+    Args:
+        arr: 元素序列
+        key: 关键字函数
+
+    Returns:
+        (keys, items)；key 为 None 时 keys 就是元素副本，items 为 None
+    """
+    items = list(arr)
+    if key is None:
+        return items, None
+    return [key(x) for x in items], items
+
+
+def undecorate(keys: List[Any], items: Optional[List[Any]]) -> List[Any]:
+    """取回排序后的元素"""
+    return keys if items is None else items
+
+
+def decorated_sort(arr: Iterable[Any], key: Optional[Callable[[Any], Any]],
+                   engine: Callable[[List[Any], Optional[List[Any]]], None]) -> List[Any]:
+    """
+    用原地排序引擎对元素排序，关键字函数对每个元素只调用一次
+
+    Args:
+        arr: 待排序元素
+        key: 关键字函数
+        engine: 原地排序引擎，签名为 engine(keys, items)
+
+    Returns:
+        排序后的新列表
+    """
+    keys, items = decorate(arr, key)
+    engine(keys, items)
+    return undecorate(keys, items)
+
+
+__all__ = [
+    "CountingKey",
+    "precompute_keys",
+    "decorate",
+    "undecorate",
+    "decorated_sort",
+]
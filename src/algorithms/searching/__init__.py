@@ -1,22 +1,44 @@
 """
 搜索算法模块
 
-实现各种经典搜索算法
+实现各种经典搜索算法，另提供基于 NumPy 的批量向量化搜索与静态搜索索引
 """
 
-from typing import List, TypeVar, Optional, Callable
+import itertools
+import math
+from bisect import bisect_left, bisect_right
+from typing import Any, List, Sequence, Tuple, TypeVar, Optional, Callable
+
+import numpy as np
+
+from ..dtypes import as_numeric_array
+from .blocked import blocked_jump_search
+from .vectorized import (
+    binary_search_many,
+    lower_bound_many,
+    upper_bound_many,
+    equal_range_many,
+    count_range_many,
+)
+from .static_index import StaticSearchIndex
+from .lookup import LookupIndex
 
 T = TypeVar('T')
 
 
-def binary_search(arr: List[T], target: T, key: Optional[Callable[[T], any]] = None) -> int:
+def binary_search(arr: List[T], target: T, key: Optional[Callable[[T], any]] = None,
+                  keys: Optional[Sequence[Any]] = None) -> int:
     """
     二分搜索
+
+    对同一数组反复搜索时，可先用 ``algorithms.keys.precompute_keys(arr, key)`` 算好关键字并通过
+    ``keys`` 传入，此后搜索不再对数组元素调用 key；否则每次探测最多调用一次 key。
     
     Args:
         arr: 有序数组
         target: 目标值
         key: 比较关键字函数
+        keys: 预先计算好的、与 arr 对齐的关键字数组（可选）
         
     Returns:
         目标值的索引，如果不存在则返回-1
@@ -26,7 +48,10 @@ def binary_search(arr: List[T], target: T, key: Optional[Callable[[T], any]] = N
     
     while left <= right:
         mid = (left + right) // 2
-        mid_key = key(arr[mid]) if key else arr[mid]
+        if keys is not None:
+            mid_key = keys[mid]
+        else:
+            mid_key = key(arr[mid]) if key else arr[mid]
         
         if mid_key == target_key:
             return mid
@@ -38,9 +63,97 @@ def binary_search(arr: List[T], target: T, key: Optional[Callable[[T], any]] = N
     return -1
 
 
+def lower_bound(arr: List[T], target: T, key: Optional[Callable[[T], any]] = None,
+                keys: Optional[Sequence[Any]] = None) -> int:
+    """
+    下界：第一个不小于目标值的位置
+
+    与 binary_search 一致，key 同时作用于数组元素与目标值；
+    传入预先计算的 keys 且不传 key 时，target 直接视为关键字。
+
+    Args:
+        arr: 有序数组
+        target: 目标值
+        key: 比较关键字函数
+        keys: 预先计算好的、与 arr 对齐的关键字数组（可选）
+
+    Returns:
+        插入位置，范围为 [0, len(arr)]
+    """
+    return _bound(arr, target, key, keys, upper=False)
+
+
+def upper_bound(arr: List[T], target: T, key: Optional[Callable[[T], any]] = None,
+                keys: Optional[Sequence[Any]] = None) -> int:
+    """
+    上界：第一个大于目标值的位置
+
+    Args:
+        arr: 有序数组
+        target: 目标值
+        key: 比较关键字函数
+        keys: 预先计算好的、与 arr 对齐的关键字数组（可选）
+
+    Returns:
+        插入位置，范围为 [0, len(arr)]
+    """
+    return _bound(arr, target, key, keys, upper=True)
+
+
+def equal_range(arr: List[T], target: T, key: Optional[Callable[[T], any]] = None,
+                keys: Optional[Sequence[Any]] = None) -> Tuple[int, int]:
+    """
+    等值区间：所有等于目标值的元素位于 arr[first:last]
+
+    Returns:
+        (first, last)，目标不存在时 first == last
+    """
+    return (lower_bound(arr, target, key, keys), upper_bound(arr, target, key, keys))
+
+
+def count_range(arr: List[T], lo: T, hi: T, key: Optional[Callable[[T], any]] = None,
+                keys: Optional[Sequence[Any]] = None) -> int:
+    """
+    区间计数：统计落在 [lo, hi) 内的元素个数，O(log n)
+
+    对应的元素为 arr[lower_bound(arr, lo):lower_bound(arr, hi)]
+
+    Args:
+        arr: 有序数组
+        lo: 区间下界（包含）
+        hi: 区间上界（不包含）
+        key: 比较关键字函数
+        keys: 预先计算好的、与 arr 对齐的关键字数组（可选）
+
+    Returns:
+        元素个数
+    """
+    return max(0, lower_bound(arr, hi, key, keys) - lower_bound(arr, lo, key, keys))
+
+
+def _bound(arr: List[T], target: T, key: Optional[Callable[[T], any]],
+           keys: Optional[Sequence[Any]], upper: bool) -> int:
+    target_key = key(target) if key else target
+    if keys is not None or key is None:
+        seq = keys if keys is not None else arr
+        return bisect_right(seq, target_key) if upper else bisect_left(seq, target_key)
+
+    left, right = 0, len(arr)
+    while left < right:
+        mid = (left + right) // 2
+        mid_key = key(arr[mid])
+        if mid_key < target_key or (upper and mid_key == target_key):
+            left = mid + 1
+        else:
+            right = mid
+    return left
+
+
 def linear_search(arr: List[T], target: T) -> int:
     """
     线性搜索
+
+    对同一数组反复查询时，可先构建 ``LookupIndex(arr)``，此后每次查询为 O(1)
     
     Args:
         arr: 数组
@@ -58,39 +171,221 @@ def linear_search(arr: List[T], target: T) -> int:
 def jump_search(arr: List[T], target: T) -> int:
     """
     跳跃搜索
+
+    以 sqrt(n) 为步长逐块跳跃，找到第一个末元素不小于目标的块后在块内二分定位。
+    传入一维数值 ndarray 时改用分块向量化实现 blocked_jump_search。
     
     Args:
         arr: 有序数组
         target: 目标值
         
+    Returns:
+        目标值的索引（存在重复值时为最左侧），如果不存在则返回-1
+    """
+    if isinstance(arr, np.ndarray) and as_numeric_array(arr) is not None:
+        return blocked_jump_search(arr, target)
+
+    n = len(arr)
+    if n == 0:
+        return -1
+
+    step = max(1, math.isqrt(n))
+    start, end = 0, step
+    while end < n and arr[end - 1] < target:
+        start, end = end, end + step
+
+    pos = bisect_left(arr, target, start, min(end, n))
+    if pos < n and arr[pos] == target:
+        return pos
+    return -1
+
+
+def interpolation_search(arr: Sequence[Any], target: Any) -> int:
+    """
+    插值搜索
+
+    按目标值在区间端点之间的比例估计探测位置，并在目标一侧放置哨兵探测，
+    数值近似均匀分布时期望 O(log log n) 次探测。若连续两轮都没能把区间缩小到
+    3/4 以内（数据偏斜或聚集），剩余区间退化为二分搜索，最坏仍为 O(log n)。
+
+    Args:
+        arr: 有序数值数组
+        target: 目标值
+
     Returns:
         目标值的索引，如果不存在则返回-1
     """
-    import math
-    
     n = len(arr)
-    step = int(math.sqrt(n))
-    prev = 0
-    
-    while arr[min(step, n) - 1] < target:
-        prev = step
-        step += int(math.sqrt(n))
-        if prev >= n:
+    if n == 0:
+        return -1
+    lo, hi = 0, n - 1
+    low_val, high_val = arr[lo], arr[hi]
+    if target < low_val or high_val < target:
+        return -1
+    if low_val == target:
+        return lo
+    if high_val == target:
+        return hi
+
+    # 不变式：low_val < target < high_val，目标只可能位于 (lo, hi)；
+    # 端点值缓存在局部变量中。插值误差约为 sqrt(区间长度)，因此每次插值探测后
+    # 再向目标方向以 sqrt 步长放一个哨兵探测，把目标夹在较小的区间内
+    poor_steps = 0
+    while hi - lo > 1:
+        old_size = hi - lo
+        # 用 Python float 计算比例：NumPy 定长整数相乘在大数值键上会溢出
+        ratio = (float(target) - float(low_val)) / (float(high_val) - float(low_val))
+        if not math.isfinite(ratio):
+            # 端点为 ±inf（或差值溢出）时比例为 NaN / inf，无法插值
+            return _binary_search_range(arr, target, lo + 1, hi - 1)
+        pos = lo + int(ratio * old_size)
+        pos = min(max(pos, lo + 1), hi - 1)
+        value = arr[pos]
+        if value == target:
+            return pos
+
+        gap = max(1, math.isqrt(old_size))
+        if value < target:
+            lo, low_val = pos, value
+            guard = pos + gap
+            if guard < hi:
+                guard_val = arr[guard]
+                if guard_val == target:
+                    return guard
+                if target < guard_val:
+                    hi, high_val = guard, guard_val
+                else:
+                    lo, low_val = guard, guard_val
+        else:
+            hi, high_val = pos, value
+            guard = pos - gap
+            if guard > lo:
+                guard_val = arr[guard]
+                if guard_val == target:
+                    return guard
+                if guard_val < target:
+                    lo, low_val = guard, guard_val
+                else:
+                    hi, high_val = guard, guard_val
+
+        if hi - lo > old_size * 3 // 4:
+            poor_steps += 1
+            if poor_steps >= 2:
+                return _binary_search_range(arr, target, lo + 1, hi - 1)
+        else:
+            poor_steps = 0
+
+    return -1
+
+
+def exponential_search(arr: Any, target: Any) -> int:
+    """
+    指数搜索
+
+    以 1, 2, 4, ... 的步长倍增找到包含目标的区间，再在区间内二分，
+    O(log i)（i 为目标位置），适合目标靠前的超大数组。支持三类输入：
+    - 序列（支持 len 与下标访问）
+    - 无界的下标访问对象（只支持 __getitem__，越界时抛出 IndexError）
+    - 迭代器 / 数据流：按倍增的块大小读取，只在内存中保留当前块
+
+    Args:
+        arr: 有序序列、无界下标访问对象或有序迭代器
+        target: 目标值
+
+    Returns:
+        目标值的索引，如果不存在则返回-1
+    """
+    if not hasattr(arr, "__getitem__"):
+        return _exponential_search_stream(iter(arr), target)
+
+    try:
+        n = len(arr)
+    except TypeError:
+        n = None
+
+    if n == 0:
+        return -1
+    if n is None:
+        try:
+            arr[0]
+        except IndexError:
             return -1
-    
-    while arr[prev] < target:
-        prev += 1
-        if prev == min(step, n):
+
+    bound = 1
+    exhausted = False
+    try:
+        while (n is None or bound < n) and arr[bound] < target:
+            bound *= 2
+    except IndexError:
+        exhausted = True
+
+    if n is not None:
+        hi = min(bound, n - 1)
+    elif exhausted:
+        # 无界序列越界时，先找到实际可访问的右端
+        hi = _last_valid_index(arr, bound // 2, bound - 1)
+    else:
+        hi = bound
+    return _binary_search_range(arr, target, bound // 2, hi)
+
+
+def _exponential_search_stream(iterator: Any, target: Any) -> int:
+    """对有序迭代器做指数搜索，块大小倍增，只保留当前块"""
+    offset = 0
+    size = 1
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
             return -1
-    
-    if arr[prev] == target:
-        return prev
-    
+        if not chunk[-1] < target:
+            pos = bisect_left(chunk, target)
+            return offset + pos if chunk[pos] == target else -1
+        offset += len(chunk)
+        size *= 2
+
+
+def _last_valid_index(arr: Any, lo: int, hi: int) -> int:
+    """在 [lo, hi] 中二分查找无界序列最后一个可访问的下标"""
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        try:
+            arr[mid]
+            lo = mid
+        except IndexError:
+            hi = mid - 1
+    return lo
+
+
+def _binary_search_range(arr: Sequence[Any], target: Any, left: int, right: int) -> int:
+    """在闭区间 [left, right] 内二分搜索"""
+    while left <= right:
+        mid = (left + right) // 2
+        value = arr[mid]
+        if value == target:
+            return mid
+        elif value < target:
+            left = mid + 1
+        else:
+            right = mid - 1
     return -1
 
 
 __all__ = [
     "binary_search",
+    "lower_bound",
+    "upper_bound",
+    "equal_range",
+    "count_range",
     "linear_search",
     "jump_search",
+    "blocked_jump_search",
+    "interpolation_search",
+    "exponential_search",
+    "binary_search_many",
+    "lower_bound_many",
+    "upper_bound_many",
+    "equal_range_many",
+    "count_range_many",
+    "StaticSearchIndex",
+    "LookupIndex",
 ]
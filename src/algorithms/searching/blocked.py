@@ -0,0 +1,79 @@
+"""
+分块向量化跳跃搜索
+
+跳跃搜索的 NumPy 版本：每一层用一次向量化比较统计"有多少个块的末元素小于目标"，
+直接得到目标所在的块，不再逐块跳跃；块内同样用一次连续内存上的向量化比较定位。
+
+块大小按缓存行对齐：最细一层的块恰好是一条缓存行中的元素个数，更粗的层是它的整数倍，
+因此块边界与缓存行边界对齐，块内扫描不会跨越多余的缓存行。层数按数组规模选择，
+使每层比较的块数不超过 MAX_JUMP_FANOUT，大数组上不会因单层块数过多而扫描大量内存。
+"""
+
+import math
+from typing import Any, List, Optional
+
+import numpy as np
+
+# 缓存行字节数
+CACHE_LINE_BYTES = 64
+
+# 每一层最多比较的块数
+MAX_JUMP_FANOUT = 1024
+
+
+def jump_strides(n: int, block_size: int) -> List[int]:
+    """
+    计算各层的跳跃步长（由粗到细，最后一层为 block_size）
+
+    Args:
+        n: 数组长度
+        block_size: 最细一层的块大小（元素个数）
+
+    Returns:
+        步长列表
+    """
+    blocks = max(1, math.ceil(n / block_size))
+    levels = max(1, math.ceil(math.log(blocks, MAX_JUMP_FANOUT))) if blocks > 1 else 1
+    fanout = max(2, math.ceil(blocks ** (1 / levels)))
+    return [block_size * fanout ** i for i in range(levels - 1, -1, -1)]
+
+
+def blocked_jump_search(arr: np.ndarray, target: Any, block_size: Optional[int] = None) -> int:
+    """
+    分块向量化跳跃搜索
+
+    Args:
+        arr: 有序的一维数值 ndarray
+        target: 目标值
+        block_size: 最细一层的块大小（元素个数），默认为一条缓存行能容纳的元素个数
+
+    Returns:
+        目标值的索引（存在重复值时为最左侧），如果不存在则返回-1
+    """
+    n = len(arr)
+    if n == 0:
+        return -1
+    if block_size is None:
+        block_size = max(1, CACHE_LINE_BYTES // arr.dtype.itemsize)
+    elif block_size <= 0:
+        raise ValueError("block_size must be positive")
+
+    lo, hi = 0, n
+    for stride in jump_strides(n, block_size):
+        # 区间内各块的末元素（步长视图，不复制），小于目标的块都可以整块跳过
+        ends = arr[lo + stride - 1:hi:stride]
+        lo += int(np.count_nonzero(ends < target)) * stride
+        hi = min(hi, lo + stride)
+
+    pos = lo + int(np.count_nonzero(arr[lo:hi] < target))
+    if pos < n and arr[pos] == target:
+        return pos
+    return -1
+
+
+__all__ = [
+    "CACHE_LINE_BYTES",
+    "MAX_JUMP_FANOUT",
+    "jump_strides",
+    "blocked_jump_search",
+]
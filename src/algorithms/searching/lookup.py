@@ -0,0 +1,74 @@
+"""
+哈希查找索引
+
+对同一个无序数组反复做 linear_search 时，每次查询都要扫描整个数组。
+LookupIndex 只扫描一次，建立"值 -> 首次出现位置"的哈希表，此后每次查询 O(1)，
+结果与 linear_search 完全一致（返回第一个相等元素的下标）。
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+
+class LookupIndex:
+    """无序数组上的哈希查找索引"""
+
+    def __init__(self, arr: Sequence[Any], key: Optional[Callable[[Any], Any]] = None):
+        """
+        Args:
+            arr: 数组（无需有序，元素或其关键字须可哈希）
+            key: 关键字函数，同时作用于数组元素与查询目标；每个元素只计算一次
+        """
+        self.key = key
+        self._size = len(arr)
+        keys = arr if key is None else [key(x) for x in arr]
+        # 倒序写入字典，后写入的较小下标覆盖较大下标，最终保留首次出现的位置
+        self._positions: Dict[Any, int] = dict(
+            zip(reversed(keys), range(self._size - 1, -1, -1))
+        )
+
+    def __len__(self) -> int:
+        """原数组长度"""
+        return self._size
+
+    def __contains__(self, target: Any) -> bool:
+        return self.index_of(target) != -1
+
+    @property
+    def distinct_count(self) -> int:
+        """不同关键字的个数"""
+        return len(self._positions)
+
+    def index_of(self, target: Any) -> int:
+        """
+        查找目标值
+
+        Args:
+            target: 目标值
+
+        Returns:
+            目标值首次出现的索引，如果不存在则返回-1
+        """
+        if self.key is not None:
+            target = self.key(target)
+        try:
+            return self._positions.get(target, -1)
+        except TypeError:
+            # 不可哈希的目标不可能等于任何已索引的元素
+            return -1
+
+    def search_many(self, targets: Iterable[Any]) -> List[int]:
+        """
+        批量查找
+
+        Args:
+            targets: 目标值序列
+
+        Returns:
+            与 targets 等长的索引列表，不存在的目标为 -1
+        """
+        return [self.index_of(target) for target in targets]
+
+
+__all__ = [
+    "LookupIndex",
+]
@@ -0,0 +1,272 @@
+"""
+静态搜索索引（Eytzinger 布局）
+
+针对构建后不再变化的有序数组：把关键字按层序（Eytzinger 布局，节点 k 的子节点为
+2k 与 2k+1）存放在一块连续的 NumPy 缓冲区中。所有查询共享的顶部若干层集中在缓冲区
+开头、常驻缓存，而对有序数组二分时前几次探测分散在整个数组上。
+
+树被补齐为满二叉树（末尾用哨兵填充），每次查找恰好下降 height 层，下降结束时的
+叶位置直接给出下界在原有序数组中的秩，不需要额外存储秩数组。
+
+索引可以保存为带头部的二进制文件，并以只读内存映射方式加载：多个 API worker
+进程映射同一文件时共享操作系统的页缓存，物理内存中只有一份索引。
+"""
+
+import os
+import struct
+from typing import Any
+
+import numpy as np
+
+from ..dtypes import NUMERIC_KINDS, PathLike, scalar_view
+
+# 文件格式：魔数、版本、树高、元素个数、dtype 字符串；头部补齐到 64 字节，
+# 使数据区按缓存行对齐
+MAGIC = b"SSIDX\x00\x00\x00"
+FORMAT_VERSION = 1
+HEADER_SIZE = 64
+_HEADER = struct.Struct("<8sIIQ16s")
+
+
+class StaticSearchIndex:
+    """
+    只读有序数组上的静态搜索索引
+
+    查询返回的下标均为原有序数组中的位置，语义与 binary_search / lower_bound /
+    upper_bound 及其批量版本一致。
+    """
+
+    def __init__(self, sorted_values: Any):
+        """
+        Args:
+            sorted_values: 升序排列的一维数值数组（不含 NaN）
+        """
+        values = np.asarray(sorted_values)
+        if len(values) == 0 and values.dtype.kind not in NUMERIC_KINDS:
+            values = values.astype(np.float64)
+        if values.ndim != 1 or values.dtype.kind not in NUMERIC_KINDS.replace("b", ""):
+            raise TypeError("StaticSearchIndex requires a 1-D numeric array")
+        if values.dtype.kind == "f" and np.isnan(values).any():
+            raise ValueError("StaticSearchIndex does not support NaN values")
+        if len(values) > 1 and np.any(values[1:] < values[:-1]):
+            raise ValueError("StaticSearchIndex requires a sorted array")
+
+        self._init(_build_eytzinger(values, len(values).bit_length()), len(values))
+
+    @classmethod
+    def _from_tree(cls, tree: np.ndarray, size: int) -> "StaticSearchIndex":
+        index = cls.__new__(cls)
+        index._init(tree, size)
+        return index
+
+    def _init(self, tree: np.ndarray, size: int) -> None:
+        self._size = size
+        self._height = size.bit_length()
+        self._tree = tree
+        self._reader = scalar_view(tree).__getitem__
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, target: Any) -> bool:
+        return self.search(target) != -1
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._tree.dtype
+
+    @property
+    def height(self) -> int:
+        """树高，即每次查找的比较次数"""
+        return self._height
+
+    @property
+    def nbytes(self) -> int:
+        """索引缓冲区占用的字节数（含补齐的哨兵）"""
+        return self._tree.nbytes
+
+    def lower_bound(self, target: Any) -> int:
+        """
+        第一个不小于 target 的位置
+
+        Args:
+            target: 目标值
+
+        Returns:
+            插入位置，范围 [0, len(self)]
+        """
+        return self._descend_one(target, strict=True)
+
+    def upper_bound(self, target: Any) -> int:
+        """第一个大于 target 的位置"""
+        return self._descend_one(target, strict=False)
+
+    def search(self, target: Any) -> int:
+        """
+        点查询
+
+        Args:
+            target: 目标值
+
+        Returns:
+            目标值的位置（存在重复值时为最左侧），不存在则返回 -1
+        """
+        rank = self._descend_one(target, strict=True)
+        if rank < self._size and self._tree[self._node_of_rank(rank)] == target:
+            return rank
+        return -1
+
+    def lower_bound_many(self, targets: Any) -> np.ndarray:
+        """
+        批量下界
+
+        所有目标逐层同步下降：每层一次向量化的 gather 与比较，共 height 轮。
+
+        Args:
+            targets: 目标值数组
+
+        Returns:
+            与 targets 等长的插入位置数组
+        """
+        leaves = self._descend_many(np.asarray(targets), strict=True)
+        return np.minimum(leaves - (1 << self._height), self._size)
+
+    def upper_bound_many(self, targets: Any) -> np.ndarray:
+        """批量上界：每个目标第一个大于它的位置"""
+        leaves = self._descend_many(np.asarray(targets), strict=False)
+        return np.minimum(leaves - (1 << self._height), self._size)
+
+    def search_many(self, targets: Any, missing: int = -1) -> np.ndarray:
+        """
+        批量点查询
+
+        Args:
+            targets: 目标值数组
+            missing: 目标不存在时返回的下标
+
+        Returns:
+            与 targets 等长的下标数组；存在重复值时返回最左侧的匹配位置
+        """
+        target_keys = np.asarray(targets)
+        if self._size == 0:
+            return np.full(target_keys.shape, missing, dtype=np.int64)
+        leaves = self._descend_many(target_keys, strict=True)
+        ranks = leaves - (1 << self._height)
+        found = ranks < self._size
+        found &= self._tree[self._nodes_of_ranks(np.minimum(ranks, self._size - 1))] == target_keys
+        return np.where(found, ranks, missing)
+
+    def to_sorted(self) -> np.ndarray:
+        """按原顺序还原有序数组"""
+        ranks = np.arange(self._size, dtype=np.int64)
+        return self._tree[self._nodes_of_ranks(ranks)]
+
+    def save(self, path: PathLike) -> None:
+        """
+        保存为二进制索引文件
+
+        Args:
+            path: 输出文件路径
+        """
+        header = _HEADER.pack(MAGIC, FORMAT_VERSION, self._height, self._size,
+                              self._tree.dtype.str.encode("ascii"))
+        with open(path, "wb") as f:
+            f.write(header.ljust(HEADER_SIZE, b"\0"))
+            np.ascontiguousarray(self._tree).tofile(f)
+
+    @classmethod
+    def load(cls, path: PathLike, mmap: bool = True) -> "StaticSearchIndex":
+        """
+        加载索引文件
+
+        Args:
+            path: save 生成的索引文件路径
+            mmap: 是否以只读内存映射方式加载（数据按需读入，多个进程共享页缓存）
+
+        Returns:
+            StaticSearchIndex 实例
+        """
+        with open(path, "rb") as f:
+            header = f.read(HEADER_SIZE)
+        if len(header) < HEADER_SIZE:
+            raise ValueError("truncated static index file")
+        magic, version, height, size, dtype_str = _HEADER.unpack_from(header)
+        if magic != MAGIC:
+            raise ValueError("not a static search index file")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"unsupported static index version: {version}")
+        if size.bit_length() != height:
+            raise ValueError("corrupt static index header")
+
+        dtype = np.dtype(dtype_str.rstrip(b"\0").decode("ascii"))
+        length = 1 << height
+        if os.path.getsize(path) < HEADER_SIZE + length * dtype.itemsize:
+            raise ValueError("truncated static index file")
+        if mmap:
+            tree = np.memmap(path, dtype=dtype, mode="r", offset=HEADER_SIZE, shape=(length,))
+        else:
+            tree = np.fromfile(path, dtype=dtype, count=length, offset=HEADER_SIZE)
+        return cls._from_tree(tree, size)
+
+    def _descend_one(self, target: Any, strict: bool) -> int:
+        item = self._reader
+        k = 1
+        if strict:
+            for _ in range(self._height):
+                k = 2 * k + 1 if item(k) < target else 2 * k
+        else:
+            for _ in range(self._height):
+                k = 2 * k + 1 if item(k) <= target else 2 * k
+        return min(k - (1 << self._height), self._size)
+
+    def _descend_many(self, targets: np.ndarray, strict: bool) -> np.ndarray:
+        tree = self._tree
+        k = np.ones(targets.shape, dtype=np.int64)
+        for _ in range(self._height):
+            nodes = tree[k]
+            k <<= 1
+            k += (nodes < targets) if strict else (nodes <= targets)
+        return k
+
+    def _node_of_rank(self, rank: int) -> int:
+        # 满二叉树中秩为 rank 的节点：rank+1 的末尾零个数决定节点所在层
+        pos = rank + 1
+        low = pos & -pos
+        return ((1 << self._height) + pos) // (low << 1)
+
+    def _nodes_of_ranks(self, ranks: np.ndarray) -> np.ndarray:
+        pos = ranks + 1
+        low = pos & -pos
+        return ((1 << self._height) + pos) // (low << 1)
+
+
+def _sentinel(dtype: np.dtype) -> Any:
+    """补齐满二叉树用的哨兵：不小于任何合法关键字"""
+    if dtype.kind == "f":
+        return np.inf
+    return np.iinfo(dtype).max
+
+
+def _build_eytzinger(values: np.ndarray, height: int) -> np.ndarray:
+    """
+    按 Eytzinger 布局重排有序数组
+
+    满二叉树中第 depth 层的第 i 个节点（k = 2^depth + i）在中序遍历中的秩为
+    (2i + 1) * 2^(height-1-depth) - 1，逐层向量化填充；秩超出 n 的位置填哨兵。
+    下标 0 不使用。
+    """
+    n = len(values)
+    tree = np.empty(1 << height, dtype=values.dtype)
+    tree[0] = _sentinel(values.dtype)
+    for depth in range(height):
+        first = 1 << depth
+        ranks = ((2 * np.arange(first, dtype=np.int64) + 1) << (height - 1 - depth)) - 1
+        level = tree[first:2 * first]
+        level[:] = values.take(ranks, mode="clip")
+        level[ranks >= n] = _sentinel(values.dtype)
+    return tree
+
+
+__all__ = [
+    "StaticSearchIndex",
+]
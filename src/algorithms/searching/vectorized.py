@@ -0,0 +1,134 @@
+"""
+向量化批量搜索
+
+对同一个有序数组一次查询大量目标：所有目标在一次 np.searchsorted 调用中完成，
+没有逐目标的 Python 循环，可扩展到百万级查询。
+"""
+
+from typing import Any, Callable, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+def as_search_keys(arr: Sequence[Any], keys: Optional[Sequence[Any]] = None,
+                   key: Optional[Callable[[Any], Any]] = None) -> np.ndarray:
+    """
+    准备用于批量搜索的有序关键字数组
+
+    Args:
+        arr: 有序数组
+        keys: 预先计算好的、与 arr 对齐的关键字数组（优先使用）
+        key: 关键字函数；未提供 keys 时对每个元素计算一次
+
+    Returns:
+        一维关键字 ndarray（ndarray 输入不复制）
+    """
+    if keys is not None:
+        return np.asarray(keys)
+    if key is not None:
+        return np.asarray([key(x) for x in arr])
+    return np.asarray(arr)
+
+
+def as_target_keys(targets: Any, key: Optional[Callable[[Any], Any]] = None) -> np.ndarray:
+    """把目标值转换为关键字数组；提供 key 时对每个目标调用一次"""
+    if key is not None:
+        return np.asarray([key(t) for t in targets])
+    return np.asarray(targets)
+
+
+def binary_search_many(arr: Sequence[Any], targets: Any, keys: Optional[Sequence[Any]] = None,
+                       key: Optional[Callable[[Any], Any]] = None,
+                       missing: int = -1) -> np.ndarray:
+    """
+    批量二分搜索
+
+    Args:
+        arr: 有序数组
+        targets: 目标值数组
+        keys: 预先计算好的、与 arr 对齐的关键字数组（可选）
+        key: 比较关键字函数，同时作用于数组元素与目标值
+        missing: 目标不存在时返回的下标
+
+    Returns:
+        与 targets 等长的下标数组；存在重复值时返回最左侧的匹配位置
+    """
+    sorted_keys = as_search_keys(arr, keys, key)
+    target_keys = as_target_keys(targets, key)
+    n = len(sorted_keys)
+    if n == 0:
+        return np.full(target_keys.shape, missing, dtype=np.intp)
+
+    idx = np.searchsorted(sorted_keys, target_keys, side="left")
+    clipped = np.minimum(idx, n - 1)
+    found = (idx < n) & (sorted_keys[clipped] == target_keys)
+    return np.where(found, idx, missing)
+
+
+def lower_bound_many(arr: Sequence[Any], targets: Any, keys: Optional[Sequence[Any]] = None,
+                     key: Optional[Callable[[Any], Any]] = None) -> np.ndarray:
+    """
+    批量下界：每个目标第一个不小于它的位置
+
+    Args:
+        arr: 有序数组
+        targets: 目标值数组
+        keys: 预先计算好的、与 arr 对齐的关键字数组（可选）
+        key: 比较关键字函数，同时作用于数组元素与目标值
+
+    Returns:
+        与 targets 等长的插入位置数组
+    """
+    return np.searchsorted(as_search_keys(arr, keys, key), as_target_keys(targets, key),
+                           side="left")
+
+
+def upper_bound_many(arr: Sequence[Any], targets: Any, keys: Optional[Sequence[Any]] = None,
+                     key: Optional[Callable[[Any], Any]] = None) -> np.ndarray:
+    """
+    批量上界：每个目标第一个大于它的位置
+
+    Returns:
+        与 targets 等长的插入位置数组
+    """
+    return np.searchsorted(as_search_keys(arr, keys, key), as_target_keys(targets, key),
+                           side="right")
+
+
+def equal_range_many(arr: Sequence[Any], targets: Any, keys: Optional[Sequence[Any]] = None,
+                     key: Optional[Callable[[Any], Any]] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    批量等值区间
+
+    Returns:
+        (firsts, lasts)，第 i 个目标的所有匹配位于 arr[firsts[i]:lasts[i]]
+    """
+    sorted_keys = as_search_keys(arr, keys, key)
+    target_keys = as_target_keys(targets, key)
+    return (np.searchsorted(sorted_keys, target_keys, side="left"),
+            np.searchsorted(sorted_keys, target_keys, side="right"))
+
+
+def count_range_many(arr: Sequence[Any], los: Any, his: Any, keys: Optional[Sequence[Any]] = None,
+                     key: Optional[Callable[[Any], Any]] = None) -> np.ndarray:
+    """
+    批量区间计数：统计每个 [los[i], his[i]) 内的元素个数
+
+    Returns:
+        与 los 等长的计数数组
+    """
+    sorted_keys = as_search_keys(arr, keys, key)
+    starts = np.searchsorted(sorted_keys, as_target_keys(los, key), side="left")
+    ends = np.searchsorted(sorted_keys, as_target_keys(his, key), side="left")
+    return np.maximum(ends - starts, 0)
+
+
+__all__ = [
+    "as_search_keys",
+    "as_target_keys",
+    "binary_search_many",
+    "lower_bound_many",
+    "upper_bound_many",
+    "equal_range_many",
+    "count_range_many",
+]
@@ -1,10 +1,25 @@
 """
 排序算法模块
 
-实现各种经典排序算法
+实现各种经典排序算法，另提供面向同构数值数组的 NumPy 向量化后端
+
+带 key 的排序统一走 ``src.algorithms.keys`` 的预计算层：
+每个元素的关键字只计算一次，算法只比较关键字。
 """
 
-from typing import List, TypeVar, Callable, Optional
+from typing import Any, Dict, List, TypeVar, Callable, Optional
+
+from ..dtypes import as_numeric_array
+from ..keys import decorated_sort
+from .introsort import introsort
+from .natural_merge import natural_merge_sort
+from .radix import counting_sort, radix_sort, counting_argsort, radix_argsort
+from .vectorized import vectorized_argsort, vectorized_sort
+from .parallel import parallel_sort
+from .external import external_sort
+from .merging import merge_sorted, merge_sorted_batches
+from .auto import InputProfile, profile_input, choose_engine, select_engine
+from .selection import nth_element, partial_sort, top_k, top_k_indices
 
 T = TypeVar('T')
 
@@ -12,67 +27,95 @@ T = TypeVar('T')
 def quick_sort(arr: List[T], key: Optional[Callable[[T], any]] = None) -> List[T]:
     """
     快速排序
-    
+
+    基于原地内省排序实现：三数取中选枢轴，小区间插入排序，
+    递归过深时退化为堆排序，最坏 O(n log n)，除结果列表外只需 O(log n) 额外空间。
+    不修改输入数组，排序不稳定。
+
     Args:
         arr: 待排序数组
         key: 排序关键字函数
-        
+
     Returns:
         排序后的数组
     """
-    if len(arr) <= 1:
-        return arr
-    
-    pivot = arr[len(arr) // 2]
-    pivot_key = key(pivot) if key else pivot
-    
-    left = [x for x in arr if (key(x) if key else x) < pivot_key]
-    middle = [x for x in arr if (key(x) if key else x) == pivot_key]
-    right = [x for x in arr if (key(x) if key else x) > pivot_key]
-    
-    return quick_sort(left, key) + middle + quick_sort(right, key)
+    return decorated_sort(arr, key, introsort)
 
 
-def merge_sort(arr: List[T], key: Optional[Callable[[T], any]] = None) -> List[T]:
+def merge_sort(arr: List[T], key: Optional[Callable[[T], any]] = None,
+               adaptive: bool = True) -> List[T]:
     """
     归并排序
-    
+
+    默认使用自适应的自然归并：识别输入中已有的升序 / 降序段，
+    借助 galloping 合并，只分配一块辅助缓冲区，近乎有序的输入接近线性时间。
+    ``adaptive=False`` 时使用经典的自顶向下二分归并。排序是稳定的。
+
     Args:
         arr: 待排序数组
         key: 排序关键字函数
-        
+        adaptive: 是否使用自适应自然归并
+
     Returns:
         排序后的数组
     """
-    if len(arr) <= 1:
-        return arr
+    engine = natural_merge_sort if adaptive else _top_down_merge_sort
+    return decorated_sort(arr, key, engine)
+
+
+def _top_down_merge_sort(keys: List[T], items: Optional[List[T]] = None) -> None:
+    """经典自顶向下归并排序，结果写回 keys / items"""
+    sorted_keys, sorted_items = _merge_sort_recursive(keys, items)
+    keys[:] = sorted_keys
+    if items is not None:
+        items[:] = sorted_items
+
+
+def _merge_sort_recursive(keys: List[T], items: Optional[List[T]]):
+    if len(keys) <= 1:
+        return keys, items
     
-    mid = len(arr) // 2
-    left = merge_sort(arr[:mid], key)
-    right = merge_sort(arr[mid:], key)
+    mid = len(keys) // 2
+    left_keys, left_items = _merge_sort_recursive(
+        keys[:mid], items[:mid] if items is not None else None
+    )
+    right_keys, right_items = _merge_sort_recursive(
+        keys[mid:], items[mid:] if items is not None else None
+    )
     
-    return _merge(left, right, key)
+    return _merge(left_keys, right_keys, left_items, right_items)
 
 
-def _merge(left: List[T], right: List[T], key: Optional[Callable[[T], any]] = None) -> List[T]:
-    """合并两个有序数组"""
+def _merge(left: List[T], right: List[T], left_items: Optional[List[T]] = None,
+           right_items: Optional[List[T]] = None):
+    """
+    合并两个有序的关键字数组
+
+    Returns:
+        (合并后的关键字, 合并后的元素)；未给出元素数组时后者为 None
+    """
     result = []
+    result_items = [] if left_items is not None else None
     i = j = 0
     
     while i < len(left) and j < len(right):
-        left_key = key(left[i]) if key else left[i]
-        right_key = key(right[j]) if key else right[j]
-        
-        if left_key <= right_key:
+        if left[i] <= right[j]:
             result.append(left[i])
+            if result_items is not None:
+                result_items.append(left_items[i])
             i += 1
         else:
             result.append(right[j])
+            if result_items is not None:
+                result_items.append(right_items[j])
             j += 1
     
     result.extend(left[i:])
     result.extend(right[j:])
-    return result
+    if result_items is not None:
+        result_items.extend(left_items[i:])
+        result_items.extend(right_items[j:])
+    return result, result_items
 
 
 def bubble_sort(arr: List[T], key: Optional[Callable[[T], any]] = None) -> List[T]:
@@ -86,27 +129,105 @@ def bubble_sort(arr: List[T], key: Optional[Callable[[T], any]] = None) -> List[
     Returns:
         排序后的数组
     """
-    arr = arr.copy()
-    n = len(arr)
+    return decorated_sort(arr, key, _bubble_sort)
+
+
+def _bubble_sort(keys: List[T], items: Optional[List[T]] = None) -> None:
+    """原地冒泡排序"""
+    n = len(keys)
     
     for i in range(n):
         swapped = False
         for j in range(0, n - i - 1):
-            val_j = key(arr[j]) if key else arr[j]
-            val_j1 = key(arr[j + 1]) if key else arr[j + 1]
-            
-            if val_j > val_j1:
-                arr[j], arr[j + 1] = arr[j + 1], arr[j]
+            if keys[j] > keys[j + 1]:
+                keys[j], keys[j + 1] = keys[j + 1], keys[j]
+                if items is not None:
+                    items[j], items[j + 1] = items[j + 1], items[j]
                 swapped = True
         
         if not swapped:
             break
-    
-    return arr
+
+
+def _python_engine(func: Callable[..., List[T]]) -> Callable[..., List[T]]:
+    """把纯 Python 排序包装为支持 reverse 的统一引擎接口"""
+    def run(arr, key=None, reverse=False):
+        if not reverse:
+            return func(list(arr), key)
+        # 先反转再升序排序、最后反转，稳定引擎下相等元素仍保持原有顺序
+        return func(list(arr)[::-1], key)[::-1]
+    return run
+
+
+def _numeric_engine(func: Callable[..., Any]) -> Callable[..., Any]:
+    """数值引擎不接受 key"""
+    def run(arr, key=None, reverse=False):
+        if key is not None:
+            raise ValueError(f"{func.__name__} does not accept a key function")
+        return func(arr, reverse=reverse)
+    return run
+
+
+SORT_ENGINES: Dict[str, Callable[..., Any]] = {
+    "quick_sort": _python_engine(quick_sort),
+    "merge_sort": _python_engine(merge_sort),
+    "bubble_sort": _python_engine(bubble_sort),
+    "vectorized_sort": _numeric_engine(vectorized_sort),
+    "parallel_sort": _numeric_engine(parallel_sort),
+    "counting_sort": counting_sort,
+    "radix_sort": radix_sort,
+}
+
+
+def sort(arr: Any, key: Optional[Callable[[Any], Any]] = None, reverse: bool = False,
+         algorithm: str = "auto") -> Any:
+    """
+    通用排序入口
+
+    默认 ``algorithm="auto"``：对输入做画像（规模、有序程度、重复率、dtype、是否带 key），
+    分派到最快的可用引擎并记录选择原因。也可以指定 SORT_ENGINES 中的引擎名称。
+
+    Args:
+        arr: 待排序数据
+        key: 排序关键字函数
+        reverse: 是否降序
+        algorithm: 引擎名称或 'auto'
+
+    Returns:
+        排序结果；数值引擎保持输入的容器类型，其余返回列表
+    """
+    if algorithm == "auto":
+        algorithm, _ = select_engine(arr, key)
+    if algorithm not in SORT_ENGINES:
+        raise ValueError(f"unknown sort algorithm: {algorithm}")
+    return SORT_ENGINES[algorithm](arr, key=key, reverse=reverse)
 
 
 __all__ = [
+    "introsort",
+    "natural_merge_sort",
     "quick_sort",
     "merge_sort",
     "bubble_sort",
+    "as_numeric_array",
+    "vectorized_argsort",
+    "vectorized_sort",
+    "counting_sort",
+    "radix_sort",
+    "counting_argsort",
+    "radix_argsort",
+    "parallel_sort",
+    "external_sort",
+    "nth_element",
+    "partial_sort",
+    "top_k",
+    "top_k_indices",
+    "merge_sorted",
+    "merge_sorted_batches",
+    "InputProfile",
+    "profile_input",
+    "choose_engine",
+    "select_engine",
+    "SORT_ENGINES",
+    "sort",
 ]
@@ -0,0 +1,147 @@
+"""
+排序引擎自动选择
+
+对输入做一次轻量画像（规模、有序程度、重复率、dtype、是否带 key），
+据此分派到当前可用的最快排序引擎，并记录选择结果及原因。
+"""
+
+import os
+import random
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Tuple
+
+import numpy as np
+
+from ...logging import get_logger
+from ..dtypes import as_numeric_array
+from .radix import counting_sort_pays_off
+
+# 日志名称；Logger 在首次选择引擎时才创建，导入本模块不会创建日志文件
+LOGGER_NAME = "algorithms.sorting"
+
+# 画像时最多采样的元素个数
+PROFILE_SAMPLE_SIZE = 1024
+
+# 数值数组超过该长度且有多个 CPU 时使用并行排序
+PARALLEL_THRESHOLD = 5_000_000
+
+# 相邻逆序对比例低于该值时认为输入基本有序
+PRESORTED_DESCENT_RATIO = 0.05
+
+# 对象列表采样重复率不低于该值（只有极少数不同取值）时改用自然归并：
+# 相等元素连成长段，galloping 合并比快速排序的分区更快
+HIGH_DUPLICATE_RATIO = 0.995
+
+
+@dataclass
+class InputProfile:
+    """排序输入画像"""
+
+    size: int
+    dtype: Optional[str] = None
+    has_key: bool = False
+    descent_ratio: Optional[float] = None
+    duplicate_ratio: Optional[float] = None
+    small_int_range: bool = False
+
+    @property
+    def presorted(self) -> bool:
+        """是否基本有序（升序或降序段较长）"""
+        return self.descent_ratio is not None and (
+            self.descent_ratio <= PRESORTED_DESCENT_RATIO
+            or self.descent_ratio >= 1 - PRESORTED_DESCENT_RATIO
+        )
+
+
+def profile_input(arr: Any, key: Optional[Callable[[Any], Any]] = None,
+                  sample_size: int = PROFILE_SAMPLE_SIZE) -> InputProfile:
+    """
+    采样分析排序输入
+
+    数值数组在整个数组上向量化计算逆序比例；对象列表只在采样的相邻元素对上比较，
+    并统计采样元素的重复率（数值数组由 NumPy 排序，重复率不影响引擎选择，不做统计）。
+    带 key 时不调用 key，以免破坏"每个元素只计算一次关键字"的约定。
+
+    Args:
+        arr: 待排序数据
+        key: 排序关键字函数
+        sample_size: 对象列表的采样个数
+
+    Returns:
+        输入画像
+    """
+    n = len(arr)
+    profile = InputProfile(size=n, has_key=key is not None)
+    if n < 2:
+        return profile
+
+    numeric = as_numeric_array(arr) if key is None else None
+    if numeric is not None:
+        profile.dtype = str(numeric.dtype)
+        descents = int(np.count_nonzero(numeric[1:] < numeric[:-1]))
+        profile.descent_ratio = descents / (n - 1)
+        profile.small_int_range = counting_sort_pays_off(numeric)
+        return profile
+
+    if key is None:
+        rng = random.Random(n)
+        positions = rng.sample(range(n - 1), min(sample_size, n - 1))
+        try:
+            descents = sum(1 for i in positions if arr[i + 1] < arr[i])
+        except TypeError:
+            return profile
+        profile.descent_ratio = descents / len(positions)
+        try:
+            sample = [arr[i] for i in positions]
+            profile.duplicate_ratio = 1 - len(set(sample)) / len(sample)
+        except TypeError:
+            pass
+    return profile
+
+
+def choose_engine(profile: InputProfile) -> Tuple[str, str]:
+    """
+    根据画像选择排序引擎
+
+    Args:
+        profile: 输入画像
+
+    Returns:
+        (引擎名称, 选择原因)
+    """
+    if profile.dtype is not None:
+        if profile.small_int_range:
+            return "counting_sort", "整数值域不超过数组长度"
+        if profile.size >= PARALLEL_THRESHOLD and (os.cpu_count() or 1) > 1:
+            return "parallel_sort", "大规模数值数组且有多个 CPU"
+        return "vectorized_sort", f"同构数值数组 (dtype={profile.dtype})"
+    if profile.has_key:
+        return "merge_sort", "带关键字函数，使用稳定的自适应归并"
+    if profile.presorted:
+        return "merge_sort", f"输入基本有序 (逆序比例={profile.descent_ratio:.3f})"
+    if profile.duplicate_ratio is not None and profile.duplicate_ratio >= HIGH_DUPLICATE_RATIO:
+        return "merge_sort", f"大量重复元素 (重复率={profile.duplicate_ratio:.3f})"
+    return "quick_sort", "一般对象数组"
+
+
+def select_engine(arr: Any,
+                  key: Optional[Callable[[Any], Any]] = None) -> Tuple[str, InputProfile]:
+    """
+    分析输入并选择排序引擎，同时记录选择原因
+
+    Returns:
+        (引擎名称, 输入画像)
+    """
+    profile = profile_input(arr, key)
+    engine, reason = choose_engine(profile)
+    # 库默认路径每次 sort() 都会经过这里，只在 DEBUG 级别记录；API 路由另行记录所选引擎
+    get_logger(LOGGER_NAME).debug(f"自动选择排序引擎: {engine}, 原因: {reason}, 画像: {profile}")
+    return engine, profile
+
+
+__all__ = [
+    "InputProfile",
+    "profile_input",
+    "choose_engine",
+    "select_engine",
+]
@@ -0,0 +1,157 @@
+"""
+外部排序（out-of-core）
+
+用于排序无法一次装入内存的数值数据集：
+1. 生成阶段：按内存上限分块流式读取输入（原始二进制或 CSV），
+   用内存排序后端排序每块，写成内存映射的临时 run 文件
+2. 归并阶段：以内存映射方式打开所有 run，按窗口切成数组块流，
+   交给 merge_sorted_batches 做基于堆的成批 k 路归并
+"""
+
+import os
+import tempfile
+import warnings
+from typing import Iterator, Optional, Union
+
+import numpy as np
+
+from ..dtypes import PathLike
+from .merging import merge_sorted_batches
+from .vectorized import vectorized_sort
+
+# 默认峰值内存上限（字节）
+DEFAULT_MEMORY_LIMIT = 64 * 1024 * 1024
+
+FORMATS = ("binary", "csv")
+
+
+def external_sort(input_path: PathLike, output_path: PathLike,
+                  dtype: Union[str, np.dtype] = "float64", input_format: str = "binary",
+                  output_format: Optional[str] = None,
+                  memory_limit: int = DEFAULT_MEMORY_LIMIT,
+                  tmp_dir: Optional[PathLike] = None) -> int:
+    """
+    外部排序
+
+    Args:
+        input_path: 输入文件路径；binary 为原始定长数值，csv 为逗号 / 换行分隔的数值
+        output_path: 输出文件路径
+        dtype: 数值类型
+        input_format: 输入格式，'binary' 或 'csv'
+        output_format: 输出格式，默认与输入相同
+        memory_limit: 排序数据占用的峰值内存上限（字节）
+        tmp_dir: 临时 run 文件目录，默认使用系统临时目录
+
+    Returns:
+        排序的元素个数
+    """
+    dtype = np.dtype(dtype)
+    output_format = output_format or input_format
+    for fmt in (input_format, output_format):
+        if fmt not in FORMATS:
+            raise ValueError(f"unsupported format: {fmt}")
+
+    # 排序时需要输入块与结果各一份
+    chunk_size = max(1, memory_limit // (2 * dtype.itemsize))
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as work_dir:
+        run_paths = []
+        for i, chunk in enumerate(_read_chunks(input_path, dtype, input_format, chunk_size)):
+            run_path = os.path.join(work_dir, f"run_{i:06d}.bin")
+            run = np.memmap(run_path, dtype=dtype, mode="w+", shape=(len(chunk),))
+            run[:] = vectorized_sort(chunk)
+            run.flush()
+            del run
+            run_paths.append((run_path, len(chunk)))
+
+        runs = [np.memmap(path, dtype=dtype, mode="r", shape=(length,))
+                for path, length in run_paths]
+        try:
+            with open(output_path, "w" if output_format == "csv" else "wb") as out:
+                total = 0
+                # 各 run 的窗口合计占用一半内存，另一半留给归并输出块
+                window = max(1, memory_limit // (2 * dtype.itemsize * max(1, len(runs))))
+                streams = [_windows(run, window) for run in runs]
+                for block in merge_sorted_batches(*streams):
+                    _write_block(out, block, output_format)
+                    total += len(block)
+        finally:
+            del runs
+    return total
+
+
+def _read_chunks(path: PathLike, dtype: np.dtype, fmt: str, chunk_size: int):
+    """
+    按块流式读取输入，每块不超过 chunk_size 个元素
+
+    CSV 输入的块是复用的缓冲区视图，只在下一块产出之前有效
+    """
+    if fmt == "binary":
+        with open(path, "rb") as f:
+            while True:
+                chunk = np.fromfile(f, dtype=dtype, count=chunk_size)
+                if len(chunk) == 0:
+                    return
+                yield chunk
+    else:
+        # 按字节读取文本（而不是按行），每块文本不超过 chunk_size 个字符；每个数值连同
+        # 分隔符至少占 2 个字符，解析结果不超过半块。数值写入复用的缓冲区，满一块产出一次
+        buffer = np.empty(chunk_size, dtype=dtype)
+        filled = 0
+        carry = ""
+        with open(path, "r") as f:
+            while True:
+                data = f.read(chunk_size)
+                text = carry + data
+                if data:
+                    # 在最后一个分隔符处截断，被截断的数值留到下一块
+                    cut = max(text.rfind("\n"), text.rfind(","), text.rfind(" ")) + 1
+                    text, carry = text[:cut], text[cut:]
+                values = _parse_csv_values(text, dtype)
+                del text
+                pos = 0
+                while pos < len(values):
+                    take = min(chunk_size - filled, len(values) - pos)
+                    buffer[filled:filled + take] = values[pos:pos + take]
+                    filled += take
+                    pos += take
+                    if filled == chunk_size:
+                        yield buffer
+                        filled = 0
+                if not data:
+                    break
+        if filled:
+            yield buffer[:filled]
+
+
+def _parse_csv_values(text: str, dtype: np.dtype) -> np.ndarray:
+    """把逗号 / 空白分隔的数值文本直接解析为数组，不为每个数值创建 Python 对象"""
+    text = text.replace(",", " ")
+    # 只含分隔符的文本（空行、块边界）会被 fromstring 解析为 [0]
+    if not text.strip():
+        return np.empty(0, dtype=dtype)
+    with warnings.catch_warnings():
+        # 遇到无法解析的内容时 fromstring 只发出警告并返回部分结果，这里改为报错
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            return np.fromstring(text, dtype=dtype, sep=" ")
+        except (ValueError, DeprecationWarning) as e:
+            raise ValueError(f"invalid numeric value in CSV input: {e}") from None
+
+
+def _windows(run: np.ndarray, window: int) -> Iterator[np.ndarray]:
+    """按窗口大小依次产出 run 的切片（内存映射视图，按需读盘）"""
+    for start in range(0, len(run), window):
+        yield run[start:start + window]
+
+
+def _write_block(out, block: np.ndarray, fmt: str) -> None:
+    if fmt == "binary":
+        block.tofile(out)
+    else:
+        np.savetxt(out, block, fmt="%.17g" if block.dtype.kind == "f" else "%d")
+
+
+__all__ = [
+    "external_sort",
+]
@@ -0,0 +1,141 @@
+"""
+内省排序（Introsort）
+
+原地快速排序 + 堆排序兜底 + 小区间插入排序：
+- 三数取中选择枢轴，避免已排序输入退化
+- 递归深度超过 2*log2(n) 时切换为堆排序，保证 O(n log n) 最坏复杂度
+- 只递归较小的一侧，较大的一侧循环处理，额外栈空间为 O(log n)
+
+排序在 ``keys`` 上进行；若给出 ``items``，则与 ``keys`` 同步交换，
+这样关键字函数对每个元素只需计算一次。
+"""
+
+from typing import Any, List, Optional
+
+# 小于该长度的区间使用插入排序
+INSERTION_THRESHOLD = 16
+
+
+def introsort(keys: List[Any], items: Optional[List[Any]] = None) -> None:
+    """
+    对 keys 原地排序（不稳定）
+
+    Args:
+        keys: 待排序的关键字列表，原地修改
+        items: 与 keys 一一对应的元素列表，随 keys 同步移动（可选）
+    """
+    n = len(keys)
+    if n < 2:
+        return
+    depth_limit = 2 * n.bit_length()
+    _introsort_range(keys, items, 0, n, depth_limit)
+
+
+def _introsort_range(keys: List[Any], items: Optional[List[Any]], lo: int, hi: int,
+                     depth_limit: int) -> None:
+    """对半开区间 [lo, hi) 执行内省排序"""
+    while hi - lo > INSERTION_THRESHOLD:
+        if depth_limit == 0:
+            _heapsort_range(keys, items, lo, hi)
+            return
+        depth_limit -= 1
+
+        p = _partition(keys, items, lo, hi)
+        # 先递归较小的一侧，较大的一侧留给循环，限制栈深度
+        if p - lo < hi - p:
+            _introsort_range(keys, items, lo, p, depth_limit)
+            lo = p
+        else:
+            _introsort_range(keys, items, p, hi, depth_limit)
+            hi = p
+
+    _insertion_sort_range(keys, items, lo, hi)
+
+
+def _median_of_three(keys: List[Any], items: Optional[List[Any]], lo: int, hi: int) -> Any:
+    """将 lo、mid、hi-1 三处按序排列，并返回中位数作为枢轴"""
+    last = hi - 1
+    # 取下中位数位置，保证 Hoare 分区两侧都非空
+    mid = lo + (last - lo) // 2
+    for a, b in ((lo, mid), (mid, last), (lo, mid)):
+        if keys[b] < keys[a]:
+            keys[a], keys[b] = keys[b], keys[a]
+            if items is not None:
+                items[a], items[b] = items[b], items[a]
+    return keys[mid]
+
+
+def _partition(keys: List[Any], items: Optional[List[Any]], lo: int, hi: int) -> int:
+    """
+    Hoare 分区
+
+    Returns:
+        分割点 p，满足 [lo, p) 中的关键字均不大于 [p, hi) 中的关键字
+    """
+    pivot = _median_of_three(keys, items, lo, hi)
+    i = lo - 1
+    j = hi
+    while True:
+        i += 1
+        while keys[i] < pivot:
+            i += 1
+        j -= 1
+        while pivot < keys[j]:
+            j -= 1
+        if i >= j:
+            return j + 1
+        keys[i], keys[j] = keys[j], keys[i]
+        if items is not None:
+            items[i], items[j] = items[j], items[i]
+
+
+def _insertion_sort_range(keys: List[Any], items: Optional[List[Any]], lo: int,
+                          hi: int) -> None:
+    """对 [lo, hi) 执行插入排序"""
+    for i in range(lo + 1, hi):
+        k = keys[i]
+        v = items[i] if items is not None else None
+        j = i - 1
+        while j >= lo and k < keys[j]:
+            keys[j + 1] = keys[j]
+            if items is not None:
+                items[j + 1] = items[j]
+            j -= 1
+        keys[j + 1] = k
+        if items is not None:
+            items[j + 1] = v
+
+
+def _heapsort_range(keys: List[Any], items: Optional[List[Any]], lo: int, hi: int) -> None:
+    """对 [lo, hi) 执行堆排序"""
+    n = hi - lo
+    for start in range(n // 2 - 1, -1, -1):
+        _sift_down(keys, items, lo, start, n)
+    for end in range(n - 1, 0, -1):
+        keys[lo], keys[lo + end] = keys[lo + end], keys[lo]
+        if items is not None:
+            items[lo], items[lo + end] = items[lo + end], items[lo]
+        _sift_down(keys, items, lo, 0, end)
+
+
+def _sift_down(keys: List[Any], items: Optional[List[Any]], base: int, root: int,
+               size: int) -> None:
+    """最大堆下沉，堆位于 keys[base:base+size]"""
+    while True:
+        child = 2 * root + 1
+        if child >= size:
+            return
+        if child + 1 < size and keys[base + child] < keys[base + child + 1]:
+            child += 1
+        if not keys[base + root] < keys[base + child]:
+            return
+        a, b = base + root, base + child
+        keys[a], keys[b] = keys[b], keys[a]
+        if items is not None:
+            items[a], items[b] = items[b], items[a]
+        root = child
+
+
+__all__ = [
+    "introsort",
+]
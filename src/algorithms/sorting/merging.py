@@ -0,0 +1,109 @@
+"""
+多路归并
+
+把多个各自有序的输入合并为一个有序输出，输入按需惰性读取：
+- merge_sorted：逐元素的堆归并，适用于任意对象，额外内存 O(k)
+- merge_sorted_batches：以 NumPy 数组块为单位的成批归并，
+  避免逐元素的 Python 开销，适用于分片日志、外部排序的 run 等数值流
+"""
+
+import heapq
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+
+def merge_sorted(*iterables: Iterable[Any], key: Optional[Callable[[Any], Any]] = None,
+                 reverse: bool = False) -> Iterator[Any]:
+    """
+    惰性 k 路归并
+
+    每个输入只在需要时取下一个元素，堆中始终只有 k 个候选，
+    每个元素的 key 只计算一次；相等元素按输入的先后顺序输出（稳定）。
+
+    Args:
+        *iterables: 各自有序的可迭代对象（reverse=True 时应为降序）
+        key: 比较关键字函数
+        reverse: 输入与输出是否为降序
+
+    Yields:
+        归并后的元素
+    """
+    yield from heapq.merge(*iterables, key=key, reverse=reverse)
+
+
+def merge_sorted_batches(*streams: Iterable[Any], reverse: bool = False) -> Iterator[np.ndarray]:
+    """
+    成批 k 路归并有序的数值块流
+
+    每个流依次产出一维数组块，流内整体有序（块内与块间都有序）。
+    每个流只缓存当前块，堆中记录各块的末元素：末元素最小（降序时最大）的块
+    决定一个边界值，所有流中不超过该边界的元素此时均已可见，可一次取出归并。
+
+    Args:
+        *streams: 各自有序的数组块可迭代对象
+        reverse: 流与输出是否为降序
+
+    Yields:
+        归并后的有序数组块；只来自单个块的结果可能是输入块的视图
+    """
+    iterators = [iter(stream) for stream in streams]
+    buffers: List[Optional[np.ndarray]] = [None] * len(iterators)
+    pos = [0] * len(iterators)
+
+    heap = []
+    for i in range(len(iterators)):
+        if _refill(iterators, buffers, pos, i):
+            heap.append((_heap_key(buffers[i], reverse), i))
+    heapq.heapify(heap)
+
+    while heap:
+        bound = buffers[heap[0][1]][-1]
+        pieces = []
+        for _, i in heap:
+            segment = buffers[i][pos[i]:]
+            if reverse:
+                take = len(segment) - int(np.searchsorted(segment[::-1], bound, side="left"))
+            else:
+                take = int(np.searchsorted(segment, bound, side="right"))
+            if take:
+                pieces.append(segment[:take])
+                pos[i] += take
+
+        if len(pieces) == 1:
+            yield pieces[0]
+        else:
+            block = np.concatenate(pieces)
+            block.sort(kind="stable")
+            yield block[::-1] if reverse else block
+
+        # 当前块被取空的流读入下一块
+        while heap and pos[heap[0][1]] >= len(buffers[heap[0][1]]):
+            _, i = heapq.heappop(heap)
+            if _refill(iterators, buffers, pos, i):
+                heapq.heappush(heap, (_heap_key(buffers[i], reverse), i))
+
+
+def _heap_key(buffer: np.ndarray, reverse: bool) -> Any:
+    """块末元素作为堆关键字；降序时取相反数，使堆顶为末元素最大的块"""
+    tail = buffer[-1].item()
+    return -tail if reverse else tail
+
+
+def _refill(iterators: List[Iterator[Any]], buffers: List[Optional[np.ndarray]],
+            pos: List[int], i: int) -> bool:
+    """读入第 i 个流的下一个非空块，流结束时返回 False"""
+    for chunk in iterators[i]:
+        chunk = np.asarray(chunk)
+        if len(chunk):
+            buffers[i] = chunk
+            pos[i] = 0
+            return True
+    buffers[i] = None
+    return False
+
+
+__all__ = [
+    "merge_sorted",
+    "merge_sorted_batches",
+]
@@ -0,0 +1,332 @@
+"""
+自适应自然归并排序
+
+思路与 TimSort 一致：
+- 扫描输入中已有的升序 / 严格降序段（run），降序段原地反转
+- 过短的 run 用二分插入排序补足到 minrun
+- 用 run 栈维持长度不变式，只合并相邻 run
+- 合并前先用 galloping 裁掉两端已就位的元素，合并时某一侧连续胜出后
+  切换到 galloping 模式成段搬移
+- 全程只使用一块预分配的 n/2 大小的辅助缓冲区
+
+由多个已排序批次拼接而成的输入只需要接近线性的比较次数。排序是稳定的。
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Any, List, Optional, Tuple
+
+# 进入 galloping 模式前一侧需要连续胜出的次数
+MIN_GALLOP = 7
+
+
+def natural_merge_sort(keys: List[Any], items: Optional[List[Any]] = None) -> None:
+    """
+    对 keys 原地稳定排序
+
+    Args:
+        keys: 待排序的关键字列表，原地修改
+        items: 与 keys 一一对应的元素列表，随 keys 同步移动（可选）
+    """
+    n = len(keys)
+    if n < 2:
+        return
+
+    min_run = _min_run_length(n)
+    scratch_keys: List[Any] = [None] * (n // 2)
+    scratch_items: Optional[List[Any]] = [None] * (n // 2) if items is not None else None
+    runs: List[Tuple[int, int]] = []
+
+    lo = 0
+    while lo < n:
+        run_len = _count_run(keys, items, lo, n)
+        if run_len < min_run:
+            forced = min(min_run, n - lo)
+            _binary_insertion_sort(keys, items, lo, lo + forced, lo + run_len)
+            run_len = forced
+        runs.append((lo, run_len))
+        _merge_collapse(keys, items, runs, scratch_keys, scratch_items)
+        lo += run_len
+
+    while len(runs) > 1:
+        i = len(runs) - 2
+        if i > 0 and runs[i - 1][1] < runs[i + 1][1]:
+            i -= 1
+        _merge_at(keys, items, runs, i, scratch_keys, scratch_items)
+
+
+def _min_run_length(n: int) -> int:
+    """计算最短 run 长度，使 n/minrun 接近且不超过 2 的幂"""
+    r = 0
+    while n >= 64:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+
+def _count_run(keys: List[Any], items: Optional[List[Any]], lo: int, hi: int) -> int:
+    """返回从 lo 开始的 run 长度；严格降序的 run 会被原地反转为升序"""
+    i = lo + 1
+    if i == hi:
+        return 1
+
+    if keys[i] < keys[lo]:
+        # 严格降序才能反转，否则会破坏稳定性
+        i += 1
+        while i < hi and keys[i] < keys[i - 1]:
+            i += 1
+        keys[lo:i] = keys[lo:i][::-1]
+        if items is not None:
+            items[lo:i] = items[lo:i][::-1]
+    else:
+        i += 1
+        while i < hi and not keys[i] < keys[i - 1]:
+            i += 1
+    return i - lo
+
+
+def _binary_insertion_sort(keys: List[Any], items: Optional[List[Any]], lo: int, hi: int,
+                           start: int) -> None:
+    """对 [lo, hi) 做稳定的二分插入排序，其中 [lo, start) 已有序"""
+    for i in range(start, hi):
+        k = keys[i]
+        pos = bisect_right(keys, k, lo, i)
+        if pos == i:
+            continue
+        keys[pos + 1:i + 1] = keys[pos:i]
+        keys[pos] = k
+        if items is not None:
+            v = items[i]
+            items[pos + 1:i + 1] = items[pos:i]
+            items[pos] = v
+
+
+def _merge_collapse(keys: List[Any], items: Optional[List[Any]], runs: List[Tuple[int, int]],
+                    scratch_keys: List[Any], scratch_items: Optional[List[Any]]) -> None:
+    """合并栈顶的 run，直到满足 TimSort 的长度不变式"""
+    while len(runs) > 1:
+        i = len(runs) - 2
+        if (i > 0 and runs[i - 1][1] <= runs[i][1] + runs[i + 1][1]) or (
+            i > 1 and runs[i - 2][1] <= runs[i - 1][1] + runs[i][1]
+        ):
+            if runs[i - 1][1] < runs[i + 1][1]:
+                i -= 1
+        elif runs[i][1] > runs[i + 1][1]:
+            break
+        _merge_at(keys, items, runs, i, scratch_keys, scratch_items)
+
+
+def _merge_at(keys: List[Any], items: Optional[List[Any]], runs: List[Tuple[int, int]], i: int,
+              scratch_keys: List[Any], scratch_items: Optional[List[Any]]) -> None:
+    """合并栈中第 i 和 i+1 个 run"""
+    a, na = runs[i]
+    b, nb = runs[i + 1]
+    runs[i] = (a, na + nb)
+    del runs[i + 1]
+
+    # 左 run 中不大于 keys[b] 的前缀已经就位
+    start = _gallop_right(keys[b], keys, a, a + na)
+    na -= start - a
+    a = start
+    if na == 0:
+        return
+
+    # 右 run 中不小于左 run 末元素的后缀已经就位
+    nb = _gallop_left_rev(keys[a + na - 1], keys, b, b + nb) - b
+    if nb == 0:
+        return
+
+    if na <= nb:
+        _merge_lo(keys, items, a, na, b, nb, scratch_keys, scratch_items)
+    else:
+        _merge_hi(keys, items, a, na, b, nb, scratch_keys, scratch_items)
+
+
+def _merge_lo(keys: List[Any], items: Optional[List[Any]], a: int, na: int, b: int, nb: int,
+              sk: List[Any], si: Optional[List[Any]]) -> None:
+    """左 run 较短：复制左 run 到缓冲区，从前往后合并"""
+    sk[:na] = keys[a:a + na]
+    if items is not None:
+        si[:na] = items[a:a + na]
+
+    i, j, dest, end = 0, b, a, b + nb
+    while i < na and j < end:
+        # 逐个比较，直到某一侧连续胜出 MIN_GALLOP 次
+        wins_a = wins_b = 0
+        while i < na and j < end:
+            if keys[j] < sk[i]:
+                keys[dest] = keys[j]
+                if items is not None:
+                    items[dest] = items[j]
+                j += 1
+                wins_b += 1
+                wins_a = 0
+            else:
+                keys[dest] = sk[i]
+                if items is not None:
+                    items[dest] = si[i]
+                i += 1
+                wins_a += 1
+                wins_b = 0
+            dest += 1
+            if wins_a >= MIN_GALLOP or wins_b >= MIN_GALLOP:
+                break
+
+        # galloping 模式：成段搬移
+        while i < na and j < end:
+            k = _gallop_right(keys[j], sk, i, na) - i
+            if k:
+                keys[dest:dest + k] = sk[i:i + k]
+                if items is not None:
+                    items[dest:dest + k] = si[i:i + k]
+                i += k
+                dest += k
+                if i >= na:
+                    break
+            keys[dest] = keys[j]
+            if items is not None:
+                items[dest] = items[j]
+            j += 1
+            dest += 1
+            if j >= end:
+                break
+
+            k2 = _gallop_left(sk[i], keys, j, end) - j
+            if k2:
+                keys[dest:dest + k2] = keys[j:j + k2]
+                if items is not None:
+                    items[dest:dest + k2] = items[j:j + k2]
+                j += k2
+                dest += k2
+                if j >= end:
+                    break
+            keys[dest] = sk[i]
+            if items is not None:
+                items[dest] = si[i]
+            i += 1
+            dest += 1
+
+            if k < MIN_GALLOP and k2 < MIN_GALLOP:
+                break
+
+    # 右 run 的剩余部分已经在原位
+    if i < na:
+        keys[dest:dest + na - i] = sk[i:na]
+        if items is not None:
+            items[dest:dest + na - i] = si[i:na]
+
+
+def _merge_hi(keys: List[Any], items: Optional[List[Any]], a: int, na: int, b: int, nb: int,
+              sk: List[Any], si: Optional[List[Any]]) -> None:
+    """右 run 较短：复制右 run 到缓冲区，从后往前合并"""
+    sk[:nb] = keys[b:b + nb]
+    if items is not None:
+        si[:nb] = items[b:b + nb]
+
+    i, j, dest = a + na - 1, nb - 1, b + nb - 1
+    while i >= a and j >= 0:
+        wins_a = wins_b = 0
+        while i >= a and j >= 0:
+            if sk[j] < keys[i]:
+                keys[dest] = keys[i]
+                if items is not None:
+                    items[dest] = items[i]
+                i -= 1
+                wins_a += 1
+                wins_b = 0
+            else:
+                keys[dest] = sk[j]
+                if items is not None:
+                    items[dest] = si[j]
+                j -= 1
+                wins_b += 1
+                wins_a = 0
+            dest -= 1
+            if wins_a >= MIN_GALLOP or wins_b >= MIN_GALLOP:
+                break
+
+        while i >= a and j >= 0:
+            k = i + 1 - _gallop_right_rev(sk[j], keys, a, i + 1)
+            if k:
+                keys[dest - k + 1:dest + 1] = keys[i - k + 1:i + 1]
+                if items is not None:
+                    items[dest - k + 1:dest + 1] = items[i - k + 1:i + 1]
+                i -= k
+                dest -= k
+                if i < a:
+                    break
+            keys[dest] = sk[j]
+            if items is not None:
+                items[dest] = si[j]
+            j -= 1
+            dest -= 1
+            if j < 0:
+                break
+
+            k2 = j + 1 - _gallop_left_rev(keys[i], sk, 0, j + 1)
+            if k2:
+                keys[dest - k2 + 1:dest + 1] = sk[j - k2 + 1:j + 1]
+                if items is not None:
+                    items[dest - k2 + 1:dest + 1] = si[j - k2 + 1:j + 1]
+                j -= k2
+                dest -= k2
+                if j < 0:
+                    break
+            keys[dest] = keys[i]
+            if items is not None:
+                items[dest] = items[i]
+            i -= 1
+            dest -= 1
+
+            if k < MIN_GALLOP and k2 < MIN_GALLOP:
+                break
+
+    # 左 run 的剩余部分已经在原位
+    if j >= 0:
+        keys[dest - j:dest + 1] = sk[:j + 1]
+        if items is not None:
+            items[dest - j:dest + 1] = si[:j + 1]
+
+
+def _gallop_right(x: Any, keys: List[Any], lo: int, hi: int) -> int:
+    """从左端指数探测，返回 [lo, hi) 中第一个大于 x 的位置"""
+    if hi <= lo or x < keys[lo]:
+        return lo
+    last, ofs = 0, 1
+    while lo + ofs < hi and not x < keys[lo + ofs]:
+        last, ofs = ofs, (ofs << 1) + 1
+    return bisect_right(keys, x, lo + last + 1, min(lo + ofs, hi))
+
+
+def _gallop_left(x: Any, keys: List[Any], lo: int, hi: int) -> int:
+    """从左端指数探测，返回 [lo, hi) 中第一个不小于 x 的位置"""
+    if hi <= lo or not keys[lo] < x:
+        return lo
+    last, ofs = 0, 1
+    while lo + ofs < hi and keys[lo + ofs] < x:
+        last, ofs = ofs, (ofs << 1) + 1
+    return bisect_left(keys, x, lo + last + 1, min(lo + ofs, hi))
+
+
+def _gallop_right_rev(x: Any, keys: List[Any], lo: int, hi: int) -> int:
+    """从右端指数探测，返回 [lo, hi) 中第一个大于 x 的位置"""
+    if hi <= lo or not x < keys[hi - 1]:
+        return hi
+    last, ofs = 0, 1
+    while hi - 1 - ofs >= lo and x < keys[hi - 1 - ofs]:
+        last, ofs = ofs, (ofs << 1) + 1
+    return bisect_right(keys, x, max(hi - ofs, lo), hi - 1 - last)
+
+
+def _gallop_left_rev(x: Any, keys: List[Any], lo: int, hi: int) -> int:
+    """从右端指数探测，返回 [lo, hi) 中第一个不小于 x 的位置"""
+    if hi <= lo or keys[hi - 1] < x:
+        return hi
+    last, ofs = 0, 1
+    while hi - 1 - ofs >= lo and not keys[hi - 1 - ofs] < x:
+        last, ofs = ofs, (ofs << 1) + 1
+    return bisect_left(keys, x, max(hi - ofs, lo), hi - 1 - last)
+
+
+__all__ = [
+    "natural_merge_sort",
+]
@@ -0,0 +1,146 @@
+"""
+多进程并行排序
+
+基于共享内存的并行样本排序（sample sort）：
+1. 把数值缓冲区复制进 ``multiprocessing.shared_memory``，切成 workers 个块
+2. 进程池中各自原地排序一个块（复用向量化后端，小值域时走计数排序）
+3. 从各块的规则采样中选出 workers-1 个分割值，每个进程负责一个值区间，
+   从所有块中取出落在该区间的片段做 k 路归并，直接写入输出缓冲区的对应位置
+
+进程之间只传递共享内存名与下标，数据本身不经过 pickle。
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+
+from ..dtypes import ArrayLike, require_numeric, wrap_like
+from .vectorized import vectorized_sort
+
+# 小于该长度时并行开销大于收益，直接单进程排序
+PARALLEL_MIN_SIZE = 1 << 16
+
+# 每个块用于选分割值的采样数
+SAMPLES_PER_CHUNK = 64
+
+
+def parallel_sort(data: ArrayLike, workers: Optional[int] = None, reverse: bool = False) -> Any:
+    """
+    多进程并行排序
+
+    Args:
+        data: 一维数值数据（np.ndarray、array.array 或数值列表）
+        workers: 进程数，默认使用全部 CPU 核心；为 1 时退化为单进程向量化排序
+        reverse: 是否降序
+
+    Returns:
+        与输入同类型的排序结果
+    """
+    arr = require_numeric(data)
+    n = len(arr)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, n // 2 or 1))
+
+    if workers == 1 or n < PARALLEL_MIN_SIZE:
+        return vectorized_sort(data, reverse=reverse)
+
+    dtype = arr.dtype
+    src = shared_memory.SharedMemory(create=True, size=arr.nbytes)
+    dst = shared_memory.SharedMemory(create=True, size=arr.nbytes)
+    try:
+        buf = np.ndarray(n, dtype=dtype, buffer=src.buf)
+        buf[:] = arr
+        bounds = np.linspace(0, n, workers + 1).astype(np.int64)
+        chunks = [(int(bounds[i]), int(bounds[i + 1])) for i in range(workers)]
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_sort_chunk, [(src.name, dtype.str, n, lo, hi) for lo, hi in chunks]))
+
+            tasks = _plan_merge(buf, chunks, workers)
+            list(pool.map(
+                _merge_partition,
+                [(src.name, dst.name, dtype.str, n, pieces, offset) for pieces, offset in tasks],
+            ))
+
+        result = np.ndarray(n, dtype=dtype, buffer=dst.buf).copy()
+        del buf
+    finally:
+        for shm in (src, dst):
+            shm.close()
+            shm.unlink()
+
+    if reverse:
+        result = result[::-1]
+    return wrap_like(data, result)
+
+
+def _plan_merge(buf: np.ndarray, chunks: List[Tuple[int, int]],
+                workers: int) -> List[Tuple[List[Tuple[int, int]], int]]:
+    """
+    根据已排序的块选出分割值，划分每个进程的归并任务
+
+    Returns:
+        每个进程的 (各块中的片段 [lo, hi) 列表, 输出起始位置)
+    """
+    samples = np.concatenate([
+        buf[lo:hi][np.linspace(0, hi - lo - 1, SAMPLES_PER_CHUNK).astype(np.int64)]
+        for lo, hi in chunks
+    ])
+    samples.sort()
+    splitters = samples[np.linspace(0, len(samples), workers + 1).astype(np.int64)[1:-1]]
+
+    # cuts[c][p] 为第 c 块中第 p 个值区间的起点，区间统一取左闭右开
+    cuts = []
+    for lo, hi in chunks:
+        inner = np.searchsorted(buf[lo:hi], splitters, side="left") + lo
+        cuts.append([lo] + inner.tolist() + [hi])
+
+    tasks = []
+    offset = 0
+    for p in range(workers):
+        pieces = [(c[p], c[p + 1]) for c in cuts if c[p + 1] > c[p]]
+        tasks.append((pieces, offset))
+        offset += sum(hi - lo for lo, hi in pieces)
+    return tasks
+
+
+def _sort_chunk(args: Tuple[str, str, int, int, int]) -> None:
+    """子进程：原地排序 [lo, hi) 块"""
+    name, dtype, n, lo, hi = args
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        buf = np.ndarray(n, dtype=np.dtype(dtype), buffer=shm.buf)
+        buf[lo:hi] = vectorized_sort(buf[lo:hi])
+        del buf
+    finally:
+        shm.close()
+
+
+def _merge_partition(args: Tuple[str, str, str, int, List[Tuple[int, int]], int]) -> None:
+    """子进程：把各块中属于同一值区间的有序片段归并写入输出缓冲区"""
+    src_name, dst_name, dtype, n, pieces, offset = args
+    if not pieces:
+        return
+    src = shared_memory.SharedMemory(name=src_name)
+    dst = shared_memory.SharedMemory(name=dst_name)
+    try:
+        buf = np.ndarray(n, dtype=np.dtype(dtype), buffer=src.buf)
+        out = np.ndarray(n, dtype=np.dtype(dtype), buffer=dst.buf)
+        total = sum(hi - lo for lo, hi in pieces)
+        target = out[offset:offset + total]
+        # 有序片段拼接后做稳定排序，NumPy 的 timsort/radix 会利用已有的有序段完成归并
+        np.concatenate([buf[lo:hi] for lo, hi in pieces], out=target)
+        target.sort(kind="stable")
+        del buf, out, target
+    finally:
+        src.close()
+        dst.close()
+
+
+__all__ = [
+    "parallel_sort",
+]
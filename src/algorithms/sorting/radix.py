@@ -0,0 +1,209 @@
+"""
+计数排序与 LSD 基数排序
+
+面向有界整数与定长关键字（整数、浮点）的线性时间排序，全部在 NumPy 缓冲区上
+向量化执行。可以直接排序数值数组，也可以通过 key 提取整数关键字来排序任意对象。
+"""
+
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+from ..keys import precompute_keys
+from ..dtypes import as_numeric_array, wrap_like
+
+# 每轮 LSD 处理的位数；16 位数字可以走 NumPy 针对 16 位整数的线性稳定排序
+DIGIT_BITS = 16
+
+# 值域不超过 n * 该系数时认为计数排序划算
+COUNTING_RANGE_FACTOR = 1
+
+_SIGN_BIT = np.uint64(1 << 63)
+
+
+def counting_sort_pays_off(arr: np.ndarray) -> bool:
+    """
+    判断整数数组是否适合计数排序（值域相对 n 较小）
+
+    Args:
+        arr: 一维数值数组
+
+    Returns:
+        是否应使用计数排序
+    """
+    if arr.dtype.kind not in "biu" or len(arr) < 2:
+        return False
+    value_range = int(arr.max()) - int(arr.min()) + 1
+    return value_range <= COUNTING_RANGE_FACTOR * len(arr)
+
+
+def counting_sort_values(arr: np.ndarray) -> np.ndarray:
+    """
+    计数排序（只排序值）
+
+    O(n + k)，k 为值域大小
+
+    Args:
+        arr: 一维整数数组
+
+    Returns:
+        升序排列的新数组，dtype 与输入相同
+    """
+    if len(arr) == 0:
+        return arr.copy()
+    # 偏移在保序的 uint64 上计算：int8 / int16 的跨度可能超出自身的有符号范围，
+    # uint64 的值可能跨越 2**63；还原时在原 dtype 中按模运算，结果必在其范围内
+    ordered = _to_ordered_uint(arr)
+    counts = np.bincount((ordered - ordered.min()).astype(np.intp))
+    values = arr.min() + np.arange(len(counts)).astype(arr.dtype)
+    return np.repeat(values, counts)
+
+
+def counting_argsort(keys: np.ndarray) -> np.ndarray:
+    """
+    稳定的计数排序下标
+
+    值域不超过 2**16 时一次分桶完成，否则退化为 LSD 基数排序。
+
+    Args:
+        keys: 一维整数关键字数组
+
+    Returns:
+        使 keys 升序的稳定下标数组
+    """
+    keys = np.asarray(keys)
+    if len(keys) < 2:
+        return np.arange(len(keys))
+    offsets = _to_ordered_uint(keys)
+    offsets = offsets - offsets.min()
+    if int(offsets.max()) < (1 << DIGIT_BITS):
+        return np.argsort(offsets.astype(np.uint16), kind="stable")
+    return radix_argsort(keys)
+
+
+def radix_argsort(keys: np.ndarray) -> np.ndarray:
+    """
+    稳定的 LSD 基数排序下标
+
+    关键字先映射为保序的无符号整数并减去最小值，再按 16 位一组从低到高分桶，
+    轮数由实际值域决定。支持有符号 / 无符号整数、布尔和浮点关键字。
+
+    Args:
+        keys: 一维定长数值关键字数组
+
+    Returns:
+        使 keys 升序的稳定下标数组
+    """
+    keys = np.asarray(keys)
+    n = len(keys)
+    order = np.arange(n)
+    if n < 2:
+        return order
+
+    u = _to_ordered_uint(keys)
+    u = u - u.min()
+    max_val = int(u.max())
+    mask = np.uint64((1 << DIGIT_BITS) - 1)
+
+    shift = 0
+    while max_val >> shift:
+        digits = ((u[order] >> np.uint64(shift)) & mask).astype(np.uint16)
+        order = order[np.argsort(digits, kind="stable")]
+        shift += DIGIT_BITS
+    return order
+
+
+def counting_sort(data: Any, key: Optional[Callable[[Any], int]] = None,
+                  reverse: bool = False) -> Any:
+    """
+    计数排序
+
+    适用于值域较小的整数。无 key 时直接对整数数组计数；有 key 时为每个元素
+    计算一次整数关键字，稳定地按关键字重排元素。
+
+    Args:
+        data: 整数数组（ndarray / array.array / 列表），或配合 key 使用的任意元素列表
+        key: 提取整数关键字的函数
+        reverse: 是否降序（稳定）
+
+    Returns:
+        排序结果；数值输入保持容器类型，带 key 时返回列表
+    """
+    return _linear_sort(data, key, reverse, counting_argsort, integer_only=True)
+
+
+def radix_sort(data: Any, key: Optional[Callable[[Any], Any]] = None,
+               reverse: bool = False) -> Any:
+    """
+    LSD 基数排序
+
+    适用于整数与定长浮点关键字，复杂度 O(n * w / 16)，w 为值域位宽。
+
+    Args:
+        data: 数值数组（ndarray / array.array / 列表），或配合 key 使用的任意元素列表
+        key: 提取数值关键字的函数
+        reverse: 是否降序（稳定）
+
+    Returns:
+        排序结果；数值输入保持容器类型，带 key 时返回列表
+    """
+    return _linear_sort(data, key, reverse, radix_argsort, integer_only=False)
+
+
+def _linear_sort(data: Any, key: Optional[Callable[[Any], Any]], reverse: bool,
+                 argsort_func: Callable[[np.ndarray], np.ndarray], integer_only: bool) -> Any:
+    allowed = "biu" if integer_only else "biuf"
+
+    if key is None:
+        arr = as_numeric_array(data)
+        if arr is None:
+            if isinstance(data, (list, tuple)) and len(data) == 0:
+                return []
+            raise TypeError("expected a 1-D numeric array or a key function")
+        if arr.dtype.kind not in allowed:
+            raise TypeError(f"unsupported key dtype: {arr.dtype}")
+        if integer_only and counting_sort_pays_off(arr):
+            result = counting_sort_values(arr)
+            return wrap_like(data, result[::-1] if reverse else result)
+        return wrap_like(data, arr[_ordered(arr, argsort_func, reverse)])
+
+    items = list(data)
+    keys = np.asarray(precompute_keys(items, key))
+    if len(items) == 0:
+        return []
+    if keys.ndim != 1 or keys.dtype.kind not in allowed:
+        raise TypeError(f"unsupported key dtype: {keys.dtype}")
+    return [items[i] for i in _ordered(keys, argsort_func, reverse)]
+
+
+def _ordered(keys: np.ndarray, argsort_func: Callable[[np.ndarray], np.ndarray],
+             reverse: bool) -> np.ndarray:
+    """升序或稳定降序的下标"""
+    if not reverse:
+        return argsort_func(keys)
+    n = len(keys)
+    return (n - 1) - argsort_func(keys[::-1])[::-1]
+
+
+def _to_ordered_uint(keys: np.ndarray) -> np.ndarray:
+    """把数值关键字映射为保序的 uint64"""
+    kind = keys.dtype.kind
+    if kind in "bu":
+        return keys.astype(np.uint64)
+    if kind == "i":
+        return keys.astype(np.int64).view(np.uint64) ^ _SIGN_BIT
+    if kind == "f":
+        bits = keys.astype(np.float64).view(np.uint64)
+        negative = (bits & _SIGN_BIT) != 0
+        return np.where(negative, ~bits, bits | _SIGN_BIT)
+    raise TypeError(f"unsupported key dtype: {keys.dtype}")
+
+
+__all__ = [
+    "counting_sort",
+    "radix_sort",
+    "counting_argsort",
+    "radix_argsort",
+    "counting_sort_values",
+    "counting_sort_pays_off",
+]
@@ -0,0 +1,150 @@
+"""
+选择算法：快速选择、部分排序与 Top-K
+
+只需要前 k 个元素时不必对整个数组排序：
+- 任意对象走纯 Python 路径（快速选择 / heapq 的 O(n log k) 堆选择）
+- np.ndarray 输入走 np.partition / np.argpartition 的向量化路径
+
+复杂度为 O(n + k log k)，且不会生成完整的有序列表。
+"""
+
+import heapq
+from typing import Any, Callable, List, Optional
+
+import numpy as np
+
+from ..keys import decorate
+from .introsort import (
+    INSERTION_THRESHOLD,
+    _heapsort_range,
+    _insertion_sort_range,
+    _partition,
+)
+
+
+def nth_element(arr: Any, k: int, key: Optional[Callable[[Any], Any]] = None) -> Any:
+    """
+    快速选择：返回排序后位于下标 k 的元素（从 0 开始）
+
+    纯 Python 路径使用内省选择（三数取中的 Hoare 分区，递归过深时改用堆排序），
+    最坏 O(n log n)、平均 O(n)；不修改输入。
+
+    Args:
+        arr: 数组（列表或 np.ndarray）
+        k: 目标位置，支持负数下标
+        key: 比较关键字函数
+
+    Returns:
+        第 k 小的元素
+    """
+    n = len(arr)
+    if k < 0:
+        k += n
+    if not 0 <= k < n:
+        raise IndexError("nth_element index out of range")
+
+    if isinstance(arr, np.ndarray) and key is None:
+        return np.partition(arr, k)[k]
+
+    keys, items = decorate(arr, key)
+    _introselect(keys, items, k)
+    return items[k] if items is not None else keys[k]
+
+
+def partial_sort(arr: Any, k: int, key: Optional[Callable[[Any], Any]] = None) -> Any:
+    """
+    部分排序：返回最小的 k 个元素，按升序排列
+
+    等价于 ``sorted(arr, key=key)[:k]``（稳定），但只需 O(n log k)。
+
+    Args:
+        arr: 数组（列表或 np.ndarray）
+        k: 需要的元素个数，超过长度时返回全部
+        key: 比较关键字函数
+
+    Returns:
+        np.ndarray 输入返回 ndarray，否则返回列表
+    """
+    return top_k(arr, k, key=key, largest=False)
+
+
+def top_k(arr: Any, k: int, key: Optional[Callable[[Any], Any]] = None,
+          largest: bool = True) -> Any:
+    """
+    Top-K：返回最大（或最小）的 k 个元素
+
+    Args:
+        arr: 数组（列表或 np.ndarray）
+        k: 需要的元素个数，超过长度时返回全部
+        key: 比较关键字函数
+        largest: True 时返回最大的 k 个并降序排列，否则返回最小的 k 个并升序排列
+
+    Returns:
+        np.ndarray 输入返回 ndarray，否则返回列表
+    """
+    n = len(arr)
+    k = max(0, min(k, n))
+
+    if isinstance(arr, np.ndarray) and key is None:
+        if k == 0:
+            return arr[:0].copy()
+        if largest:
+            part = np.partition(arr, n - k)[n - k:]
+            return np.sort(part)[::-1]
+        part = np.partition(arr, k - 1)[:k]
+        return np.sort(part)
+
+    if k == 0:
+        return []
+    if largest:
+        return heapq.nlargest(k, arr, key=key)
+    return heapq.nsmallest(k, arr, key=key)
+
+
+def top_k_indices(arr: np.ndarray, k: int, largest: bool = True) -> np.ndarray:
+    """
+    向量化 Top-K 下标
+
+    Args:
+        arr: 一维数值数组
+        k: 需要的元素个数
+        largest: 是否取最大的 k 个
+
+    Returns:
+        按值排序（largest 时降序）的 k 个下标
+    """
+    arr = np.asarray(arr)
+    n = len(arr)
+    k = max(0, min(k, n))
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+    if largest:
+        idx = np.argpartition(arr, n - k)[n - k:]
+        return idx[np.argsort(arr[idx], kind="stable")[::-1]]
+    idx = np.argpartition(arr, k - 1)[:k]
+    return idx[np.argsort(arr[idx], kind="stable")]
+
+
+def _introselect(keys: List[Any], items: Optional[List[Any]], k: int) -> None:
+    """原地重排，使 keys[k] 就位，且 [0, k) 不大于它、(k, n) 不小于它"""
+    lo, hi = 0, len(keys)
+    depth_limit = 2 * len(keys).bit_length()
+    while hi - lo > INSERTION_THRESHOLD:
+        if depth_limit == 0:
+            _heapsort_range(keys, items, lo, hi)
+            return
+        depth_limit -= 1
+        p = _partition(keys, items, lo, hi)
+        if k < p:
+            hi = p
+        else:
+            lo = p
+    _insertion_sort_range(keys, items, lo, hi)
+
+
+__all__ = [
+    "nth_element",
+    "partial_sort",
+    "top_k",
+    "top_k_indices",
+]
@@ -0,0 +1,81 @@
+"""
+NumPy 向量化排序后端
+
+对同构数值数据（np.ndarray、array.array、数值列表）按 dtype 分派到
+NumPy 的原生排序，避免逐元素的 Python 比较。值域相对 n 较小的整数数据
+自动改用线性时间的计数排序。任意对象与教学场景仍使用
+纯 Python 实现的排序算法。
+"""
+
+from typing import Any
+
+import numpy as np
+
+from ..dtypes import ArrayLike, require_numeric, wrap_like
+from .radix import counting_argsort, counting_sort_pays_off, counting_sort_values
+
+
+def vectorized_argsort(data: ArrayLike, reverse: bool = False, stable: bool = True) -> np.ndarray:
+    """
+    向量化的 argsort
+
+    Args:
+        data: 一维数值数据
+        reverse: 是否降序
+        stable: 是否稳定；降序时相等元素仍保持原有先后顺序
+
+    Returns:
+        排序后的下标数组
+    """
+    arr = require_numeric(data)
+    if counting_sort_pays_off(arr):
+        if not reverse:
+            return counting_argsort(arr)
+        n = len(arr)
+        return (n - 1) - counting_argsort(arr[::-1])[::-1]
+
+    kind = "stable" if stable else "quicksort"
+    if not reverse:
+        return np.argsort(arr, kind=kind)
+    if not stable:
+        return np.argsort(arr, kind=kind)[::-1]
+    # 对反转后的数组做稳定升序，再整体反转，相等元素保持原始顺序
+    n = len(arr)
+    return (n - 1) - np.argsort(arr[::-1], kind="stable")[::-1]
+
+
+def vectorized_sort(data: ArrayLike, reverse: bool = False, stable: bool = True,
+                    argsort: bool = False) -> Any:
+    """
+    向量化排序
+
+    Args:
+        data: 一维数值数据（np.ndarray、array.array 或数值列表）
+        reverse: 是否降序
+        stable: 是否使用稳定排序（NumPy 的 radix/timsort）；否则使用 introsort
+        argsort: 为 True 时返回排序下标而不是排序后的值
+
+    Returns:
+        与输入同类型的结果：ndarray 返回 ndarray，array.array 返回 array.array，
+        列表返回列表；argsort 时列表输入返回下标列表，其他输入返回 ndarray
+    """
+    arr = require_numeric(data)
+
+    if argsort:
+        order = vectorized_argsort(arr, reverse=reverse, stable=stable)
+        return order.tolist() if isinstance(data, (list, tuple)) else order
+
+    # 数值相等即不可区分，值排序无需关心稳定性
+    if counting_sort_pays_off(arr):
+        result = counting_sort_values(arr)
+    else:
+        result = np.sort(arr, kind="stable" if stable else "quicksort")
+    if reverse:
+        result = result[::-1]
+    return wrap_like(data, result)
+
+
+__all__ = [
+    "vectorized_argsort",
+    "vectorized_sort",
+]
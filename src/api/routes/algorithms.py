@@ -3,9 +3,13 @@
 """
 
 import time
-from typing import List
+from collections import OrderedDict
+from typing import List, Tuple
 from fastapi import APIRouter, HTTPException
 
+from ...algorithms.searching import LookupIndex
+from ...algorithms.sorting import select_engine, sort as library_sort
+from ...data_structures import BloomFilter
 from ...logging import get_logger
 from ..schemas import SortRequest, SortResponse, SearchRequest, SearchResponse
 
@@ -65,14 +69,68 @@ def linear_search(arr: List[float], target: float) -> int:
     return -1
 
 
+# 线性搜索的查找索引缓存（LRU），按数据集内容索引，按缓存的元素总数淘汰
+LOOKUP_CACHE_MAX_ELEMENTS = 1_000_000
+# 超过该长度的数据集不缓存：建键本身就要 O(n)，且单个数据集不应占满缓存
+LOOKUP_CACHE_MAX_DATASET = 100_000
+# 记录见过的数据集；只被查询一次的数据集扫描一遍比建索引便宜，第二次出现时才建索引
+SEEN_DATASETS_CAPACITY = 10000
+
+_lookup_cache: "OrderedDict[Tuple[float, ...], LookupIndex]" = OrderedDict()
+_lookup_cache_elements = 0
+_seen_datasets = BloomFilter(SEEN_DATASETS_CAPACITY)
+
+
+def cached_linear_search(arr: List[float], target: float) -> int:
+    """线性搜索；同一数据集再次出现时改用缓存的哈希查找索引"""
+    global _lookup_cache_elements
+    if len(arr) > LOOKUP_CACHE_MAX_DATASET:
+        return linear_search(arr, target)
+
+    dataset = tuple(arr)
+    index = _lookup_cache.get(dataset)
+    if index is None:
+        if _seen_datasets.is_full():
+            _seen_datasets.clear()
+        if not _seen_datasets.add(dataset):
+            return linear_search(arr, target)
+        index = LookupIndex(arr)
+        _lookup_cache[dataset] = index
+        _lookup_cache_elements += len(dataset)
+        while _lookup_cache_elements > LOOKUP_CACHE_MAX_ELEMENTS:
+            evicted, _ = _lookup_cache.popitem(last=False)
+            _lookup_cache_elements -= len(evicted)
+    else:
+        _lookup_cache.move_to_end(dataset)
+    return index.index_of(target)
+
+
+def auto_sort(arr: List[float], reverse: bool = False) -> Tuple[str, List[float]]:
+    """
+    根据输入画像自动选择排序引擎
+
+    Returns:
+        (实际使用的引擎名称, 排序结果)
+    """
+    engine, _ = select_engine(arr)
+    return engine, library_sort(arr, reverse=reverse, algorithm=engine)
+
+
+# 自动选择引擎的算法名；auto_sort 返回 (引擎, 结果)，与下表签名不同，由路由单独调用
+AUTO_SORT = "auto"
+
+# 可显式指定的排序算法，均直接返回排序结果
 SORT_ALGORITHMS = {
     "quick_sort": quick_sort,
     "bubble_sort": bubble_sort,
 }
 
+# 冒泡排序为 O(n^2)，只允许用于小数组
+MAX_BUBBLE_SORT_SIZE = 5000
+
 SEARCH_ALGORITHMS = {
     "binary_search": binary_search,
-    "linear_search": linear_search,
+    "linear_search": cached_linear_search,
 }
 
 
@@ -85,20 +143,32 @@ async def sort_array(request: SortRequest):
     """
     logger.info(f"排序请求: 算法={request.algorithm}, 数据长度={len(request.data)}")
 
-    if request.algorithm not in SORT_ALGORITHMS:
+    if request.algorithm != AUTO_SORT and request.algorithm not in SORT_ALGORITHMS:
         logger.error(f"不支持的排序算法: {request.algorithm}")
         raise HTTPException(status_code=400, detail=f"不支持的排序算法: {request.algorithm}")
 
+    if request.algorithm == "bubble_sort" and len(request.data) > MAX_BUBBLE_SORT_SIZE:
+        logger.error(f"冒泡排序数据量过大: {len(request.data)}")
+        raise HTTPException(
+            status_code=400,
+            detail=f"bubble_sort 最多支持 {MAX_BUBBLE_SORT_SIZE} 个元素，请使用 auto",
+        )
+
     try:
         start_time = time.time()
-        sorted_data = SORT_ALGORITHMS[request.algorithm](request.data, request.reverse)
+        if request.algorithm == AUTO_SORT:
+            engine, sorted_data = auto_sort(request.data, request.reverse)
+        else:
+            engine = request.algorithm
+            sorted_data = SORT_ALGORITHMS[request.algorithm](request.data, request.reverse)
         execution_time = time.time() - start_time
 
-        logger.info(f"排序完成: 耗时={execution_time:.4f}秒")
+        logger.info(f"排序完成: 引擎={engine}, 耗时={execution_time:.4f}秒")
 
         return SortResponse(
             sorted_data=sorted_data,
             algorithm=request.algorithm,
+            engine=engine,
             execution_time=execution_time,
         )
     except Exception as e:
@@ -139,7 +209,7 @@ async def list_sort_algorithms():
     """
     列出可用的排序算法
     """
-    return {"algorithms": list(SORT_ALGORITHMS.keys())}
+    return {"algorithms": [AUTO_SORT, *SORT_ALGORITHMS]}
 
 
 @router.get("/algorithms/search")
@@ -17,7 +17,7 @@ class SortRequest(BaseModel):
     """排序请求"""
 
     data: List[float] = Field(..., description="待排序数组")
-    algorithm: str = Field("quick_sort", description="排序算法名称")
+    algorithm: str = Field("auto", description="排序算法名称，auto 表示自动选择")
     reverse: bool = Field(False, description="是否降序")
 
 
@@ -26,6 +26,7 @@ class SortResponse(BaseModel):
 
     sorted_data: List[float] = Field(..., description="排序后的数组")
     algorithm: str = Field(..., description="使用的算法")
+    engine: Optional[str] = Field(None, description="实际执行的排序引擎")
     execution_time: float = Field(..., description="执行时间（秒）")
 
 
@@ -6,6 +6,10 @@
 
 from typing import Optional, Any, List
 
+from .bloom import BloomFilter
+from .indexed_heap import IndexedHeap
+from .disjoint_set import DisjointSet
+
 
 class Node:
     """链表节点"""
@@ -245,4 +249,7 @@ __all__ = [
     "Stack",
     "Queue",
     "MinHeap",
+    "BloomFilter",
+    "IndexedHeap",
+    "DisjointSet",
 ]
@@ -0,0 +1,92 @@
+"""
+布隆过滤器
+
+用很少的内存（误判率 1% 时每个元素约 1.2 字节）记录"见过哪些元素"：
+查询结果为 False 时元素一定不存在，为 True 时元素可能存在（有一定误判率）。
+"""
+
+import math
+from typing import Any, Iterable
+
+_MASK64 = (1 << 64) - 1
+
+
+def _mix64(z: int) -> int:
+    """splitmix64 终结函数，把 hash() 的结果打散到 64 位"""
+    z = (z + 0x9E3779B97F4A7C15) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+
+class BloomFilter:
+    """布隆过滤器"""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        """
+        Args:
+            capacity: 预计插入的元素个数
+            error_rate: 插入 capacity 个元素后期望的误判率
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        # 最优位数 m = -n ln p / (ln 2)^2，最优哈希个数 k = m / n * ln 2
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: Any) -> Iterable[int]:
+        # 双重哈希：第 i 个位置为 h1 + i * h2，只需计算一次 hash()
+        h1 = _mix64(hash(item) & _MASK64)
+        h2 = _mix64(h1) | 1
+        m = self.num_bits
+        return ((h1 + i * h2) % m for i in range(self.num_hashes))
+
+    def add(self, item: Any) -> bool:
+        """
+        添加元素
+
+        Returns:
+            添加前元素是否可能已存在
+        """
+        bits = self.bits
+        present = True
+        for pos in self._positions(item):
+            mask = 1 << (pos & 7)
+            if not bits[pos >> 3] & mask:
+                present = False
+                bits[pos >> 3] |= mask
+        if not present:
+            self.count += 1
+        return present
+
+    def update(self, items: Iterable[Any]):
+        """批量添加元素"""
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item: Any) -> bool:
+        bits = self.bits
+        for pos in self._positions(item):
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def __len__(self) -> int:
+        """已添加的不同元素个数（近似值，误判的重复添加不计数）"""
+        return self.count
+
+    def clear(self):
+        """清空过滤器"""
+        self.bits = bytearray(len(self.bits))
+        self.count = 0
+
+    def is_full(self) -> bool:
+        """元素个数是否已达到容量，此后误判率会高于 error_rate"""
+        return self.count >= self.capacity
@@ -0,0 +1,152 @@
+"""
+索引 d 叉最小堆
+
+元素是 0..capacity-1 的整数编号，每个编号在堆中至多出现一次。位置表记录每个元素在堆数组中的
+下标，因此可以在 O(log_d n) 时间内降低任意元素的优先级（decrease_key），不必像 heapq 那样
+为同一元素压入多个过期项：堆的大小始终不超过 capacity。
+
+优先级保存在按编号索引的 keys 数组中，可以由调用方传入（例如 Dijkstra 的距离数组），
+此时堆直接读写该数组，不再另外保存一份优先级。
+"""
+
+from typing import Any, List, Optional, Tuple
+
+
+class IndexedHeap:
+    """整数编号元素的索引 d 叉最小堆"""
+
+    def __init__(self, capacity: int, arity: int = 4, keys: Optional[Any] = None):
+        """
+        Args:
+            capacity: 元素编号上限，元素编号取值为 0..capacity-1
+            arity: 每个节点的子节点数，默认 4（比二叉堆层数更少，下沉时比较更集中）
+            keys: 按编号索引的可写优先级数组（list、array 或 memoryview），默认新建；
+                元素出堆后其优先级仍保留在 keys 中
+        """
+        if capacity < 0:
+            raise ValueError("capacity must be non-negative")
+        if arity < 2:
+            raise ValueError("arity must be at least 2")
+        if keys is None:
+            keys = [0.0] * capacity
+        elif len(keys) < capacity:
+            raise ValueError("keys must have at least capacity elements")
+
+        self.capacity = capacity
+        self.arity = arity
+        self.keys = keys
+        self._heap: List[int] = []
+        # 元素在 _heap 中的下标，不在堆中为 -1
+        self._pos: List[int] = [-1] * capacity
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, item: int) -> bool:
+        return 0 <= item < self.capacity and self._pos[item] >= 0
+
+    def priority(self, item: int) -> float:
+        """返回元素当前的优先级"""
+        if item not in self:
+            raise KeyError(item)
+        return self.keys[item]
+
+    def push(self, item: int, priority: float):
+        """插入不在堆中的元素"""
+        if not 0 <= item < self.capacity:
+            raise IndexError("item out of range")
+        if self._pos[item] >= 0:
+            raise ValueError("item is already in the heap")
+        self.keys[item] = priority
+        self._heap.append(item)
+        self._sift_up(item, priority, len(self._heap) - 1)
+
+    def decrease_key(self, item: int, priority: float):
+        """把堆中元素的优先级降低为 priority"""
+        if item not in self:
+            raise KeyError(item)
+        if priority > self.keys[item]:
+            raise ValueError("new priority is greater than the current priority")
+        self.keys[item] = priority
+        self._sift_up(item, priority, self._pos[item])
+
+    def push_or_decrease(self, item: int, priority: float) -> bool:
+        """
+        元素不在堆中时插入，在堆中且 priority 更小时降低其优先级
+
+        Returns:
+            堆是否发生变化
+        """
+        i = self._pos[item]
+        if i < 0:
+            self.keys[item] = priority
+            self._heap.append(item)
+            self._sift_up(item, priority, len(self._heap) - 1)
+            return True
+        if priority < self.keys[item]:
+            self.keys[item] = priority
+            self._sift_up(item, priority, i)
+            return True
+        return False
+
+    def peek(self) -> Tuple[int, float]:
+        """返回优先级最小的 (元素, 优先级)，不出堆"""
+        if not self._heap:
+            raise IndexError("Heap is empty")
+        top = self._heap[0]
+        return top, self.keys[top]
+
+    def pop(self) -> Tuple[int, float]:
+        """弹出优先级最小的元素，返回 (元素, 优先级)"""
+        heap = self._heap
+        if not heap:
+            raise IndexError("Heap is empty")
+        top = heap[0]
+        last = heap.pop()
+        self._pos[top] = -1
+        if heap:
+            self._sift_down(last, 0)
+        return top, self.keys[top]
+
+    def clear(self):
+        """清空堆（keys 中的优先级保持不变）"""
+        pos = self._pos
+        for item in self._heap:
+            pos[item] = -1
+        self._heap.clear()
+
+    def _sift_up(self, item: int, key: float, i: int):
+        # 空位上移：父节点依次下移，最后把 item 放入空位，每层只写一次
+        heap, pos, keys, d = self._heap, self._pos, self.keys, self.arity
+        while i > 0:
+            parent = (i - 1) // d
+            p = heap[parent]
+            if keys[p] <= key:
+                break
+            heap[i] = p
+            pos[p] = i
+            i = parent
+        heap[i] = item
+        pos[item] = i
+
+    def _sift_down(self, item: int, i: int):
+        heap, pos, keys, d = self._heap, self._pos, self.keys, self.arity
+        key = keys[item]
+        n = len(heap)
+        while True:
+            first = i * d + 1
+            if first >= n:
+                break
+            best, best_key = first, keys[heap[first]]
+            for c in range(first + 1, min(first + d, n)):
+                k = keys[heap[c]]
+                if k < best_key:
+                    best, best_key = c, k
+            if best_key >= key:
+                break
+            child = heap[best]
+            heap[i] = child
+            pos[child] = i
+            i = best
+        heap[i] = item
+        pos[item] = i
@@ -0,0 +1,453 @@
+"""
+图算法测试
+"""
+
+import random
+
+import numpy as np
+import pytest
+from src.algorithms.graph import (
+    Graph, CSRGraph, iter_bfs, iter_dfs, shortest_path, astar, bidirectional_dijkstra,
+    dijkstra_distances, multi_source_dijkstra, save_binary_edges, load_binary_edges,
+    read_csv_edges, load_csv_edges, save_graph, load_graph, connected_components,
+    strongly_connected_components, incremental_components, kruskal, prim,
+)
+from src.algorithms.graph.csr import INDEXED_HEAP_MIN_DEGREE
+from src.algorithms.graph.mst import PRIM_VECTOR_MIN_DEGREE
+
+
+def random_graph(directed, nodes=60, edges=200, seed=0):
+    """生成节点编号不连续的随机带权图"""
+    rng = random.Random(seed)
+    graph = Graph(directed=directed)
+    for _ in range(edges):
+        graph.add_edge(rng.randrange(nodes) * 7, rng.randrange(nodes) * 7, rng.uniform(0.5, 5))
+    return graph
+
+
+class TestCSRGraph:
+    """CSR 图表示测试"""
+    
+    @pytest.mark.parametrize("directed", [False, True])
+    def test_matches_graph_traversals(self, directed):
+        graph = random_graph(directed)
+        csr = graph.to_csr()
+        for start in list(graph.graph)[:10]:
+            assert csr.bfs(start).tolist() == graph.bfs(start)
+            assert csr.dfs(start).tolist() == graph.dfs(start)
+            expected = {node: d for node, d in graph.dijkstra(start).items() if d != float("inf")}
+            actual = csr.distances_dict(csr.dijkstra(start))
+            assert actual.keys() == expected.keys()
+            assert all(actual[node] == pytest.approx(expected[node]) for node in expected)
+    
+    @pytest.mark.parametrize("directed", [False, True])
+    def test_dense_dijkstra_uses_indexed_heap(self, directed):
+        # 平均出度超过阈值时 Graph 与 CSRGraph 都改用索引堆，结果应与稀疏路径一致
+        sparse = random_graph(directed, nodes=30, edges=120, seed=3)
+        dense = random_graph(directed, nodes=30, edges=120, seed=3)
+        for _ in range(INDEXED_HEAP_MIN_DEGREE * 30):
+            dense.add_edge(0, 7, 1000.0)
+        assert dense.to_csr().num_edges >= INDEXED_HEAP_MIN_DEGREE * len(dense.graph)
+        for start in (0, 7, 14):
+            expected = sparse.dijkstra(start)
+            actual = dense.dijkstra(start)
+            assert actual.keys() == expected.keys()
+            assert all(actual[node] == pytest.approx(expected[node]) for node in expected)
+            csr = dense.to_csr()
+            assert csr.distances_dict(csr.dijkstra(start)) == pytest.approx(
+                {node: d for node, d in actual.items() if d != float("inf")})
+    
+    def test_dijkstra_distances_adjacency(self):
+        # 汇点只出现在邻接列表中；不可达的节点为 inf；稠密时结果与稀疏路径一致
+        adjacency = {"a": [("b", 1.0), ("c", 4.0)], "b": [("c", 2.0), ("sink", 5.0)], "x": []}
+        expected = {"a": 0, "b": 1.0, "c": 3.0, "sink": 6.0, "x": float("inf")}
+        assert dijkstra_distances(adjacency, "a") == expected
+        dense = {**adjacency, "a": adjacency["a"] + [("b", 9.0)] * (INDEXED_HEAP_MIN_DEGREE * 4)}
+        assert dijkstra_distances(dense, "a") == expected
+    
+    def test_from_edges(self):
+        csr = CSRGraph.from_edges([0, 0, 1, 3], [1, 2, 2, 3], [1.0, 4.0, 2.0, 1.0])
+        assert csr.num_nodes == 4 and csr.num_edges == 4
+        assert csr.indptr.tolist() == [0, 2, 4, 6, 8]
+        neighbors, weights = csr.neighbors(2)
+        assert neighbors.tolist() == [0, 1] and weights.tolist() == [4.0, 2.0]
+        assert csr.dijkstra(0).tolist() == [0.0, 1.0, 3.0, np.inf]
+        assert csr.bfs(3).tolist() == [3]
+        
+        directed = CSRGraph.from_edges([0, 1], [1, 2], directed=True, num_nodes=5)
+        assert directed.degree().tolist() == [1, 1, 0, 0, 0]
+        assert directed.bfs(2).tolist() == [2]
+    
+    def test_relabel_and_validation(self):
+        csr = CSRGraph.from_edges([100, -5], [-5, 7], relabel=True)
+        assert csr.node_ids.tolist() == [-5, 7, 100]
+        assert csr.dfs(100).tolist() == [100, -5, 7]
+        with pytest.raises(KeyError):
+            csr.index_of(8)
+        with pytest.raises(ValueError):
+            CSRGraph.from_edges([-1], [0])
+        with pytest.raises(ValueError):
+            CSRGraph.from_edges([0], [3], num_nodes=2)
+        with pytest.raises(ValueError):
+            CSRGraph([0, 2], [1])
+        with pytest.raises(ValueError):
+            csr.indices[0] = 1
+    
+    def test_deep_path_graph(self):
+        n = 50000
+        csr = CSRGraph.from_edges(np.arange(n - 1), np.arange(1, n))
+        assert csr.dfs(0).tolist() == list(range(n))
+        assert csr.dijkstra(0)[-1] == n - 1
+
+
+def tree_graph():
+    """
+    0 -> 1 -> 3
+      |    -> 4
+      -> 2 -> 5
+    """
+    graph = Graph(directed=True)
+    for u, v in [(0, 1), (0, 2), (1, 3), (1, 4), (2, 5)]:
+        graph.add_edge(u, v)
+    return graph
+
+
+class TestTraversal:
+    """遍历生成器测试"""
+    
+    @pytest.mark.parametrize("to_csr", [False, True])
+    def test_orders_and_depths(self, to_csr):
+        graph = tree_graph().to_csr() if to_csr else tree_graph()
+        assert list(iter_bfs(graph, 0)) == [0, 1, 2, 3, 4, 5]
+        assert list(iter_bfs(graph, 0, with_depth=True, max_depth=1)) == [(0, 0), (1, 1), (2, 1)]
+        assert list(iter_dfs(graph, 0)) == [0, 1, 3, 4, 2, 5]
+        assert list(iter_dfs(graph, 0, order="post")) == [3, 4, 1, 5, 2, 0]
+        assert list(iter_dfs(graph, 0, with_depth=True)) == [
+            (0, 0), (1, 1), (3, 2), (4, 2), (2, 1), (5, 2)
+        ]
+        assert list(iter_dfs(graph, 0, order="post", max_depth=1)) == [1, 2, 0]
+        assert list(iter_dfs(graph, 0, max_depth=0)) == [0]
+        with pytest.raises(ValueError):
+            list(iter_dfs(graph, 0, order="in"))
+    
+    def test_deep_path_graph_does_not_recurse(self):
+        graph = Graph()
+        n = 20000
+        for i in range(n - 1):
+            graph.add_edge(i, i + 1)
+        assert graph.dfs(0) == list(range(n))
+        assert list(iter_dfs(graph, 0, order="post"))[:2] == [n - 1, n - 2]
+        assert graph.bfs(n - 1)[-1] == 0
+    
+    def test_lazy_early_stop(self):
+        graph = CSRGraph.from_edges(np.arange(10**6 - 1), np.arange(1, 10**6))
+        first = []
+        for node in iter_dfs(graph, 0):
+            first.append(node)
+            if len(first) == 3:
+                break
+        assert first == [0, 1, 2]
+    
+    def test_bfs_marks_on_enqueue(self):
+        graph = Graph()
+        for u in range(1, 50):
+            graph.add_edge(0, u)
+            for v in range(1, u):
+                graph.add_edge(u, v)
+        assert graph.bfs(0) == list(range(50))
+        assert graph.bfs(99) == [99]
+        assert 99 not in graph.graph
+
+
+def path_length(graph, path):
+    """按 Graph 中的最小平行边权计算路径长度"""
+    return sum(min(w for v, w in graph.graph[a] if v == b) for a, b in zip(path, path[1:]))
+
+
+class TestShortestPaths:
+    """点对点最短路径测试"""
+    
+    @pytest.mark.parametrize("directed", [False, True])
+    @pytest.mark.parametrize("search", [shortest_path, bidirectional_dijkstra])
+    def test_matches_full_dijkstra(self, directed, search):
+        graph = random_graph(directed, nodes=40, edges=120, seed=5)
+        nodes = sorted(graph.to_csr().node_ids.tolist())
+        for source in nodes[::4]:
+            expected = graph.dijkstra(source)
+            for target in nodes[::3]:
+                best = 0.0 if source == target else expected.get(target, float("inf"))
+                for g in (graph, graph.to_csr()):
+                    distance, path = search(g, source, target)
+                    if best == float("inf"):
+                        assert distance == best and path == []
+                    else:
+                        assert distance == pytest.approx(best)
+                        assert path[0] == source and path[-1] == target
+                        assert path_length(graph, path) == pytest.approx(distance)
+    
+    def test_astar_on_grid(self):
+        side = 20
+        graph = Graph()
+        for r in range(side):
+            for c in range(side):
+                if c + 1 < side:
+                    graph.add_edge(r * side + c, r * side + c + 1, 1.0)
+                if r + 1 < side:
+                    graph.add_edge(r * side + c, (r + 1) * side + c, 1.0)
+        
+        def manhattan(node, target):
+            return abs(node // side - target // side) + abs(node % side - target % side)
+        
+        distance, path = astar(graph, 0, side * side - 1, manhattan)
+        assert distance == 2 * (side - 1)
+        assert len(path) == 2 * side - 1
+        assert graph.shortest_path(0, side * side - 1, manhattan)[0] == distance
+        assert graph.shortest_path(0, 0) == (0.0, [0])
+        assert graph.shortest_path(0, 10**6) == (float("inf"), [])
+
+
+class TestMultiSourceDijkstra:
+    """多源最短路径测试"""
+    
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_matches_single_source(self, workers):
+        graph = random_graph(True, nodes=50, edges=300, seed=11)
+        csr = graph.to_csr()
+        sources = csr.node_ids[::5].tolist()
+        matrix = multi_source_dijkstra(csr, sources, workers=workers)
+        assert matrix.dtype == np.float32 and matrix.shape == (len(sources), csr.num_nodes)
+        for row, source in zip(matrix, sources):
+            np.testing.assert_allclose(row, csr.dijkstra(source), rtol=1e-6)
+    
+    def test_max_distance_and_out(self):
+        csr = CSRGraph.from_edges(np.arange(9), np.arange(1, 10), np.full(9, 2.0))
+        out = np.zeros((2, 10), dtype=np.float32)
+        result = multi_source_dijkstra(csr, [0, 9], workers=1, max_distance=5, out=out)
+        assert result is out
+        assert out[0].tolist() == [0, 2, 4] + [np.inf] * 7
+        assert out[1].tolist() == [np.inf] * 7 + [4, 2, 0]
+        with pytest.raises(ValueError):
+            multi_source_dijkstra(csr, [0], out=np.zeros((2, 10), dtype=np.float32))
+    
+    def test_accepts_graph(self):
+        graph = tree_graph()
+        matrix = multi_source_dijkstra(graph, [0, 2], workers=2)
+        assert matrix[0].tolist() == [0, 1, 1, 2, 2, 2]
+        assert matrix[1].tolist() == [np.inf, np.inf, 0, np.inf, np.inf, 1]
+
+
+class TestEdgeLoading:
+    """批量构建与边列表文件加载测试"""
+    
+    @pytest.mark.parametrize("directed", [False, True])
+    def test_graph_from_edges_matches_add_edge(self, directed):
+        rng = np.random.default_rng(1)
+        src = rng.integers(-20, 40, size=300)
+        dst = rng.integers(-20, 40, size=300)
+        weights = rng.random(300)
+        expected = Graph(directed=directed)
+        for u, v, w in zip(src.tolist(), dst.tolist(), weights.tolist()):
+            expected.add_edge(u, v, w)
+        graph = Graph.from_edges(src, dst, weights, directed=directed)
+        assert graph.directed == directed
+        assert dict(graph.graph) == dict(expected.graph)
+        
+        unweighted = Graph.from_edges(np.array([1, 2]), np.array([2, 3]))
+        assert unweighted.graph[2] == [(1, 1.0), (3, 1.0)]
+    
+    def test_binary_edges_round_trip(self, tmp_path):
+        src, dst = np.array([0, 0, 1, 5]), np.array([1, 2, 2, 5])
+        weights = np.array([1.0, 4.0, 2.0, 0.5])
+        path = tmp_path / "edges.bin"
+        save_binary_edges(path, src, dst, weights, index_dtype=np.int32)
+        csr = load_binary_edges(path, index_dtype=np.int32, directed=True)
+        expected = CSRGraph.from_edges(src, dst, weights, directed=True)
+        assert csr.indptr.tolist() == expected.indptr.tolist()
+        assert csr.indices.tolist() == expected.indices.tolist()
+        assert csr.weights.tolist() == expected.weights.tolist()
+        
+        save_binary_edges(path, src, dst)
+        unweighted = load_binary_edges(path, weight_dtype=None)
+        assert unweighted.weights.tolist() == [1.0] * 8
+        path.write_bytes(b"\0" * 7)
+        with pytest.raises(ValueError):
+            load_binary_edges(path)
+    
+    @pytest.mark.parametrize("chunk_rows", [1, 2, 3, 100])
+    def test_csv_edges_in_chunks(self, tmp_path, chunk_rows):
+        path = tmp_path / "edges.csv"
+        path.write_text("src,dst,weight\n10,20,1.5\n# comment\n20,30,2\n10,30,4\n")
+        src, dst, weights = read_csv_edges(path, skip_header=True, chunk_rows=chunk_rows)
+        assert src.tolist() == [10, 20, 10]
+        assert dst.tolist() == [20, 30, 30]
+        assert weights.tolist() == [1.5, 2.0, 4.0]
+        csr = load_csv_edges(path, skip_header=True, relabel=True, chunk_rows=chunk_rows)
+        assert csr.node_ids.tolist() == [10, 20, 30]
+        assert csr.distances_dict(csr.dijkstra(10)) == {10: 0.0, 20: 1.5, 30: 3.5}
+
+
+class TestGraphFile:
+    """二进制图文件测试"""
+    
+    @pytest.mark.parametrize("mmap", [True, False])
+    def test_round_trip(self, tmp_path, mmap):
+        graph = random_graph(directed=True)
+        path = tmp_path / "graph.csr"
+        save_graph(graph, path)
+        expected = graph.to_csr()
+        loaded = load_graph(path, mmap=mmap)
+        assert loaded.directed and loaded.num_nodes == expected.num_nodes
+        for name in ("indptr", "indices", "weights", "node_ids"):
+            actual = getattr(loaded, name)
+            assert actual.dtype == getattr(expected, name).dtype
+            assert actual.tolist() == getattr(expected, name).tolist()
+            assert not actual.flags.writeable
+        assert (loaded.path is not None) == mmap
+        start = expected.node_of(0)
+        assert loaded.bfs(start).tolist() == expected.bfs(start).tolist()
+        
+        plain = CSRGraph.from_edges([0, 1], [1, 2], [0.5, 1.5])
+        save_graph(plain, path)
+        reloaded = load_graph(path)
+        assert reloaded.node_ids is None and not reloaded.directed
+        assert reloaded.dijkstra(0).tolist() == [0.0, 0.5, 2.0]
+    
+    def test_invalid_files(self, tmp_path):
+        path = tmp_path / "graph.csr"
+        path.write_bytes(b"\0" * 200)
+        with pytest.raises(ValueError):
+            load_graph(path)
+        save_graph(CSRGraph.from_edges([0, 1], [1, 2]), path)
+        data = path.read_bytes()
+        path.write_bytes(data[:-8])
+        with pytest.raises(ValueError):
+            load_graph(path)
+        path.write_bytes(data[:8] + b"\x09" + data[9:])
+        with pytest.raises(ValueError):
+            load_graph(path)
+    
+    def test_multi_source_workers_map_file(self, tmp_path):
+        path = tmp_path / "graph.csr"
+        csr = random_graph(directed=False).to_csr()
+        save_graph(csr, path)
+        loaded = load_graph(path)
+        sources = csr.node_ids[:4].tolist()
+        np.testing.assert_array_equal(multi_source_dijkstra(loaded, sources, workers=2),
+                                      multi_source_dijkstra(csr, sources, workers=1))
+
+
+def partition(labels):
+    """标签数组对应的节点划分（与标签编号无关）"""
+    groups = {}
+    for node, label in enumerate(np.asarray(labels).tolist()):
+        groups.setdefault(label, []).append(node)
+    return sorted(groups.values())
+
+
+class TestComponents:
+    """连通分量测试"""
+    
+    @pytest.mark.parametrize("directed", [False, True])
+    def test_connected_components_match_bfs(self, directed):
+        graph = random_graph(directed, nodes=80, edges=60, seed=5)
+        csr = graph.to_csr()
+        labels = connected_components(graph)
+        src = np.repeat(np.arange(csr.num_nodes), csr.degree())
+        undirected = CSRGraph.from_edges(src, csr.indices, num_nodes=csr.num_nodes)
+        expected, seen = [], set()
+        for node in range(csr.num_nodes):
+            if node not in seen:
+                reached = undirected.bfs(node).tolist()
+                seen.update(reached)
+                expected.append(sorted(reached))
+        assert partition(labels) == sorted(expected)
+        assert labels.max() + 1 == len(expected)
+    
+    def test_strongly_connected_components(self):
+        # 0 -> 1 -> 2 -> 0 构成环，3 <-> 4 构成环，5 孤立，2 -> 3 连接两个环
+        csr = CSRGraph.from_edges([0, 1, 2, 2, 3, 4], [1, 2, 0, 3, 4, 3], directed=True,
+                                  num_nodes=6)
+        labels = strongly_connected_components(csr)
+        assert partition(labels) == [[0, 1, 2], [3, 4], [5]]
+        # 逆拓扑序：边 2 -> 3 的起点分量标签更大
+        assert labels[2] > labels[3]
+        assert partition(strongly_connected_components(random_graph(False))) == partition(
+            connected_components(random_graph(False)))
+    
+    def test_scc_matches_reachability(self):
+        graph = random_graph(True, nodes=40, edges=90, seed=2)
+        csr = graph.to_csr()
+        reach = [set(csr.bfs(csr.node_of(u)).tolist()) for u in range(csr.num_nodes)]
+        labels = strongly_connected_components(csr).tolist()
+        ids = csr.node_ids.tolist()
+        for u in range(csr.num_nodes):
+            for v in range(csr.num_nodes):
+                mutual = ids[v] in reach[u] and ids[u] in reach[v]
+                assert (labels[u] == labels[v]) == mutual
+    
+    def test_deep_scc_without_recursion(self):
+        n = 20000
+        ring = CSRGraph.from_edges(np.arange(n), (np.arange(n) + 1) % n, directed=True)
+        assert strongly_connected_components(ring).tolist() == [0] * n
+        path = CSRGraph.from_edges(np.arange(n - 1), np.arange(1, n), directed=True)
+        assert len(set(strongly_connected_components(path).tolist())) == n
+    
+    def test_incremental_components(self):
+        counts = incremental_components([0, 2, 1, 0], [1, 3, 0, 3], num_nodes=5)
+        assert counts.tolist() == [4, 3, 3, 2]
+        assert incremental_components([], []).tolist() == []
+
+
+def tree_edges(csr, positions):
+    """边位置数组对应的无序端点对集合"""
+    src = csr.edge_sources()[positions].tolist()
+    dst = csr.indices[positions].tolist()
+    return {(min(u, v), max(u, v)) for u, v in zip(src, dst)}
+
+
+class TestMinimumSpanningTree:
+    """最小生成树测试"""
+    
+    def test_small_graph(self):
+        csr = CSRGraph.from_edges([0, 0, 1, 1, 2, 3], [1, 2, 2, 3, 3, 3],
+                                  [1.0, 4.0, 2.0, 6.0, 3.0, 0.5])
+        for mst in (kruskal, prim):
+            positions = mst(csr)
+            assert tree_edges(csr, positions) == {(0, 1), (1, 2), (2, 3)}
+            assert csr.weights[positions].sum() == 6.0
+        assert csr.weights[kruskal(csr)].tolist() == [1.0, 2.0, 3.0]
+    
+    @pytest.mark.parametrize("edges", [40, 400])
+    def test_kruskal_matches_prim(self, edges):
+        # 随机权重互不相同，最小生成森林唯一
+        graph = random_graph(False, nodes=60, edges=edges, seed=edges)
+        csr = graph.to_csr()
+        forest = kruskal(graph)
+        assert tree_edges(csr, forest) == tree_edges(csr, prim(graph))
+        components = connected_components(csr).max() + 1
+        assert len(forest) == csr.num_nodes - components
+        assert connected_components(CSRGraph.from_edges(
+            csr.edge_sources()[forest], csr.indices[forest],
+            num_nodes=csr.num_nodes)).tolist() == connected_components(csr).tolist()
+        start = csr.node_of(5)
+        assert tree_edges(csr, prim(csr, start)) == tree_edges(csr, forest)
+    
+    def test_dense_prim(self):
+        # 度数超过 PRIM_VECTOR_MIN_DEGREE 时 Prim 走向量化筛选路径；含重边
+        rng = np.random.default_rng(4)
+        src = rng.integers(0, 150, size=30000)
+        dst = rng.integers(0, 150, size=30000)
+        weights = rng.integers(1, 50, size=30000).astype(float)
+        csr = CSRGraph.from_edges(src, dst, weights)
+        assert csr.degree().min() >= PRIM_VECTOR_MIN_DEGREE
+        positions = prim(csr)
+        assert len(positions) == csr.num_nodes - 1
+        assert csr.weights[positions].sum() == csr.weights[kruskal(csr)].sum()
+    
+    def test_requires_undirected(self):
+        directed = CSRGraph.from_edges([0], [1], directed=True)
+        for mst in (kruskal, prim):
+            with pytest.raises(ValueError):
+                mst(directed)
+        assert kruskal(CSRGraph.from_edges([], [], num_nodes=3)).tolist() == []
+        assert prim(CSRGraph.from_edges([], [], num_nodes=3)).tolist() == []
@@ -28,3 +28,295 @@ class TestSearchingAlgorithms:
         arr = []
         assert binary_search(arr, 5) == -1
         assert linear_search(arr, 5) == -1
+    
+    def test_binary_search_precomputed_keys(self):
+        from src.algorithms.keys import CountingKey, precompute_keys
+        records = [{"ts": str(t)} for t in range(0, 100, 5)]
+        counted = CountingKey(lambda r: int(r["ts"]))
+        keys = precompute_keys(records, counted)
+        assert counted.calls == len(records)
+        for t in (0, 35, 95):
+            assert binary_search(records, {"ts": str(t)}, key=counted, keys=keys) == t // 5
+        # 只为目标值调用 key
+        assert counted.calls == len(records) + 3
+
+
+class TestBatchSearch:
+    
+    def test_binary_search_many(self):
+        import numpy as np
+        from src.algorithms.searching import binary_search_many
+        arr = np.array([1, 3, 5, 7, 9, 11, 13])
+        targets = np.array([7, 6, 1, 13, 14, 0])
+        assert binary_search_many(arr, targets).tolist() == [3, -1, 0, 6, -1, -1]
+        assert binary_search_many(arr, targets, missing=len(arr)).tolist() == [3, 7, 0, 6, 7, 7]
+        assert binary_search_many([], [1, 2]).tolist() == [-1, -1]
+    
+    def test_matches_scalar_search(self):
+        import numpy as np
+        from src.algorithms.searching import binary_search_many
+        rng = np.random.default_rng(16)
+        arr = np.unique(rng.integers(0, 10**6, size=10**5))
+        targets = rng.integers(0, 10**6, size=10**4)
+        result = binary_search_many(arr, targets)
+        expected = [binary_search(arr.tolist(), int(t)) for t in targets[:200]]
+        assert result[:200].tolist() == expected
+    
+    def test_key_and_precomputed_keys(self):
+        from src.algorithms.keys import CountingKey, precompute_keys
+        from src.algorithms.searching import binary_search_many
+        records = [{"id": i} for i in range(0, 50, 10)]
+        counted = CountingKey(lambda r: r["id"])
+        keys = precompute_keys(records, counted)
+        result = binary_search_many(records, [{"id": 30}, {"id": 35}], keys=keys, key=counted)
+        assert result.tolist() == [3, -1]
+        assert counted.calls == len(records) + 2
+
+
+class TestBounds:
+    
+    def test_scalar_bounds(self):
+        from src.algorithms.searching import count_range, equal_range, lower_bound, upper_bound
+        arr = [1, 2, 2, 2, 5, 8, 8, 13]
+        assert lower_bound(arr, 2) == 1
+        assert upper_bound(arr, 2) == 4
+        assert equal_range(arr, 8) == (5, 7)
+        assert equal_range(arr, 3) == (4, 4)
+        assert lower_bound(arr, 0) == 0
+        assert upper_bound(arr, 100) == len(arr)
+        assert count_range(arr, 2, 8) == 4
+        assert count_range(arr, 9, 2) == 0
+        assert count_range([], 0, 10) == 0
+    
+    def test_bounds_with_key(self):
+        from src.algorithms.keys import precompute_keys
+        from src.algorithms.searching import count_range, equal_range
+        events = [{"ts": t} for t in (10, 20, 20, 30, 40)]
+        get_ts = lambda e: e["ts"]
+        assert equal_range(events, {"ts": 20}, key=get_ts) == (1, 3)
+        keys = precompute_keys(events, get_ts)
+        assert count_range(events, 15, 35, keys=keys) == 3
+    
+    def test_batch_bounds(self):
+        import numpy as np
+        from src.algorithms.searching import (
+            count_range, count_range_many, equal_range_many, lower_bound, lower_bound_many,
+            upper_bound, upper_bound_many,
+        )
+        rng = np.random.default_rng(17)
+        arr = np.sort(rng.integers(0, 100, size=500))
+        targets = rng.integers(-5, 105, size=200)
+        lows = lower_bound_many(arr, targets)
+        highs = upper_bound_many(arr, targets)
+        values = arr.tolist()
+        assert lows.tolist() == [lower_bound(values, int(t)) for t in targets]
+        assert highs.tolist() == [upper_bound(values, int(t)) for t in targets]
+        first, last = equal_range_many(arr, targets)
+        assert np.array_equal(first, lows) and np.array_equal(last, highs)
+        his = targets + 10
+        assert count_range_many(arr, targets, his).tolist() == [
+            count_range(values, int(a), int(b)) for a, b in zip(targets, his)
+        ]
+
+
+class TestAdaptiveSearch:
+    
+    def test_interpolation_search(self):
+        import random
+        from src.algorithms.searching import interpolation_search
+        rng = random.Random(18)
+        uniform = sorted(rng.sample(range(10**6), 5000))
+        skewed = sorted(int(rng.random() ** 8 * 10**9) for _ in range(5000))
+        for arr in (uniform, skewed, [5] * 10, [1, 2, 3]):
+            values = set(arr)
+            for target in list(values)[:200] + [-1, 10**10, 4]:
+                idx = interpolation_search(arr, target)
+                if target in values:
+                    assert arr[idx] == target
+                else:
+                    assert idx == -1
+        assert interpolation_search([], 3) == -1
+    
+    def test_interpolation_search_large_int64_keys(self):
+        # 纳秒时间戳量级的 int64 键：插值计算不能在 NumPy 整数中溢出
+        import warnings
+        import numpy as np
+        from src.algorithms.searching import interpolation_search
+        rng = np.random.default_rng(19)
+        arr = np.sort(rng.integers(1_600_000_000 * 10**9, 1_700_000_000 * 10**9,
+                                   size=100_000, dtype=np.int64))
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", RuntimeWarning)
+            for idx in rng.integers(0, len(arr), size=200).tolist():
+                assert arr[interpolation_search(arr, arr[idx])] == arr[idx]
+            missing = arr[0] + 1
+            expected = -1 if arr[1] != missing else 1
+            assert interpolation_search(arr, missing) == expected
+    
+    def test_interpolation_search_infinite_endpoints(self):
+        # 端点为 ±inf 时插值比例为 NaN，应退化为二分搜索而不是报错
+        from src.algorithms.searching import interpolation_search
+        inf = float("inf")
+        assert interpolation_search([-inf, 0.0, 1.0, 2.0], 1.0) == 2
+        assert interpolation_search([0.0, 1.0, 2.0, inf], 1.0) == 1
+        assert interpolation_search([-inf, 0.0, 1.0, inf], 0.5) == -1
+        assert interpolation_search([-inf, 0.0, 1.0, inf], -inf) == 0
+        assert interpolation_search([-1e308, 0.0, 1e308], 0.0) == 1
+    
+    def test_exponential_search_sequences(self):
+        from src.algorithms.searching import exponential_search
+        arr = list(range(0, 2000, 2))
+        assert exponential_search(arr, 0) == 0
+        assert exponential_search(arr, 1998) == 999
+        assert exponential_search(arr, 1000) == 500
+        assert exponential_search(arr, 1001) == -1
+        assert exponential_search(arr, 5000) == -1
+        assert exponential_search([], 1) == -1
+    
+    def test_exponential_search_unbounded_and_streams(self):
+        import itertools
+        from src.algorithms.searching import exponential_search
+        
+        class Squares:
+            """只支持下标访问的有序序列，越界抛出 IndexError"""
+            
+            def __init__(self, limit):
+                self.limit = limit
+            
+            def __getitem__(self, i):
+                if i >= self.limit:
+                    raise IndexError(i)
+                return i * i
+        
+        assert exponential_search(Squares(10**6), 144) == 12
+        assert exponential_search(Squares(100), 99 * 99) == 99
+        assert exponential_search(Squares(100), 100 * 100) == -1
+        assert exponential_search(Squares(0), 0) == -1
+        assert exponential_search(itertools.count(0, 3), 300) == 100
+        assert exponential_search(iter([1, 3, 5]), 4) == -1
+        assert exponential_search(iter([1, 3, 5]), 5) == 2
+        assert exponential_search(iter([]), 5) == -1
+
+
+class TestStaticSearchIndex:
+    """静态搜索索引测试"""
+    
+    def test_queries_match_sorted_array(self):
+        import numpy as np
+        from src.algorithms.searching import StaticSearchIndex
+        
+        rng = np.random.default_rng(0)
+        for n in [0, 1, 2, 3, 7, 8, 100, 1000]:
+            arr = np.sort(rng.integers(0, 2 * n + 1, size=n))
+            index = StaticSearchIndex(arr)
+            targets = np.arange(-2, 2 * n + 3)
+            lower = np.searchsorted(arr, targets, side="left")
+            expected = [int(lo) if lo < n and arr[lo] == t else -1
+                        for lo, t in zip(lower, targets)]
+            
+            assert np.array_equal(index.to_sorted(), arr)
+            assert np.array_equal(index.lower_bound_many(targets), lower)
+            assert np.array_equal(index.upper_bound_many(targets),
+                                  np.searchsorted(arr, targets, side="right"))
+            assert index.search_many(targets).tolist() == expected
+            assert [index.search(int(t)) for t in targets] == expected
+            assert [index.lower_bound(int(t)) for t in targets] == lower.tolist()
+    
+    def test_float_keys_and_validation(self):
+        import numpy as np
+        from src.algorithms.searching import StaticSearchIndex
+        
+        index = StaticSearchIndex([0.5, 1.5, 1.5, 2.5])
+        assert index.search(1.5) == 1
+        assert index.upper_bound(1.5) == 3
+        assert index.lower_bound(float("inf")) == 4
+        assert 2.5 in index and 3.0 not in index
+        
+        with pytest.raises(ValueError):
+            StaticSearchIndex([3, 1, 2])
+        with pytest.raises(ValueError):
+            StaticSearchIndex([1.0, np.nan])
+        with pytest.raises(TypeError):
+            StaticSearchIndex(["a", "b"])
+    
+    def test_save_and_memory_mapped_load(self, tmp_path):
+        import numpy as np
+        from src.algorithms.searching import StaticSearchIndex
+        
+        arr = np.arange(0, 3000, 3, dtype=np.int32)
+        path = tmp_path / "index.bin"
+        StaticSearchIndex(arr).save(path)
+        
+        for mmap in (True, False):
+            loaded = StaticSearchIndex.load(path, mmap=mmap)
+            assert len(loaded) == len(arr)
+            assert loaded.dtype == np.int32
+            assert loaded.search(2997) == 999
+            assert loaded.search(1) == -1
+            assert loaded.search_many([0, 4, 300]).tolist() == [0, -1, 100]
+        
+        bad = tmp_path / "bad.bin"
+        bad.write_bytes(b"\0" * 128)
+        with pytest.raises(ValueError):
+            StaticSearchIndex.load(bad)
+
+
+class TestLookupIndex:
+    """哈希查找索引测试"""
+    
+    def test_matches_linear_search(self):
+        from src.algorithms.searching import LookupIndex
+        
+        arr = [5, 3, 8, 3, 1, 8, 9]
+        index = LookupIndex(arr)
+        for target in [5, 3, 8, 1, 9, 2, 100]:
+            assert index.index_of(target) == linear_search(arr, target)
+        assert index.search_many([8, 2, 9]) == [2, -1, 6]
+        assert 1 in index and 4 not in index
+        assert len(index) == 7 and index.distinct_count == 5
+        assert index.index_of([1]) == -1
+        assert LookupIndex([]).index_of(1) == -1
+    
+    def test_key(self):
+        from src.algorithms.searching import LookupIndex
+        
+        words = ["Apple", "banana", "APPLE", "Cherry"]
+        index = LookupIndex(words, key=str.lower)
+        assert index.index_of("apple") == 0
+        assert index.index_of("CHERRY") == 3
+        assert index.index_of("durian") == -1
+
+
+class TestJumpSearch:
+    """跳跃搜索测试"""
+    
+    def test_jump_search_lists(self):
+        from src.algorithms.searching import jump_search
+        
+        assert jump_search([], 5) == -1
+        assert jump_search([5], 5) == 0
+        assert jump_search([5], 6) == -1
+        arr = [1, 2, 2, 2, 3, 5, 5, 8, 13, 21, 21, 34]
+        for target in set(arr):
+            assert jump_search(arr, target) == arr.index(target)
+        for target in (0, 4, 40):
+            assert jump_search(arr, target) == -1
+    
+    def test_blocked_jump_search_matches_searchsorted(self):
+        import numpy as np
+        from src.algorithms.searching import blocked_jump_search, jump_search
+        
+        rng = np.random.default_rng(0)
+        for n in [1, 7, 8, 9, 1000, 100003]:
+            arr = np.sort(rng.integers(0, n, size=n))
+            targets = rng.integers(-1, n + 1, size=200)
+            lower = np.searchsorted(arr, targets)
+            expected = [int(lo) if lo < n and arr[lo] == t else -1
+                        for lo, t in zip(lower, targets)]
+            for block_size in (None, 1, 3, 16):
+                assert [blocked_jump_search(arr, t, block_size) for t in targets] == expected
+            assert [jump_search(arr, t) for t in targets] == expected
+        
+        assert blocked_jump_search(np.array([], dtype=np.int64), 1) == -1
+        with pytest.raises(ValueError):
+            blocked_jump_search(np.arange(10), 3, block_size=0)
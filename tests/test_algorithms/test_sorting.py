@@ -40,3 +40,423 @@ class TestSortingAlgorithms:
         assert quick_sort(arr) == [1, 2, 3, 4, 5]
         assert merge_sort(arr) == [1, 2, 3, 4, 5]
         assert bubble_sort(arr) == [1, 2, 3, 4, 5]
+
+
+class TestIntrosort:
+    
+    def test_random_matches_sorted(self):
+        import random
+        rng = random.Random(0)
+        arr = [rng.randint(0, 50) for _ in range(2000)]
+        assert quick_sort(arr) == sorted(arr)
+    
+    def test_does_not_modify_input(self):
+        arr = [3, 1, 2]
+        quick_sort(arr)
+        assert arr == [3, 1, 2]
+    
+    def test_adversarial_inputs(self):
+        n = 5000
+        for arr in (list(range(n)), list(range(n, 0, -1)), [7] * n,
+                    [i % 2 for i in range(n)]):
+            assert quick_sort(arr) == sorted(arr)
+    
+    def test_key_called_once_per_element(self):
+        calls = []
+        
+        def key(x):
+            calls.append(x)
+            return -x
+        
+        arr = list(range(100))
+        assert quick_sort(arr, key=key) == list(range(99, -1, -1))
+        assert len(calls) == len(arr)
+    
+    def test_heapsort_fallback(self):
+        from src.algorithms.sorting import introsort
+        from src.algorithms.sorting.introsort import _heapsort_range
+        keys = [5, 3, 9, 1, 7, 2, 8]
+        items = [str(k) for k in keys]
+        _heapsort_range(keys, items, 0, len(keys))
+        assert keys == sorted(keys)
+        assert items == [str(k) for k in keys]
+        keys = [4, 1, 3]
+        introsort(keys)
+        assert keys == [1, 3, 4]
+
+
+class TestNaturalMergeSort:
+    
+    def test_random_matches_sorted(self):
+        import random
+        rng = random.Random(1)
+        for n in (0, 1, 2, 63, 64, 65, 1000, 5000):
+            arr = [rng.randint(0, 100) for _ in range(n)]
+            assert merge_sort(arr) == sorted(arr)
+            assert merge_sort(arr, adaptive=False) == sorted(arr)
+    
+    def test_stable_with_key(self):
+        import random
+        rng = random.Random(2)
+        arr = [(rng.randint(0, 20), i) for i in range(3000)]
+        assert merge_sort(arr, key=lambda x: x[0]) == sorted(arr, key=lambda x: x[0])
+    
+    def test_sorted_batches(self):
+        import random
+        rng = random.Random(3)
+        arr = []
+        for _ in range(8):
+            batch = sorted(rng.random() for _ in range(2000))
+            arr.extend(batch if rng.random() < 0.5 else batch[::-1])
+        assert merge_sort(arr) == sorted(arr)
+    
+    def test_presorted_input_is_near_linear(self):
+        comparisons = [0]
+        
+        class Counted:
+            def __init__(self, v):
+                self.v = v
+            
+            def __lt__(self, other):
+                comparisons[0] += 1
+                return self.v < other.v
+        
+        n = 4096
+        arr = [Counted(v) for v in list(range(n // 2)) + list(range(n // 2))]
+        result = merge_sort(arr)
+        assert [x.v for x in result] == sorted(x.v for x in arr)
+        # 经典归并需要约 n*log2(n) ≈ 49000 次比较
+        assert comparisons[0] < 3 * n
+
+
+class TestKeyCaching:
+    
+    def test_sorts_call_key_once_per_element(self):
+        from src.algorithms.keys import CountingKey
+        import random
+        rng = random.Random(4)
+        arr = [str(rng.randint(0, 1000)) for _ in range(300)]
+        expected = sorted(arr, key=int)
+        for sort_func, kwargs in ((quick_sort, {}), (merge_sort, {}),
+                                  (merge_sort, {"adaptive": False}), (bubble_sort, {})):
+            counted = CountingKey(int)
+            result = sort_func(arr, key=counted, **kwargs)
+            assert [int(x) for x in result] == [int(x) for x in expected]
+            assert counted.calls == len(arr)
+    
+    def test_classic_merge_sort_is_stable(self):
+        arr = [(1, "a"), (0, "b"), (1, "c"), (0, "d")]
+        result = merge_sort(arr, key=lambda x: x[0], adaptive=False)
+        assert result == [(0, "b"), (0, "d"), (1, "a"), (1, "c")]
+
+
+class TestVectorizedSort:
+    
+    def test_ndarray_and_array_inputs(self):
+        import array
+        import numpy as np
+        from src.algorithms.sorting import vectorized_sort
+        data = np.array([5, 3, 9, 1], dtype=np.int32)
+        result = vectorized_sort(data)
+        assert isinstance(result, np.ndarray)
+        assert result.dtype == np.int32
+        assert result.tolist() == [1, 3, 5, 9]
+        arr = array.array("d", [2.5, -1.0, 0.5])
+        assert vectorized_sort(arr, reverse=True) == array.array("d", [2.5, 0.5, -1.0])
+        assert vectorized_sort([3, 1, 2]) == [1, 2, 3]
+        assert vectorized_sort([]) == []
+    
+    def test_stable_argsort_reverse(self):
+        from src.algorithms.sorting import vectorized_sort
+        data = [1, 3, 1, 3, 2]
+        assert vectorized_sort(data, argsort=True) == [0, 2, 4, 1, 3]
+        assert vectorized_sort(data, reverse=True, argsort=True) == [1, 3, 4, 0, 2]
+    
+    def test_rejects_non_numeric(self):
+        from src.algorithms.sorting import as_numeric_array, vectorized_sort
+        assert as_numeric_array(["a", "b"]) is None
+        with pytest.raises(TypeError):
+            vectorized_sort(["b", "a"])
+    
+    def test_mixed_lists_keep_original_elements(self):
+        # 混合 int / float / bool 的列表不能被提升为 float64
+        from src.algorithms.sorting import as_numeric_array, sort
+        assert as_numeric_array([2**53 + 1, 1.0]) is None
+        assert as_numeric_array([True, 2, 0]) is None
+        assert as_numeric_array([2**64, 1]) is None
+        assert sort([2**53 + 1, 1.0]) == [1.0, 2**53 + 1]
+        assert sort([2**60 + 1, 0.5, 2**60]) == [0.5, 2**60, 2**60 + 1]
+        result = sort([True, 2, 0])
+        assert result == [0, True, 2] and result[1] is True
+        assert as_numeric_array([3, 1, 2]).dtype.kind == "i"
+        assert as_numeric_array([True, False]).dtype.kind == "b"
+
+
+class TestLinearTimeSorts:
+    
+    def test_counting_and_radix_match_numpy(self):
+        import numpy as np
+        from src.algorithms.sorting import counting_sort, radix_sort
+        rng = np.random.default_rng(5)
+        for data in (rng.integers(0, 10000, size=5000),
+                     rng.integers(-2**40, 2**40, size=5000),
+                     rng.normal(size=5000)):
+            assert np.array_equal(radix_sort(data), np.sort(data))
+            assert np.array_equal(radix_sort(data, reverse=True), np.sort(data)[::-1])
+            if data.dtype.kind == "i":
+                assert np.array_equal(counting_sort(data), np.sort(data))
+    
+    def test_argsort_is_stable(self):
+        import numpy as np
+        from src.algorithms.sorting import counting_argsort, radix_argsort
+        rng = np.random.default_rng(6)
+        keys = rng.integers(-50, 50, size=3000)
+        expected = np.argsort(keys, kind="stable")
+        assert np.array_equal(counting_argsort(keys), expected)
+        assert np.array_equal(radix_argsort(keys), expected)
+        assert np.array_equal(radix_argsort(keys * 2**35), expected)
+    
+    def test_key_extraction(self):
+        from src.algorithms.keys import CountingKey
+        from src.algorithms.sorting import counting_sort, radix_sort
+        records = [{"bucket": b, "id": i} for i, b in enumerate([3, 1, 2, 1, 3, 0])]
+        counted = CountingKey(lambda r: r["bucket"])
+        result = counting_sort(records, key=counted)
+        assert [r["id"] for r in result] == [5, 1, 3, 2, 0, 4]
+        assert counted.calls == len(records)
+        result = radix_sort(records, key=lambda r: r["bucket"], reverse=True)
+        assert [r["id"] for r in result] == [0, 4, 2, 1, 3, 5]
+    
+    def test_counting_sort_wide_small_int_range(self):
+        # int8 / int16 的值域跨度超过自身有符号范围时不能回绕
+        import array
+        import numpy as np
+        from src.algorithms.sorting import counting_sort, vectorized_sort
+        wide16 = np.array([-32768, 32767] * 40000, dtype=np.int16)
+        assert np.array_equal(vectorized_sort(wide16), np.sort(wide16))
+        assert np.array_equal(counting_sort(wide16), np.sort(wide16))
+        assert vectorized_sort(wide16).dtype == np.int16
+        wide8 = np.array([-128, 127, 0, -1] * 100, dtype=np.int8)
+        assert np.array_equal(counting_sort(wide8), np.sort(wide8))
+        packed = array.array("b", [-100, 100] * 200)
+        assert vectorized_sort(packed) == array.array("b", sorted(packed))
+    
+    def test_counting_sort_uint64_across_sign_bit(self):
+        # 窄值域的 uint64 跨越 2**63 时偏移不能变成负数
+        import numpy as np
+        from src.algorithms.sorting import counting_sort, vectorized_sort
+        data = np.array([2**63 + 1, 2**63 - 2, 2**63, 2**63 - 1] * 50, dtype=np.uint64)
+        assert np.array_equal(counting_sort(data), np.sort(data))
+        assert np.array_equal(vectorized_sort(data), np.sort(data))
+        assert vectorized_sort(data).dtype == np.uint64
+    
+    def test_counting_sort_rejects_floats(self):
+        from src.algorithms.sorting import counting_sort
+        with pytest.raises(TypeError):
+            counting_sort([1.5, 0.5])
+    
+    def test_vectorized_sort_small_range_uses_counting(self):
+        import numpy as np
+        from src.algorithms.sorting import vectorized_sort
+        data = np.random.default_rng(7).integers(0, 100, size=10000)
+        assert np.array_equal(vectorized_sort(data), np.sort(data))
+        assert np.array_equal(vectorized_sort(data, argsort=True),
+                              np.argsort(data, kind="stable"))
+        assert np.array_equal(vectorized_sort(data, reverse=True, argsort=True),
+                              (len(data) - 1) - np.argsort(data[::-1], kind="stable")[::-1])
+
+
+class TestParallelSort:
+    
+    def test_matches_numpy(self):
+        import numpy as np
+        from src.algorithms.sorting import parallel_sort
+        from src.algorithms.sorting.parallel import PARALLEL_MIN_SIZE
+        rng = np.random.default_rng(8)
+        for data in (rng.normal(size=PARALLEL_MIN_SIZE + 7),
+                     rng.integers(0, 3, size=PARALLEL_MIN_SIZE)):
+            assert np.array_equal(parallel_sort(data, workers=3), np.sort(data))
+        data = rng.normal(size=PARALLEL_MIN_SIZE)
+        assert np.array_equal(parallel_sort(data, workers=2, reverse=True), np.sort(data)[::-1])
+    
+    def test_small_input_and_lists(self):
+        from src.algorithms.sorting import parallel_sort
+        assert parallel_sort([3, 1, 2], workers=4) == [1, 2, 3]
+
+
+class TestExternalSort:
+    
+    def test_binary_many_runs(self, tmp_path):
+        import numpy as np
+        from src.algorithms.sorting import external_sort
+        data = np.random.default_rng(9).normal(size=20000)
+        src, dst = tmp_path / "in.bin", tmp_path / "out.bin"
+        data.tofile(src)
+        # 8KB 内存上限 => 每个 run 512 个元素，约 40 个 run
+        assert external_sort(src, dst, dtype="float64", memory_limit=8192) == len(data)
+        assert np.array_equal(np.fromfile(dst, dtype="float64"), np.sort(data))
+    
+    def test_csv_input(self, tmp_path):
+        import numpy as np
+        from src.algorithms.sorting import external_sort
+        data = np.random.default_rng(10).integers(-1000, 1000, size=3000)
+        src, dst = tmp_path / "in.csv", tmp_path / "out.csv"
+        with open(src, "w") as f:
+            for row in data.reshape(-1, 3):
+                f.write(",".join(str(v) for v in row) + "\n")
+        external_sort(src, dst, dtype="int64", input_format="csv", memory_limit=4096)
+        assert np.array_equal(np.loadtxt(dst, dtype="int64"), np.sort(data))
+    
+    def test_csv_wide_rows_bounded_chunks(self, tmp_path):
+        # 每行很多个数值时，块大小仍按元素个数受限，而不是按行数
+        import numpy as np
+        from src.algorithms.sorting import external_sort
+        from src.algorithms.sorting.external import _read_chunks
+        data = np.random.default_rng(11).normal(size=5000)
+        src, dst = tmp_path / "in.csv", tmp_path / "out.csv"
+        with open(src, "w") as f:
+            for row in data.reshape(-1, 250):
+                f.write(", ".join(repr(v) for v in row.tolist()) + "\n")
+        chunks = [len(chunk) for chunk in _read_chunks(src, np.dtype("float64"), "csv", 256)]
+        assert max(chunks) <= 256 and sum(chunks) == len(data)
+        external_sort(src, dst, dtype="float64", input_format="csv", memory_limit=4096)
+        assert np.array_equal(np.loadtxt(dst), np.sort(data))
+        
+        src.write_text("1,2\n3,oops\n")
+        with pytest.raises(ValueError):
+            external_sort(src, dst, dtype="float64", input_format="csv")
+    
+    def test_csv_separator_only_chunks(self, tmp_path):
+        # 块边界或空行只剩分隔符时不能解析出多余的 0
+        import numpy as np
+        from src.algorithms.sorting import external_sort
+        from src.algorithms.sorting.external import _parse_csv_values
+        for text in (" ", ",", "\n\n", " ,\t\r\n"):
+            assert len(_parse_csv_values(text, np.dtype("int64"))) == 0
+        src, dst = tmp_path / "in.csv", tmp_path / "out.csv"
+        src.write_text("3,1,2\n5, 4\n 9\n\n\n7\n")
+        for memory_limit in (16, 32, 4096):
+            assert external_sort(src, dst, dtype="int64", input_format="csv",
+                                 memory_limit=memory_limit) == 7
+            assert np.loadtxt(dst, dtype="int64").tolist() == [1, 2, 3, 4, 5, 7, 9]
+    
+    def test_empty_input(self, tmp_path):
+        from src.algorithms.sorting import external_sort
+        src, dst = tmp_path / "in.bin", tmp_path / "out.bin"
+        src.write_bytes(b"")
+        assert external_sort(src, dst) == 0
+        assert dst.read_bytes() == b""
+
+
+class TestSelection:
+    
+    def test_nth_element(self):
+        import random
+        import numpy as np
+        from src.algorithms.sorting import nth_element
+        rng = random.Random(11)
+        arr = [rng.randint(0, 500) for _ in range(1000)]
+        expected = sorted(arr)
+        for k in (0, 1, 499, 998, 999, -1):
+            assert nth_element(arr, k) == expected[k]
+        assert nth_element(np.array(arr), 10) == expected[10]
+        assert nth_element(arr, 3, key=lambda x: -x) == sorted(arr, reverse=True)[3]
+        with pytest.raises(IndexError):
+            nth_element(arr, 1000)
+    
+    def test_partial_sort_and_top_k(self):
+        import random
+        import numpy as np
+        from src.algorithms.sorting import partial_sort, top_k, top_k_indices
+        rng = random.Random(12)
+        arr = [rng.random() for _ in range(1000)]
+        assert partial_sort(arr, 10) == sorted(arr)[:10]
+        assert top_k(arr, 10) == sorted(arr, reverse=True)[:10]
+        assert top_k(arr, 5000) == sorted(arr, reverse=True)
+        assert top_k(arr, 0) == []
+        data = np.array(arr)
+        assert np.array_equal(top_k(data, 10), np.sort(data)[::-1][:10])
+        assert np.array_equal(partial_sort(data, 10), np.sort(data)[:10])
+        assert np.array_equal(data[top_k_indices(data, 10)], np.sort(data)[::-1][:10])
+    
+    def test_top_k_with_key(self):
+        from src.algorithms.sorting import top_k
+        words = ["pear", "fig", "banana", "kiwi", "apple"]
+        assert top_k(words, 2, key=len) == ["banana", "apple"]
+        assert top_k(words, 2, key=len, largest=False) == ["fig", "pear"]
+
+
+class TestMergeSorted:
+    
+    def test_lazy_heap_merge(self):
+        from src.algorithms.sorting import merge_sorted
+        
+        def shard(values, consumed):
+            for v in values:
+                consumed.append(v)
+                yield v
+        
+        consumed = []
+        merged = merge_sorted(shard([1, 4, 7], consumed), shard([2, 5, 8], consumed),
+                              shard([3, 6, 9], consumed))
+        assert [next(merged) for _ in range(3)] == [1, 2, 3]
+        # 只读取了产出所需的元素以及每路一个候选
+        assert len(consumed) <= 6
+        assert list(merged) == [4, 5, 6, 7, 8, 9]
+    
+    def test_key_reverse_and_stability(self):
+        from src.algorithms.sorting import merge_sorted
+        a = [("x", 3), ("y", 1)]
+        b = [("z", 3), ("w", 2)]
+        assert list(merge_sorted(a, b, key=lambda p: p[1], reverse=True)) == [
+            ("x", 3), ("z", 3), ("w", 2), ("y", 1)
+        ]
+    
+    def test_batches(self):
+        import numpy as np
+        from src.algorithms.sorting import merge_sorted_batches
+        rng = np.random.default_rng(13)
+        shards = [np.sort(rng.integers(0, 1000, size=n)) for n in (500, 0, 1200, 77)]
+        
+        def chunks(arr, size):
+            return (arr[i:i + size] for i in range(0, len(arr), size))
+        
+        streams = [chunks(s, 64) for s in shards]
+        merged = np.concatenate(list(merge_sorted_batches(*streams)))
+        assert np.array_equal(merged, np.sort(np.concatenate(shards)))
+        
+        streams = [chunks(s[::-1], 50) for s in shards]
+        merged = np.concatenate(list(merge_sorted_batches(*streams, reverse=True)))
+        assert np.array_equal(merged, np.sort(np.concatenate(shards))[::-1])
+
+
+class TestAutoSort:
+    
+    def test_engine_choice(self):
+        import numpy as np
+        from src.algorithms.sorting import choose_engine, profile_input
+        rng = np.random.default_rng(14)
+        assert choose_engine(profile_input(rng.integers(0, 10, size=1000)))[0] == "counting_sort"
+        assert choose_engine(profile_input(rng.normal(size=1000)))[0] == "vectorized_sort"
+        words = [str(i) for i in range(1000)]
+        assert choose_engine(profile_input(sorted(words)))[0] == "merge_sort"
+        assert choose_engine(profile_input(words, key=len))[0] == "merge_sort"
+        rng_py = __import__("random").Random(15)
+        rng_py.shuffle(words)
+        assert choose_engine(profile_input(words))[0] == "quick_sort"
+        # 只有极少数不同取值的对象列表走自然归并
+        flags = [rng_py.choice(["yes", "no"]) for _ in range(5000)]
+        engine, reason = choose_engine(profile_input(flags))
+        assert engine == "merge_sort" and "重复" in reason
+    
+    def test_sort_matches_sorted(self):
+        from src.algorithms.sorting import sort
+        records = [("b", 2), ("a", 1), ("c", 2), ("d", 0)]
+        assert sort(records, key=lambda r: r[1]) == sorted(records, key=lambda r: r[1])
+        assert sort(records, key=lambda r: r[1], reverse=True) == sorted(
+            records, key=lambda r: r[1], reverse=True
+        )
+        assert sort([3.5, 1.5, 2.5]) == [1.5, 2.5, 3.5]
+        assert sort([3, 1, 2], algorithm="bubble_sort", reverse=True) == [3, 2, 1]
+        with pytest.raises(ValueError):
+            sort([1], algorithm="unknown")
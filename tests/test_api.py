@@ -62,6 +62,28 @@ def test_sort_reverse():
     assert data["sorted_data"] == [9, 8, 5, 2, 1]
 
 
+def test_sort_auto_default():
+    """测试默认自动选择排序引擎"""
+    response = client.post(
+        "/api/v1/algorithms/sort",
+        json={"data": [5.5, 2.0, 8.25, 1.0, 9.0], "reverse": True},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["sorted_data"] == [9.0, 8.25, 5.5, 2.0, 1.0]
+    assert data["algorithm"] == "auto"
+    assert data["engine"] == "vectorized_sort"
+
+
+def test_sort_bubble_sort_too_large():
+    """测试冒泡排序拒绝大数组"""
+    response = client.post(
+        "/api/v1/algorithms/sort",
+        json={"data": list(range(6000)), "algorithm": "bubble_sort"},
+    )
+    assert response.status_code == 400
+
+
 def test_sort_invalid_algorithm():
     """测试无效排序算法"""
     response = client.post(
@@ -105,6 +127,43 @@ def test_search_not_found():
     assert data["index"] == -1
 
 
+def test_linear_search_repeated_dataset():
+    """测试同一数据集重复线性搜索时使用缓存索引"""
+    from src.api.routes import algorithms as routes
+
+    data = [7.0, 3.0, 7.0, 11.0, 4.0]
+    expected = {7: 0, 11: 3, 4: 4, 5: -1}
+    for target, index in expected.items():
+        response = client.post(
+            "/api/v1/algorithms/search",
+            json={"data": data, "target": target, "algorithm": "linear_search"},
+        )
+        assert response.status_code == 200
+        assert response.json()["index"] == index
+    assert tuple(data) in routes._lookup_cache
+
+
+def test_linear_search_cache_size_bounds(monkeypatch):
+    """测试超大数据集不进入缓存，缓存按元素总数淘汰"""
+    from src.api.routes import algorithms as routes
+
+    monkeypatch.setattr(routes, "LOOKUP_CACHE_MAX_DATASET", 10)
+    monkeypatch.setattr(routes, "LOOKUP_CACHE_MAX_ELEMENTS", 16)
+    big = [float(i) for i in range(11)]
+    for _ in range(3):
+        assert routes.cached_linear_search(big, 10.0) == 10
+    assert tuple(big) not in routes._lookup_cache
+
+    datasets = [[float(i), float(i + 100), float(i + 200), 1.5, 2.5, 3.5] for i in range(5)]
+    for data in datasets:
+        for _ in range(2):
+            assert routes.cached_linear_search(data, 1.5) == 3
+    assert routes._lookup_cache_elements <= 16
+    assert routes._lookup_cache_elements == sum(len(key) for key in routes._lookup_cache)
+    assert tuple(datasets[-1]) in routes._lookup_cache
+    assert tuple(datasets[0]) not in routes._lookup_cache
+
+
 def test_train_linear_regression():
     """测试训练线性回归模型"""
     response = client.post(
@@ -189,6 +248,7 @@ def test_list_sort_algorithms():
     assert response.status_code == 200
     data = response.json()
     assert "algorithms" in data
+    assert "auto" in data["algorithms"]
     assert "quick_sort" in data["algorithms"]
     assert "bubble_sort" in data["algorithms"]
 
@@ -0,0 +1,44 @@
+"""
+布隆过滤器测试
+"""
+
+import pytest
+from src.data_structures import BloomFilter
+
+
+class TestBloomFilter:
+    
+    def test_no_false_negatives(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        items = [f"item-{i}" for i in range(1000)]
+        bloom.update(items)
+        assert all(item in bloom for item in items)
+        assert len(bloom) <= 1000
+    
+    def test_false_positive_rate(self):
+        bloom = BloomFilter(capacity=2000, error_rate=0.01)
+        bloom.update(range(2000))
+        false_positives = sum(1 for i in range(10000, 20000) if i in bloom)
+        assert false_positives / 10000 < 0.03
+    
+    def test_add_reports_presence(self):
+        bloom = BloomFilter(capacity=10)
+        assert bloom.add((1.0, 2.0)) is False
+        assert bloom.add((1.0, 2.0)) is True
+        assert len(bloom) == 1
+    
+    def test_clear_and_full(self):
+        # 整数的 hash() 不受 PYTHONHASHSEED 影响，1 和 2 的位置不会完全重合；
+        # 字符串在少数随机种子下可能映射到相同的位，使 count 停在 1
+        bloom = BloomFilter(capacity=2)
+        bloom.update([1, 2])
+        assert bloom.is_full()
+        bloom.clear()
+        assert 1 not in bloom
+        assert len(bloom) == 0
+    
+    def test_invalid_parameters(self):
+        with pytest.raises(ValueError):
+            BloomFilter(capacity=0)
+        with pytest.raises(ValueError):
+            BloomFilter(capacity=10, error_rate=1.5)
@@ -0,0 +1,49 @@
+"""
+并查集测试
+"""
+
+import numpy as np
+import pytest
+from src.data_structures import DisjointSet
+
+
+class TestDisjointSet:
+    
+    def test_union_find(self):
+        sets = DisjointSet(6)
+        assert sets.union(0, 1) is True
+        assert sets.union(1, 2) is True
+        assert sets.union(0, 2) is False
+        assert sets.union(4, 5) is True
+        assert sets.connected(0, 2) and not sets.connected(2, 3)
+        assert sets.num_sets == 3 and len(sets) == 6
+        assert sets.labels().tolist() == [0, 0, 0, 1, 2, 2]
+        with pytest.raises(IndexError):
+            sets.find(6)
+        with pytest.raises(ValueError):
+            DisjointSet(-1)
+    
+    def test_union_many_matches_union(self):
+        rng = np.random.default_rng(0)
+        xs = rng.integers(0, 500, size=400)
+        ys = rng.integers(0, 500, size=400)
+        expected = DisjointSet(500)
+        merged = [expected.union(x, y) for x, y in zip(xs.tolist(), ys.tolist())]
+        sets = DisjointSet(500)
+        assert sets.union_many(xs, ys).tolist() == merged
+        assert sets.num_sets == expected.num_sets
+        assert sets.labels().tolist() == expected.labels().tolist()
+        # roots 与逐个 find 的结果一致，且不修改内部结构
+        assert sets.roots().tolist() == [sets.find(x) for x in range(500)]
+        assert sets.union_many([], []).tolist() == []
+        with pytest.raises(IndexError):
+            sets.union_many([0], [500])
+    
+    def test_rank_bounds_height(self):
+        sets = DisjointSet(1 << 12)
+        step = 1
+        while step < len(sets):
+            sets.union_many(np.arange(0, len(sets), 2 * step), np.arange(step, len(sets), 2 * step))
+            step *= 2
+        assert sets.num_sets == 1
+        assert max(sets.rank) <= 12
@@ -0,0 +1,72 @@
+"""
+索引堆测试
+"""
+
+import heapq
+import random
+
+import pytest
+from src.data_structures import IndexedHeap
+
+
+class TestIndexedHeap:
+    
+    @pytest.mark.parametrize("arity", [2, 4, 7])
+    def test_random_operations_match_heapq(self, arity):
+        rng = random.Random(arity)
+        heap = IndexedHeap(200, arity=arity)
+        current = {}
+        for _ in range(2000):
+            item = rng.randrange(200)
+            priority = rng.random()
+            if rng.random() < 0.6:
+                heap.push_or_decrease(item, priority)
+                current[item] = min(priority, current.get(item, priority))
+            elif current:
+                item, priority = heap.pop()
+                assert priority == min(current.values())
+                assert current.pop(item) == priority
+            assert len(heap) == len(current)
+        popped = [heap.pop()[1] for _ in range(len(heap))]
+        assert popped == sorted(current.values())
+    
+    def test_decrease_key_and_shared_keys(self):
+        dist = [float("inf")] * 4
+        heap = IndexedHeap(4, keys=dist)
+        heap.push(0, 5.0)
+        heap.push(1, 3.0)
+        heap.decrease_key(0, 1.0)
+        assert dist[0] == 1.0 and heap.priority(0) == 1.0
+        assert heap.peek() == (0, 1.0)
+        assert heap.push_or_decrease(1, 4.0) is False
+        assert heap.pop() == (0, 1.0)
+        assert 0 not in heap and 1 in heap
+        # 出堆后优先级仍保留在 keys 中
+        assert dist[0] == 1.0
+    
+    def test_heap_size_bounded(self):
+        heap = IndexedHeap(10)
+        updates = [(i % 10, 100.0 - i) for i in range(100)]
+        for item, priority in updates:
+            heap.push_or_decrease(item, priority)
+        assert len(heap) == 10
+        expected = heapq.nsmallest(10, {item: p for item, p in updates}.values())
+        assert [heap.pop()[1] for _ in range(10)] == expected
+    
+    def test_errors(self):
+        heap = IndexedHeap(3)
+        with pytest.raises(IndexError):
+            heap.pop()
+        heap.push(1, 2.0)
+        with pytest.raises(ValueError):
+            heap.push(1, 1.0)
+        with pytest.raises(ValueError):
+            heap.decrease_key(1, 3.0)
+        with pytest.raises(KeyError):
+            heap.decrease_key(2, 1.0)
+        with pytest.raises(IndexError):
+            heap.push(3, 1.0)
+        heap.clear()
+        assert len(heap) == 0 and 1 not in heap
+        with pytest.raises(ValueError):
+            IndexedHeap(3, arity=1)